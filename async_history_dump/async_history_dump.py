@@ -3,11 +3,22 @@ from __future__ import annotations
 
 import os
 import asyncio
-from typing import Iterable, Optional, Tuple, Dict
+import weakref
+from typing import Iterable, Optional, Tuple, Dict, List, Any, Set
 from collections import defaultdict
 from .writers import JSONWriter, TXTWriter, CSVWriter, WriterType
 from .types import OutputData 
 
+_EXT_TO_FILETYPE = {".json": "json", ".csv": "csv", ".txt": "txt"}
+
+# Parent directories already created by _normalize_path in this process
+_ensured_dirs: Set[str] = set()
+
+# (path, filetype, key, mode, strict_keys)
+_GroupKey = Tuple[str, str, Optional[Tuple[str, ...]], str, bool]
+# A caller's batch and the future resolved once it is written
+_PendingEntry = Tuple[List["AsyncHistoryDump"], "asyncio.Future[None]"]
+
 
 class AsyncHistoryDump:
     """
@@ -23,6 +34,14 @@ class AsyncHistoryDump:
         "csv": CSVWriter(),
     }
 
+    # Per-path write locks (with reference counts) and, per event loop since
+    # their futures belong to one, batches waiting to be coalesced into the
+    # next write of their group.
+    _path_locks: Dict[str, List[Any]] = {}
+    _pending: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[_GroupKey, List[_PendingEntry]]]" = (
+        weakref.WeakKeyDictionary()
+    )
+
     def __init__(
         self,
         path: str,
@@ -35,18 +54,32 @@ class AsyncHistoryDump:
     ) -> None:
         self.path = self._normalize_path(path)
         self.mode = self._validate_mode(mode)
-        self.filetype = self._resolve_filetype(filetype)
+        self.filetype = filetype
         self.key = tuple(key) if key else None
         self.data = data
         self.strict_keys = strict_keys
+    @property
+    def filetype(self) -> str:
+        return self._filetype
+
+    @filetype.setter
+    def filetype(self, value: str) -> None:
+        self._filetype = self._resolve_filetype(value)
+        # Bind the writer now so writes don't look it up by filetype
+        self._writer: WriterType = self._writers[self._filetype]
+
     # -------------------------------------------------------------------------
     # Helpers
     # -------------------------------------------------------------------------
 
     @staticmethod
     def _normalize_path(path: str) -> str:
-        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-        return os.path.abspath(path)
+        path = os.path.abspath(path)
+        directory = os.path.dirname(path)
+        if directory not in _ensured_dirs:
+            os.makedirs(directory, exist_ok=True)
+            _ensured_dirs.add(directory)
+        return path
 
     @staticmethod
     def _validate_mode(mode: str) -> str:
@@ -60,14 +93,10 @@ class AsyncHistoryDump:
                 raise ValueError(f"Invalid filetype: {filetype}")
             return filetype
 
-        if self.path.endswith(".json"):
-            return "json"
-        if self.path.endswith(".csv"):
-            return "csv"
-        if self.path.endswith(".txt"):
-            return "txt"
-
-        raise ValueError("Cannot autodetect filetype from path.")
+        filetype = _EXT_TO_FILETYPE.get(os.path.splitext(self.path)[1].lower())
+        if filetype is None:
+            raise ValueError("Cannot autodetect filetype from path.")
+        return filetype
 
     # -------------------------------------------------------------------------
     # Public API
@@ -77,16 +106,9 @@ class AsyncHistoryDump:
         if self.data is None:
             raise ValueError("No data to write")
 
-        writer = self._writers[self.filetype]
-
-        # Just call write_single() cleanly
-        await writer.write_single(
-            path=self.path,
-            data=self.data,
-            mode=self.mode,
-            key=self.key,
-            strict_keys = self.strict_keys
-        )
+        # Route through the coalescing path so concurrent writes to the
+        # same file share one read-modify-write cycle.
+        await self.write_many((self,))
 
     # -------------------------------------------------------------------------
 
@@ -94,29 +116,93 @@ class AsyncHistoryDump:
     async def write_many(cls, dumps: Iterable["AsyncHistoryDump"]) -> None:
         groups = defaultdict(list)
 
-        # Group dumps by file (path, type, key)
+        # Group dumps by file (path, type, key) and merge semantics
         for d in dumps:
             if not isinstance(d, cls):
                 raise TypeError(f"Expected AsyncHistoryDump, got {type(d).__name__}")
-            groups[(d.path, d.filetype, tuple(d.key) if d.key else None)].append(d)
+            groups[(d.path, d.filetype, tuple(d.key) if d.key else None, d.mode, d.strict_keys)].append(d)
 
-        tasks = []
+        await asyncio.gather(*(cls._write_group(group, batch) for group, batch in groups.items()))
 
-        # Process each group with the appropriate writer
-        for (path, filetype, key), batch in groups.items():
-            writer = cls._writers[filetype]
+    @classmethod
+    async def _write_group(cls, group: _GroupKey, batch: List["AsyncHistoryDump"]) -> None:
+        """
+        Queue a batch for its file and write it under the per-path lock.
+
+        Batches queued by concurrent callers for the same group are drained
+        together, so one read-modify-write cycle serves all of them.
+        """
+        path, _, key, mode, strict_keys = group
+        loop = asyncio.get_running_loop()
+        pending = cls._pending.get(loop)
+        if pending is None:
+            pending = cls._pending[loop] = defaultdict(list)
+        done = loop.create_future()
+        entry = (batch, done)
+        pending[group].append(entry)
+
+        lock = cls._acquire_path_lock(path)
+        try:
+            # Yield once so writers scheduled in the same loop tick can join.
+            await asyncio.sleep(0)
+            async with lock:
+                entries = pending.pop(group, None)
+                if entries:
+                    try:
+                        await batch[0]._writer.write_batch(
+                            path=path,
+                            data_list=[d.data for b, _ in entries for d in b],
+                            mode=mode,
+                            key=key,
+                            strict_keys=strict_keys,
+                        )
+                    except Exception as e:
+                        for _, fut in entries:
+                            fut.set_exception(e)
+                    else:
+                        for _, fut in entries:
+                            fut.set_result(None)
+        except BaseException:
+            # Cancelled (or failed) before another writer took our batch:
+            # withdraw it so a later write to the file does not pick it up
+            cls._withdraw(pending, group, entry)
+            raise
+        finally:
+            cls._release_path_lock(path)
+
+        await done
 
-            mode = batch[0].mode
-            data_list = [d.data for d in batch]
+    @staticmethod
+    def _withdraw(pending: Dict[_GroupKey, List[_PendingEntry]], group: _GroupKey, entry: _PendingEntry) -> None:
+        entries = pending.get(group)
+        if entries is None:
+            return
+        for i, queued in enumerate(entries):
+            if queued is entry:
+                del entries[i]
+                break
+        if not entries:
+            del pending[group]
 
-            tasks.append(
-                writer.write_batch(
-                    path=path,
-                    data_list=data_list,
-                    mode=mode,
-                    key=key,
-                    strict_keys=batch[0].strict_keys
-                )
-            )
+    @classmethod
+    def _acquire_path_lock(cls, path: str) -> asyncio.Lock:
+        """
+        Return the lock for path and register the caller as a user of it.
+
+        Same-file writes serialize on it while different files proceed in
+        parallel. Locks are dropped once their last user releases them.
+        """
+        path = os.path.normcase(path)
+        entry = cls._path_locks.get(path)
+        if entry is None:
+            entry = cls._path_locks[path] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        return entry[0]
 
-        await asyncio.gather(*tasks)
+    @classmethod
+    def _release_path_lock(cls, path: str) -> None:
+        path = os.path.normcase(path)
+        entry = cls._path_locks[path]
+        entry[1] -= 1
+        if not entry[1]:
+            del cls._path_locks[path]
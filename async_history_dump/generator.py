@@ -1,11 +1,52 @@
 from __future__ import annotations
+import time
 from datetime import datetime
-from typing import Optional, Callable, Union, Iterable
+from typing import Any, Optional, Callable, Union, Iterable
 from .async_history_dump import AsyncHistoryDump, OutputData
 
 
+_DEFAULT_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
 def default_time_format_function(time_data: datetime) -> str:
-    return time_data.strftime("%Y-%m-%d %H:%M:%S")
+    return time_data.strftime(_DEFAULT_TIME_FORMAT)
+
+
+# --------------------------------------------------------------
+# Timestamp appliers, one per (log_as, data shape) pair
+# --------------------------------------------------------------
+
+def _ts_dict(data: dict, key: str, time_value: Any) -> dict:
+    data[key] = time_value
+    return data
+
+
+def _ts_list_append(data: list, key: str, time_value: Any) -> list:
+    return [*data, time_value]
+
+
+def _ts_tuple_append(data: tuple, key: str, time_value: Any) -> tuple:
+    return (*data, time_value)
+
+
+def _ts_list_keyed(data: list, key: str, time_value: Any) -> list:
+    return [*data, {key: time_value}]
+
+
+def _ts_tuple_keyed(data: tuple, key: str, time_value: Any) -> tuple:
+    return (*data, {key: time_value})
+
+
+def _ts_scalar_append(data: Any, key: str, time_value: Any) -> tuple:
+    return (data, time_value)
+
+
+def _ts_scalar_keyed(data: Any, key: str, time_value: Any) -> dict:
+    return {"data": data, key: time_value}
+
+
+_TS_APPEND = {dict: _ts_dict, list: _ts_list_append, tuple: _ts_tuple_append}
+_TS_KEYED = {dict: _ts_dict, list: _ts_list_keyed, tuple: _ts_tuple_keyed}
 
 
 class AsyncHistoryDumpGenerator:
@@ -20,8 +61,11 @@ class AsyncHistoryDumpGenerator:
         "mode",
         "key",
         "log_time",
-        "log_as",
-        "time_format_function",
+        "_log_as",
+        "_ts_table",
+        "_ts_default",
+        "_time_format_function",
+        "_fast_ts",
         "timestamp_key",
         "strict_keys",
     )
@@ -52,8 +96,19 @@ class AsyncHistoryDumpGenerator:
 
     # --------------------------------------------------------------
 
+    @property
+    def time_format_function(self) -> Optional[Callable]:
+        return self._time_format_function
+
+    @time_format_function.setter
+    def time_format_function(self, value: Optional[Callable]) -> None:
+        self._time_format_function = value
+        # The default format can be produced by time.strftime directly,
+        # without allocating a datetime per event.
+        self._fast_ts = value is default_time_format_function
+
     def _custom_or_default_time_format_function(self) -> str:
-        return "Default" if self.time_format_function is default_time_format_function else "Custom"
+        return "Default" if self._fast_ts else "Custom"
 
     def __repr__(self) -> str:
         return (
@@ -65,47 +120,62 @@ class AsyncHistoryDumpGenerator:
 
     # --------------------------------------------------------------
 
-    def _add_timestamp(self, data: Optional[OutputData] = None) -> OutputData:
+    @property
+    def log_as(self) -> str:
+        return self._log_as
+
+    @log_as.setter
+    def log_as(self, value: str) -> None:
+        # Pick the per-shape timestamp appliers once, not on every event
+        self._log_as = value
+        if value == "append":
+            self._ts_table, self._ts_default = _TS_APPEND, _ts_scalar_append
+        else:
+            self._ts_table, self._ts_default = _TS_KEYED, _ts_scalar_keyed
+
+    def _add_timestamp(self, data: Optional[OutputData] = None, at: Optional[float] = None) -> OutputData:
         """
         Add a timestamp to data using configured time_format_function.
+
+        `at` is the event time in seconds since the epoch (as from time.time());
+        the current time is used if it is None.
         """
-        if self.time_format_function is None:
+        if self._fast_ts:
+            if at is None:
+                time_value = time.strftime(_DEFAULT_TIME_FORMAT)
+            else:
+                time_value = time.strftime(_DEFAULT_TIME_FORMAT, time.localtime(at))
+        elif self.time_format_function is None:
             raise AttributeError("time_format_function is not set.")
-
-        time_value = self.time_format_function(datetime.now())
+        else:
+            time_value = self.time_format_function(datetime.now() if at is None else datetime.fromtimestamp(at))
 
         if data is None:
             data = {}
 
-        if isinstance(data, dict):
-            data[self.timestamp_key] = time_value
-
-        elif isinstance(data, (list, tuple)):
-            is_tuple = isinstance(data, tuple)
-            data = list(data)
-            if self.log_as == "append":
-                data.append(time_value)
+        apply = self._ts_table.get(type(data))
+        if apply is None:
+            # Subclasses of dict/list/tuple fall back to isinstance checks
+            if isinstance(data, dict):
+                apply = _ts_dict
+            elif isinstance(data, (list, tuple)):
+                apply = self._ts_table[tuple if isinstance(data, tuple) else list]
             else:
-                data.append({self.timestamp_key: time_value})
-            if is_tuple:
-                data = tuple(data)
+                apply = self._ts_default
 
-        else:
-            if self.log_as == "append":
-                data = (data, time_value)
-            else:
-                data = {"data": data, self.timestamp_key: time_value}
-
-        return data
+        return apply(data, self.timestamp_key, time_value)
 
     # --------------------------------------------------------------
 
-    def create(self, data: Optional[OutputData] = None) -> AsyncHistoryDump:
+    def create(self, data: Optional[OutputData] = None, *, at: Optional[float] = None) -> AsyncHistoryDump:
         """
         Produce a configured AsyncHistoryDump instance.
+
+        With log_time, the timestamp is `at` (seconds since the epoch) if
+        given, e.g. when the event is recorded some time after it happened.
         """
         if self.log_time:
-            data = self._add_timestamp(data)
+            data = self._add_timestamp(data, at)
 
         return AsyncHistoryDump(
             path=self.base_path,
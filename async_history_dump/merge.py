@@ -21,15 +21,18 @@ def force_list(obj: Any) -> List[Any]:
 
 
 def merge_flat(existing, new, mode: str):
-    """Flat merge for TXT/CSV; dict rows are allowed."""
-    existing_list = force_list(existing)
-    new_list = force_list(new)
+    """
+    Flat merge for TXT/CSV; dict rows are allowed.
 
+    An existing list is extended in place and returned rather than copied.
+    """
     if mode == "overwrite":
-        return new_list
+        return force_list(new)
 
     if mode in {"append", "extend", "update"}:
-        return existing_list + new_list
+        existing_list = force_list(existing)
+        existing_list.extend(force_list(new))
+        return existing_list
 
     raise ValueError(f"Unsupported mode '{mode}' for flat output.")
 
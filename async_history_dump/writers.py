@@ -4,11 +4,20 @@ from __future__ import annotations
 import os
 import json
 import csv
-import io
-import aiofiles
-from typing import Any, List, Tuple, Protocol, Union
+import asyncio
+import itertools
+import math
+import re
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterator, List, Tuple, Protocol, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from .merge import (
+    force_list,
     merge_flat,
     resolve_nested,
     apply_mode_json,
@@ -16,6 +25,125 @@ from .merge import (
 )
 
 
+def _read_text(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _peek_first_line(path: str) -> Tuple[str, bool]:
+    """Return (first line, whether the file is empty or ends with a newline)."""
+    with open(path, "rb") as f:
+        first = f.readline()
+        if not first:
+            return "", True
+        f.seek(-1, os.SEEK_END)
+        return first.decode("utf-8"), f.read(1) == b"\n"
+
+
+_tmp_counter = itertools.count()
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+@contextmanager
+def _atomic_open(path: str, mode: str = "wb", durable: bool = False, **open_kwargs) -> Iterator[IO]:
+    """
+    Open a temporary sibling of path for writing; on clean exit it atomically
+    replaces path.
+
+    Readers never observe a truncated or half-written file. With durable=True
+    the temporary file is synced to disk before the rename.
+    """
+    tmp = f"{path}.tmp.{os.getpid()}.{next(_tmp_counter)}"
+    try:
+        with open(tmp, mode, **open_kwargs) as f:
+            yield f
+            if durable:
+                f.flush()
+                _fdatasync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _atomic_write_bytes(path: str, data: bytes, durable: bool = False) -> None:
+    with _atomic_open(path, "wb", durable) as f:
+        f.write(data)
+
+
+def _write_text(path: str, text: str, durable: bool = False) -> None:
+    _atomic_write_bytes(path, text.encode("utf-8"), durable)
+
+
+def _append_text(path: str, text: str, durable: bool = False) -> None:
+    """
+    Append text to path with a single write, first ending an unterminated last line.
+    """
+    with open(path, "a+b") as f:
+        data = text.encode("utf-8")
+        if f.seek(0, os.SEEK_END):
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                data = b"\n" + data
+        f.write(data)
+        if durable:
+            f.flush()
+            _fdatasync(f.fileno())
+
+
+# orjson parses integers wider than 64 bits as floats; leave those to json
+_LONG_DIGIT_RUN = re.compile(rb"\d{20,}")
+
+
+def _loads_json(raw: bytes) -> Any:
+    if orjson is not None and not _LONG_DIGIT_RUN.search(raw):
+        try:
+            return orjson.loads(raw)
+        except ValueError:
+            # orjson rejects the NaN/Infinity tokens json writes; let json decide
+            pass
+    return json.loads(raw)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Whether obj holds a NaN or infinite float, which orjson would write as null."""
+    if type(obj) is float:
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(map(_has_non_finite, obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return any(map(_has_non_finite, obj))
+    return isinstance(obj, float) and not math.isfinite(obj)
+
+
+def _dumps_json(obj: Any, indent: bool = True) -> bytes:
+    """Serialize obj as UTF-8 JSON, 2-space indented unless indent is False."""
+    if orjson is not None and not _has_non_finite(obj):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # orjson rejects some values the stdlib accepts (e.g. >64-bit ints)
+            pass
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# Any letter: word characters minus digits and underscore
+_ALPHA_RE = re.compile(r"[^\W\d_]")
+
+
 def _is_header(row: List[str]) -> bool:
     """
     Detect if row is a CSV header.
@@ -24,11 +152,26 @@ def _is_header(row: List[str]) -> bool:
     - If ANY cell contains ANY alphabetic character → treat row as header.
     - Purely numeric, empty, or symbol-only rows are NOT headers.
     """
-    for cell in row:
-        if any(char.isalpha() for char in cell):
-            return True
-    return False
+    return _ALPHA_RE.search("".join(row)) is not None
+
 
+def _fit_row(row: Any, header_index: Dict[str, int], blanks: List[str]) -> List[Any]:
+    """
+    Lay a row out positionally under a header.
+
+    Dict rows are placed by header_index, list rows are padded/truncated to
+    the header width, and anything else is stringified into the first column.
+    """
+    out = blanks.copy()
+    if isinstance(row, dict):
+        for k, v in row.items():
+            out[header_index[k]] = v
+    elif isinstance(row, list):
+        n = min(len(row), len(out))
+        out[:n] = row[:n]
+    else:
+        out[0] = str(row)
+    return out
 
 
 # =============================================================================
@@ -64,16 +207,35 @@ class BaseWriter(Protocol):
 class JSONWriter:
     """Handles JSON file reading, merging, and writing."""
 
+    # Sync each file to disk before it replaces the previous version
+    durable: bool = False
+
+    # path -> ((st_mtime_ns, st_size), parsed content) of the last file this
+    # process wrote, so steady-state writes skip re-reading and re-parsing.
+    _cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+    @classmethod
+    def flush_cache(cls, path: str | None = None) -> None:
+        """Forget cached file contents for path, or for every path if None."""
+        if path is None:
+            cls._cache.clear()
+        else:
+            cls._cache.pop(path, None)
+
     async def _read_json(self, path: str, key: Tuple[str, ...] | None):
-        if not os.path.exists(path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             return {} if key else []
-        async with aiofiles.open(path, "r", encoding="utf-8") as f:
-            txt = await f.read()
-        if not txt.strip():
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == (st.st_mtime_ns, st.st_size):
+            return cached[1]
+        raw = await asyncio.to_thread(_read_bytes, path)
+        if not raw.strip():
             return {} if key else []
         try:
-            return json.loads(txt)
-        except json.JSONDecodeError:
+            return _loads_json(raw)
+        except ValueError:
             return {} if key else []
 
     def _validate_strict_key(self, existing: Any, key: Tuple[str, ...]):
@@ -99,21 +261,7 @@ class JSONWriter:
         strict_keys: bool = False,
     ) -> None:
 
-        existing = await self._read_json(path, key)
-
-        if strict_keys and key:
-            self._validate_strict_key(existing, key)
-
-        if key is None:
-            existing = apply_mode_json(existing, data, mode)
-        else:
-            container, last_key = resolve_nested(
-                existing, key, create=not strict_keys # type: ignore
-            )
-            apply_nested_json(container, last_key, data, mode)
-
-        async with aiofiles.open(path, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(existing, indent=2))
+        await self.write_batch(path, [data], mode, key, strict_keys)
 
     async def write_batch(
         self,
@@ -124,24 +272,49 @@ class JSONWriter:
         strict_keys: bool = False,
     ) -> None:
 
-        for item in data_list:
-            await self.write_single(
-                path=path,
-                data=item,
-                mode=mode,
-                key=key,
-                strict_keys=strict_keys,
+        if not data_list:
+            return
+
+        existing = await self._read_json(path, key)
+        # The merge below mutates `existing`, which may be the cached object
+        self._cache.pop(path, None)
+
+        if strict_keys and key:
+            self._validate_strict_key(existing, key)
+
+        container, last_key = None, None
+        if key is not None:
+            container, last_key = resolve_nested(
+                existing, key, create=not strict_keys # type: ignore
             )
+
+        # Round-trip the batch once so the cached state matches what a fresh
+        # read of the file would return (tuples -> lists, no aliasing).
+        data_list = _loads_json(_dumps_json(data_list, indent=False))
+
+        # Merge every item in memory; "overwrite" only replaces the
+        # existing content once, the rest of the batch is appended to it.
+        item_mode = mode
+        for item in data_list:
+            if key is None:
+                existing = apply_mode_json(existing, item, item_mode)
+            else:
+                apply_nested_json(container, last_key, item, item_mode) # type: ignore
+            if item_mode == "overwrite":
+                item_mode = "append"
+
+        await asyncio.to_thread(_atomic_write_bytes, path, _dumps_json(existing), self.durable)
+
+        st = os.stat(path)
+        self._cache[path] = ((st.st_mtime_ns, st.st_size), existing)
+
+
 # =============================================================================
 # TXT WRITER
 # =============================================================================
 
 class TXTWriter:
-    async def _read_txt(self, path: str) -> List[str]:
-        if not os.path.exists(path):
-            return []
-        async with aiofiles.open(path, "r", encoding="utf-8") as f:
-            return [line.rstrip("\n") async for line in f]
+    durable: bool = False
 
     async def write_single(
         self,
@@ -152,15 +325,7 @@ class TXTWriter:
         strict_keys: bool = False, #For protocol compatibility 
     ) -> None:
 
-        existing = []
-        if os.path.exists(path) and mode != "overwrite":
-            existing = await self._read_txt(path)
-
-        merged = merge_flat(existing, data, mode)
-
-        async with aiofiles.open(path, "w", encoding="utf-8") as f:
-            for line in merged:
-                await f.write(f"{line}\n")
+        await self._write_lines(path, force_list(data), mode)
 
     async def write_batch(
         self,
@@ -170,22 +335,27 @@ class TXTWriter:
         key: Tuple[str, ...] | None,
         strict_keys: bool = False, #For protocol compatibility 
     ) -> None:
-        existing = []
-        if os.path.exists(path) and mode != "overwrite":
-            existing = await self._read_txt(path)
-
+        # Same per-item normalization as write_single
         combined = []
         for item in data_list:
-            if isinstance(item, list):
-                combined.extend(item)
-            else:
-                combined.append(item)
-
-        merged = merge_flat(existing, combined, mode)
-
-        async with aiofiles.open(path, "w", encoding="utf-8") as f:
-            for line in merged:
-                await f.write(f"{line}\n")
+            combined.extend(force_list(item))
+
+        await self._write_lines(path, combined, mode)
+
+    async def _write_lines(self, path: str, lines: List[Any], mode: str) -> None:
+        """
+        Write lines to path, one per line.
+
+        Flat merging only ever adds lines after the existing ones, so every
+        mode except "overwrite" appends to an existing file in place instead
+        of reading it and rewriting the whole file.
+        """
+        lines = merge_flat([], lines, mode)  # validates mode
+        text = "".join(f"{line}\n" for line in lines)
+        if mode != "overwrite" and os.path.exists(path):
+            await asyncio.to_thread(_append_text, path, text, self.durable)
+        else:
+            await asyncio.to_thread(_write_text, path, text, self.durable)
 
 
 # =============================================================================
@@ -194,12 +364,13 @@ class TXTWriter:
 
 
 class CSVWriter:
+    durable: bool = False
+
     async def _read_csv(self, path: str) -> Tuple[List[str] | None, List[List[str]]]:
         if not os.path.exists(path):
             return None, []
 
-        async with aiofiles.open(path, "r", encoding="utf-8") as f:
-            content = await f.read()
+        content = await asyncio.to_thread(_read_text, path)
 
         reader = csv.reader(content.splitlines())
         rows = list(reader)
@@ -214,77 +385,80 @@ class CSVWriter:
         return None, rows
 
     async def _write_csv(self, path: str, rows: List[Any], existing_header: List[str] | None = None) -> None:
-        buffer = io.StringIO()
+        await asyncio.to_thread(self._dump_csv, path, rows, existing_header)
 
-        if not rows:
-            async with aiofiles.open(path, "w", encoding="utf-8") as f:
-                return
+    def _dump_csv(self, path: str, rows: List[Any], existing_header: List[str] | None) -> None:
+        # csv writers stream straight into the temp file; no in-memory copy
+        with _atomic_open(path, "w", self.durable, encoding="utf-8", newline="") as f:
+            if rows:
+                self._render_csv(f, rows, existing_header)
 
-        # Decide mode: if any dict is present, write as dict CSV with header.
-        any_dict = any(isinstance(r, dict) for r in rows)
+    @staticmethod
+    def _render_csv(buffer: IO[str], rows: List[Any], existing_header: List[str] | None) -> None:
+        writer = csv.writer(buffer)
 
-        if any_dict:
+        # Decide mode: if any dict is present, write as dict CSV with header.
+        if any(isinstance(r, dict) for r in rows):
             # Collect headers by first appearance across dict rows
             # Start headers from existing header if available, then append new keys
             headers: List[str] = list(existing_header) if existing_header else []
+            header_index = {h: i for i, h in enumerate(headers)}
             for r in rows:
                 if isinstance(r, dict):
-                    for k in r.keys():
-                        if k not in headers:
+                    for k in r:
+                        if k not in header_index:
+                            header_index[k] = len(headers)
                             headers.append(k)
-
-            # Normalize rows: convert list rows to dicts using headers when possible
-            norm_rows: List[dict] = []
-            for r in rows:
-                if isinstance(r, dict):
-                    norm_rows.append(r)
-                elif isinstance(r, list):
-                    if len(headers) == 1:
-                        # Single-column CSV: map the sole value
-                        norm_rows.append({headers[0]: r[0] if r else ""})
-                    else:
-                        # Attempt positional mapping; pad/truncate to headers length
-                        mapped = {h: (r[i] if i < len(r) else "") for i, h in enumerate(headers)}
-                        norm_rows.append(mapped)
-                else:
-                    # Fallback: stringify as single column if one header, else put in first
-                    if len(headers) == 1:
-                        norm_rows.append({headers[0]: str(r)})
-                    else:
-                        mapped = {h: "" for h in headers}
-                        mapped[headers[0]] = str(r)
-                        norm_rows.append(mapped)
-
-            writer = csv.DictWriter(buffer, fieldnames=headers)
-            writer.writeheader()
-            for row in norm_rows:
-                writer.writerow({key: row.get(key, "") for key in headers})
+        elif existing_header:
+            # Pure list rows under an existing header
+            headers, header_index = existing_header, {}
         else:
-            # Pure list rows: if we have an existing header, write as single/multi-column headered CSV
-            if existing_header:
-                headers = list(existing_header)
-                writer = csv.DictWriter(buffer, fieldnames=headers)
-                writer.writeheader()
-                for r in rows:
-                    if isinstance(r, list):
-                        if len(headers) == 1:
-                            writer.writerow({headers[0]: r[0] if r else ""})
-                        else:
-                            mapped = {h: (r[i] if i < len(r) else "") for i, h in enumerate(headers)}
-                            writer.writerow(mapped)
-                    else:
-                        if len(headers) == 1:
-                            writer.writerow({headers[0]: str(r)})
-                        else:
-                            mapped = {h: "" for h in headers}
-                            mapped[headers[0]] = str(r)
-                            writer.writerow(mapped)
-            else:
-                writer = csv.writer(buffer)
+            writer.writerows(rows)
+            return
+
+        writer.writerow(headers)
+        blanks = [""] * len(headers)
+        writer.writerows(_fit_row(r, header_index, blanks) for r in rows)
+
+    async def _try_append(self, path: str, rows: List[Any]) -> bool:
+        """
+        Append rows to the end of an existing CSV without re-reading its body.
+
+        Only the first line is read, to recover the header. Returns False when
+        the rows need a full rewrite instead: a dict row introduces a column
+        the file does not have, dict rows meet a header-less file, or the file
+        does not end with a newline.
+        """
+        first_line, ends_clean = await asyncio.to_thread(_peek_first_line, path)
+        if not ends_clean:
+            return False
+
+        header: List[str] | None = None
+        if first_line:
+            first_row = next(csv.reader([first_line.rstrip("\r\n")]), [])
+            if _is_header(first_row):
+                header = first_row
+
+        dict_keys = [k for r in rows if isinstance(r, dict) for k in r]
+        if dict_keys:
+            if header is None or not set(dict_keys).issubset(header):
+                return False
+
+        await asyncio.to_thread(self._append_csv, path, rows, header)
+        return True
+
+    def _append_csv(self, path: str, rows: List[Any], header: List[str] | None) -> None:
+        with open(path, "a", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            if header is None:
                 writer.writerows(rows)
-
-        async with aiofiles.open(path, "w", encoding="utf-8", newline="") as f:
-            await f.write(buffer.getvalue())
+            else:
+                header_index = {h: i for i, h in enumerate(header)}
+                blanks = [""] * len(header)
+                writer.writerows(_fit_row(r, header_index, blanks) for r in rows)
+            if self.durable:
+                f.flush()
+                _fdatasync(f.fileno())
 
     async def write_single(
         self,
@@ -295,17 +469,7 @@ class CSVWriter:
         strict_keys: bool = False,
     ) -> None:
 
-        if not isinstance(data, list):
-            data = [data]
-
-        existing_header: List[str] | None = None
-        existing: List[List[str]] = []
-        if os.path.exists(path) and mode != "overwrite":
-            existing_header, existing = await self._read_csv(path)
-
-        merged = merge_flat(existing, data, mode)
-
-        await self._write_csv(path, merged, existing_header)
+        await self.write_batch(path, [data], mode, key, strict_keys)
 
     async def write_batch(
         self,
@@ -316,15 +480,17 @@ class CSVWriter:
         strict_keys: bool = False,
     ) -> None:
 
+        combined = []
+        for item in data_list:
+            combined.extend(item if isinstance(item, list) else [item])
+
         existing_header: List[str] | None = None
         existing: List[List[str]] = []
         if os.path.exists(path) and mode != "overwrite":
+            if mode in {"append", "extend", "update"} and await self._try_append(path, combined):
+                return
             existing_header, existing = await self._read_csv(path)
 
-        combined = []
-        for item in data_list:
-            combined.extend(item if isinstance(item, list) else [item])
-
         merged = merge_flat(existing, combined, mode)
 
         await self._write_csv(path, merged, existing_header)
@@ -11,7 +11,7 @@ def convertible_to_non_neg_int(value) -> Tuple[bool, int]:
         return (False, 0)
 
 def validate_non_neg_int(value: Optional[int]) -> int:
-    ivalue, can_convert = convertible_to_non_neg_int(value)
+    can_convert, ivalue = convertible_to_non_neg_int(value)
     if not can_convert:
         raise ValueError("history_length must be a non negative integer")
     return ivalue
@@ -19,7 +19,7 @@ def validate_non_neg_int(value: Optional[int]) -> int:
 def validate_none_or_non_neg_int(value: Optional[int]) -> Optional[int]:
     if value is None:
         return None
-    ivalue, can_convert = convertible_to_non_neg_int(value)
+    can_convert, ivalue = convertible_to_non_neg_int(value)
     if not can_convert:
         raise ValueError("history_tolerance must be a non negative integer or None")
     return ivalue
@@ -37,9 +37,12 @@ class CloggableList(list):
         tolerance (int): Number of elements allowed beyond `max_length` before raising an error. If `None`, the list is considered unlimited.
 
     Properties:
-        full (bool): True if the list has reached or exceeded `max_length`.
+        is_full (bool): Alias for `full()`.
 
     Methods:
+        full() -> bool:
+            Returns True if the list has reached or exceeded `max_length`.
+
         tolerable() -> bool:
             Returns True if the current list size is within `max_length + tolerance`.
 
@@ -85,12 +88,16 @@ class CloggableList(list):
         super().__init__()
         self.max_length = max_length
         self.tolerance = tolerance
-    def _full(self) -> bool:
+    def full(self) -> bool:
         """
         Check if the list is full.
         """
-        return len(self) >= self.max_length
-    full = property(_full)
+        return len(self) >= self._max_length
+
+    @property
+    def is_full(self) -> bool:
+        """Attribute-style alias for full()."""
+        return self.full()
 
     @property
     def max_length(self) -> int:
@@ -132,19 +139,26 @@ class CloggableList(list):
     def return_full(method):
         def wrapper(self: "CloggableList", *args, **kwargs):
             method(self, *args, **kwargs)
-            if self.full:
+            if self.full():
                 return Full()
         return wrapper
 
-    @proceed_if_tolerable
-    @return_full
+    # append/extend inline the proceed_if_tolerable + return_full checks to
+    # keep the hot path free of extra wrapper frames.
     def append(self, object) -> Optional[Full]:
-        super().append(object)
+        n = len(self)
+        if self._tolerance is not None and n > self._max_length + self._tolerance:
+            raise OverflowError("List is full")
+        list.append(self, object)
+        if n + 1 >= self._max_length:
+            return Full()
 
-    @proceed_if_tolerable
-    @return_full
     def extend(self, iterable) -> Optional[Full]:
-        super().extend(iterable)
+        if self._tolerance is not None and len(self) > self._max_length + self._tolerance:
+            raise OverflowError("List is full")
+        list.extend(self, iterable)
+        if len(self) >= self._max_length:
+            return Full()
 
     def flush(self) -> tuple:
         """
@@ -156,13 +170,19 @@ class CloggableList(list):
     
     def extract(self, *args: Union[int, Interval]) -> tuple:
         indices = set(Interval.flatten(*args))
-        if any(i < 0 or i >= len(self) for i in indices):
+        n = len(self)
+        if any(i < 0 or i >= n for i in indices):
             raise IndexError("Index out of range")
-
-        extracted = [self[i] for i in sorted(indices)]
-        for i in sorted(indices, reverse=True):
-            del self[i]
-        return tuple(extracted)
+        if not indices:
+            return ()
+
+        # Rebuild the list once instead of shifting it on every `del`
+        keep = [True] * n
+        for i in indices:
+            keep[i] = False
+        extracted = tuple(self[i] for i in sorted(indices))
+        self[:] = [v for v, k in zip(self, keep) if k]
+        return extracted
     
     def remove(self, value) -> None:
         """
@@ -12,7 +12,16 @@ from .row_factory import (
     type_converting_row_factory,
     dict_row_factory,
     custom_row_factory,
-    convert_value_with_type
+    convert_value_with_type,
+    convert_rows
+)
+from .columnar import (
+    fetchall_columnar,
+    rows_to_columns
+)
+from .pool import (
+    AsyncSqlitePool,
+    try_query_pooled
 )
 
 __all__ = (
@@ -26,5 +35,10 @@ __all__ = (
     "type_converting_row_factory",
     "dict_row_factory",
     "custom_row_factory",
-    "convert_value_with_type"
+    "convert_value_with_type",
+    "convert_rows",
+    "fetchall_columnar",
+    "rows_to_columns",
+    "AsyncSqlitePool",
+    "try_query_pooled"
 )
\ No newline at end of file
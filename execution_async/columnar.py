@@ -0,0 +1,97 @@
+"""
+Column-oriented fetch helpers.
+
+fetchall() returns one tuple per row. Code that then works column by column
+(sums, filters, enum lookups) has to transpose that result itself; these
+helpers return the columns directly, converted like type_converting_row_factory.
+"""
+from typing import Any, Dict, List, Optional, Sequence
+
+from aiosqlite import Cursor
+
+from .row_factory import convert_value
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+
+def _int_array(column: List[Any]) -> Optional[Any]:
+    """Return `column` as an int64 array if every value is a plain int that fits, else None."""
+    if set(map(type, column)) != {int}:
+        return None
+    try:
+        return np.fromiter(column, dtype=np.int64, count=len(column))
+    except OverflowError:
+        return None
+
+
+def rows_to_columns(names: Sequence[str], rows: Sequence[Any], as_numpy: bool = False) -> Dict[str, Any]:
+    """
+    Transpose fetched rows into a mapping of column name -> list of values.
+
+    Rows may be tuples (or sqlite3.Row) or dicts as produced by dict_row_factory.
+    String values are converted with `convert_value`; columns without strings
+    are copied as-is.
+
+    Args:
+        names: Column names, in row order.
+        rows: The fetched rows.
+        as_numpy: Return all-integer columns as int64 NumPy arrays. Requires numpy.
+
+    Returns:
+        Dict[str, Any]: One list (or array) per column, keyed by column name.
+
+    Raises:
+        ImportError: If `as_numpy` is True and numpy is not installed.
+
+    Examples:
+        >>> rows_to_columns(("id", "name"), [('1', 'a'), ('2', 'b')])
+        {'id': [1, 2], 'name': ['a', 'b']}
+    """
+    if as_numpy and np is None:
+        raise ImportError("as_numpy=True requires numpy to be installed.")
+    if rows and isinstance(rows[0], dict):
+        columns = [[row[name] for row in rows] for name in names]
+    else:
+        columns = [list(column) for column in zip(*rows)] if rows else [[] for _ in names]
+
+    result: Dict[str, Any] = {}
+    for name, column in zip(names, columns):
+        if str in set(map(type, column)):
+            column = list(map(convert_value, column))
+        if as_numpy:
+            array = _int_array(column)
+            if array is not None:
+                column = array
+        result[name] = column
+    return result
+
+
+async def fetchall_columnar(cursor: Cursor, as_numpy: bool = False) -> Dict[str, Any]:
+    """
+    Fetch all remaining rows of `cursor` as columns instead of rows.
+
+    Prefer this over `return_type="fetchall"` when the result is processed
+    per column afterwards: each column is a single list (or, with `as_numpy`,
+    an int64 array for integer columns).
+
+    Args:
+        cursor: An aiosqlite cursor that has executed a query.
+        as_numpy: Return all-integer columns as int64 NumPy arrays. Requires numpy.
+
+    Returns:
+        Dict[str, Any]: One list (or array) per column, keyed by column name.
+        Empty if the statement returns no columns.
+
+    Examples:
+        >>> await cursor.execute("SELECT id, name FROM users")
+        >>> cols = await fetchall_columnar(cursor)
+        >>> sum(cols["id"])
+    """
+    rows = await cursor.fetchall()
+    description = cursor.description
+    if not description:
+        return {}
+    return rows_to_columns([column[0] for column in description], rows, as_numpy)
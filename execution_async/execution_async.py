@@ -1,48 +1,59 @@
 import aiosqlite
+import asyncio
 from aiosqlite import Cursor
+from itertools import islice
 from typing import Optional, List, Any, Union
 import logging
-from ..utils import is_depth_at_least
-from .fetch_types import ReturnType, FetchMany, normalize_return_type
+from functools import lru_cache
+from .fetch_types import ReturnType, normalize_return_type, _Kind, _KIND_BY_NAME
+from .row_factory import convert_rows
 
+_LOG = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1024)
 def question_to_dollar(query: str) -> str:
     """
     Convert SQL positional placeholders from "?" to PostgreSQL-style "$n".
-    This function scans the input SQL string for "?" characters and reconstructs
-    the query by numbering each placeholder in order of appearance starting from 1
-    (i.e., ?, ?, ? -> $1, $2, $3).
+    This function scans the input SQL string for "?" characters and numbers each
+    placeholder in order of appearance starting from 1 (i.e., ?, ?, ? -> $1, $2, $3).
+    Results are cached, so re-executing the same SQL string is a dict lookup.
     Args:
         query (str): A SQL query string that may contain "?" placeholders.
     Returns:
         str: The transformed SQL string with placeholders numbered as "$1", "$2", etc.
-             If the input contains no "?" characters, this implementation returns an
-             empty string.
+             A query without "?" characters is returned unchanged.
     Notes:
         - This implementation naively splits on "?" and does not account for
           question marks inside string literals or comments.
-        - When multiple placeholders are present, the initial segment before the
-          first "?" is prepended for each occurrence due to the current construction.
-          This can lead to repeated prefixes in the output (see example below).
     Examples:
         Single placeholder:
             >>> question_to_dollar("INSERT INTO t(a) VALUES (?)")
             'INSERT INTO t(a) VALUES ($1)'
-        Multiple placeholders (note repeated prefix in output):
+        Multiple placeholders:
             >>> question_to_dollar("SELECT * FROM t WHERE a = ? AND b = ?")
-            'SELECT * FROM t WHERE a = $1 AND b = SELECT * FROM t WHERE a = $2'
+            'SELECT * FROM t WHERE a = $1 AND b = $2'
         No placeholders:
             >>> question_to_dollar("SELECT 1")
-            ''
+            'SELECT 1'
     """
 
     parts = query.split("?")
-    return "".join(parts[0] + f"${i}" + parts[i] for i in range(1, len(parts)))
+    return parts[0] + "".join(f"${i}{part}" for i, part in enumerate(parts[1:], 1))
 
 # === Async Execution ===
 
+def _looks_bulk(injection_values) -> bool:
+    """Cheap bulk check: a list/tuple whose first item is itself a parameter set."""
+    return (
+        isinstance(injection_values, (list, tuple))
+        and len(injection_values) > 0
+        and isinstance(injection_values[0], (list, tuple, dict))
+    )
+
 async def _execute_with_params(cursor: Cursor, query: str, injection_values, log: bool, notify_bulk: bool, force_notify_bulk: bool= False,
-                               logger: logging.Logger = logging.getLogger(__name__)):
+                               logger: logging.Logger = _LOG, executemany: Optional[bool] = None,
+                               bulk_chunk_size: Optional[int] = None):
     """
     Executes a SQL query with the provided parameters, supporting both single and bulk operations.
     Args:
@@ -53,22 +64,58 @@ async def _execute_with_params(cursor: Cursor, query: str, injection_values, log
         notify_bulk (bool): Whether to notify when a bulk operation is performed.
         force_notify_bulk (bool, optional): If True, forces notification of bulk operation regardless of other flags. Defaults to False.
         logger (logging.Logger, optional): Logger instance to use for logging. Defaults to a logger named after the current module.
+        executemany (Optional[bool], optional): True forces `executemany`, False forces `execute`. None (default)
+            decides from the shape of `injection_values`.
+        bulk_chunk_size (Optional[int], optional): Split a bulk operation into sequential `executemany` calls of
+            at most this many parameter sets, yielding to the event loop between chunks. Defaults to None (one call).
     Returns:
         None
     Notes:
-        - If `injection_values` is a sequence of sequences (depth >= 2), a bulk operation is performed using `executemany`.
+        - When `executemany` is None, a list or tuple whose first item is a list, tuple or dict is treated as a
+          sequence of parameter sets and run with `executemany`.
         - Logs information about bulk operations if `notify_bulk` and `log` are True, or if `force_notify_bulk` is True.
     """    
-    is_bulk = is_depth_at_least(injection_values, 2)
+    is_bulk = _looks_bulk(injection_values) if executemany is None else executemany
     if is_bulk:
-        if (notify_bulk and log) or force_notify_bulk:
-            logger.info(f"Executing bulk operation with {len(injection_values)} records.")
-        await cursor.executemany(query, injection_values)
+        if ((notify_bulk and log) or force_notify_bulk) and logger.isEnabledFor(logging.INFO):
+            logger.info("Executing bulk operation with %s records.",
+                        len(injection_values) if hasattr(injection_values, "__len__") else "an unknown number of")
+        if bulk_chunk_size:
+            await _executemany_chunked(cursor, query, injection_values, bulk_chunk_size)
+        else:
+            await cursor.executemany(query, injection_values)
     else:
         await cursor.execute(query, injection_values)
 
+async def _executemany_chunked(cursor: Cursor, query: str, injection_values, chunk_size: int) -> None:
+    """Run `executemany` over `chunk_size` parameter sets at a time, yielding to the loop in between."""
+    if chunk_size < 1:
+        raise ValueError("bulk_chunk_size must be a positive integer")
+    if isinstance(injection_values, (list, tuple)):
+        chunks = (injection_values[i:i + chunk_size] for i in range(0, len(injection_values), chunk_size))
+    else:
+        it = iter(injection_values)
+        chunks = iter(lambda: list(islice(it, chunk_size)), [])
+    first = True
+    for chunk in chunks:
+        if not first:
+            await asyncio.sleep(0)
+        first = False
+        await cursor.executemany(query, chunk)
+
+async def _fetch_one(cursor: Cursor, return_type: ReturnType) -> List[Any]:
+    result = await cursor.fetchone()
+    return [result] if result else []
+
+# Fetch coroutine per ReturnType kind; fetchone is wrapped to keep the list contract
+_FETCH_DISPATCH = {
+    _Kind.ONE: _fetch_one,
+    _Kind.ALL: lambda cursor, return_type: cursor.fetchall(),
+    _Kind.MANY: lambda cursor, return_type: cursor.fetchmany(return_type.n),
+}
+
 async def _fetch_results(cursor: Cursor, return_type: ReturnType, 
-    logger: logging.Logger = logging.getLogger(__name__)
+    logger: logging.Logger = _LOG
                          ) -> Optional[List[Any]]:
     """
     Fetch rows from an asynchronous database cursor according to the specified return type.
@@ -92,18 +139,35 @@ async def _fetch_results(cursor: Cursor, return_type: ReturnType,
     """
 
     
-    if return_type.type == "fetchone":
-        result = await cursor.fetchone()
-        return [result] if result else []
-    elif return_type.type == "fetchall":
-        result = await cursor.fetchall()
-        return result  # type: ignore
-    elif isinstance(return_type, FetchMany):
-        result = await cursor.fetchmany(return_type.n)
-        return result # type: ignore
+    kind = return_type.kind
+    if kind is None:
+        # Subclasses that predate `kind` name their fetch method in `type`
+        kind = _KIND_BY_NAME.get(return_type.type)
+    fetch = _FETCH_DISPATCH.get(kind)
+    if fetch is not None:
+        return await fetch(cursor, return_type)
     logger.error("Unsupported return_type encountered.")
     return None
 
+async def _run_query(cursor: Cursor, query: str, commit: bool, injection_values, rt: ReturnType, log: bool,
+                     notify_bulk: bool, force_notify_bulk: bool, executemany: Optional[bool],
+                     bulk_chunk_size: Optional[int], batch_convert: bool,
+                     logger: logging.Logger) -> Optional[List[Any]]:
+    """Execute, optionally commit, and fetch; the unguarded body of try_query."""
+    if injection_values is not None:
+        await _execute_with_params(cursor, query, injection_values, log, notify_bulk, force_notify_bulk,
+                                   logger, executemany=executemany, bulk_chunk_size=bulk_chunk_size)
+    else:
+        await cursor.execute(query)
+
+    if commit:
+        await cursor.connection.commit() # type: ignore
+
+    result = await _fetch_results(cursor, rt, logger)
+    if batch_convert and result:
+        result = convert_rows(result)
+    return result
+
 async def try_query(
     cursor: Cursor,
     query: str,
@@ -117,7 +181,10 @@ async def try_query(
     notify_bulk=False,
     force_notify_bulk=False,
     convert_to_dollar=False,
-    logger = logging.getLogger(__name__),
+    executemany: Optional[bool] = None,
+    batch_convert: bool = False,
+    bulk_chunk_size: Optional[int] = None,
+    logger = _LOG,
     **kwargs
 ) -> Optional[List[Any]]:
 
@@ -134,9 +201,16 @@ async def try_query(
             Options: "fetchall", "fetchone", "fetchmany", or ReturnType enum. Defaults to "fetchall".
         log (bool, optional): Whether to log the query execution details. Defaults to False.
         raise_on_fail (bool, optional): Whether to re-raise exceptions after logging. Defaults to False.
+            Combined with log=False and no error_message, exceptions propagate without being logged.
         notify_bulk (bool, optional): Enable bulk operation notifications. Defaults to False.
         force_notify_bulk (bool, optional): Force bulk operation notifications regardless of other settings. Defaults to False.
         convert_to_dollar (bool, optional): Convert query placeholders from '?' to '$' notation. Defaults to False.
+        executemany (Optional[bool], optional): Run `injection_values` as many parameter sets (True) or as
+            one (False). Defaults to None, which infers it from the shape of `injection_values`.
+        batch_convert (bool, optional): Apply automatic type conversion to the fetched rows column by column
+            (see `convert_rows`). Meant for connections without a row factory. Defaults to False.
+        bulk_chunk_size (Optional[int], optional): Run bulk `injection_values` as sequential `executemany` calls
+            of at most this many rows each. Defaults to None, which sends everything in one call.
         logger (logging.Logger, optional): Logger instance for logging operations. Defaults to module logger.
         **kwargs: Additional keyword arguments (currently unused, reserved for future extensions).
     Returns:
@@ -156,28 +230,31 @@ async def try_query(
 
     if convert_to_dollar:
         query = question_to_dollar(query)
-    if log:
-        logger.info(f"Executing query: {query} | Params: {injection_values or 'None'}")
+    if log and logger.isEnabledFor(logging.INFO):
+        logger.info("Executing query: %s | Params: %s", query, injection_values or 'None')
 
+    # ReturnType instances need no normalization; other specifiers are parsed
+    # inside the try so that invalid ones are still logged/handled below.
+    rt = return_type if isinstance(return_type, ReturnType) else None
+    if raise_on_fail and not log and error_message is None:
+        # The caller handles failures itself and asked for no logging:
+        # let exceptions propagate straight from the query.
+        if rt is None:
+            rt = normalize_return_type(return_type)
+        return await _run_query(cursor, query, commit, injection_values, rt, log, notify_bulk, force_notify_bulk,
+                                executemany, bulk_chunk_size, batch_convert, logger)
     try:
-        rt = normalize_return_type(return_type)
-
-        if injection_values is not None:
-            await _execute_with_params(cursor, query, injection_values, log, notify_bulk, force_notify_bulk)
-        else:
-            await cursor.execute(query)
-
-        if commit:
-            await cursor.connection.commit() # type: ignore
-
-        return await _fetch_results(cursor, rt)
+        if rt is None:
+            rt = normalize_return_type(return_type)
+        return await _run_query(cursor, query, commit, injection_values, rt, log, notify_bulk, force_notify_bulk,
+                                executemany, bulk_chunk_size, batch_convert, logger)
 
     except aiosqlite.Error as db_error:
-        logger.error(f"SQLite error during query: {db_error}")
+        logger.error("SQLite error during query: %s", db_error)
         if raise_on_fail:
             raise
     except Exception as e:
-        logger.error(f"{error_message or 'Error executing query'}: {e}")
+        logger.error("%s: %s", error_message or 'Error executing query', e)
         if raise_on_fail:
             raise
 
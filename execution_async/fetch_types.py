@@ -1,11 +1,23 @@
 
-from typing import Optional, Union
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import ClassVar, Dict, Optional, Union
 from ..utils import no_underscore_or_space
 
 
 
 # === ReturnType Classes ===
 
+class _Kind(IntEnum):
+    """Integer tag for the fetch strategy; dispatch compares these instead of strings."""
+    ONE = 1
+    ALL = 2
+    MANY = 3
+
+_KIND_NAMES = {_Kind.ONE: "fetchone", _Kind.ALL: "fetchall", _Kind.MANY: "fetchmany"}
+_KIND_BY_NAME = {name: kind for kind, name in _KIND_NAMES.items()}
+
+
 class ReturnType: 
     """Placeholder base class representing a standardized return type for asynchronous fetch operations.
     This class serves as an extension point for defining structured results returned
@@ -13,40 +25,68 @@ class ReturnType:
     Subclass this to create specific, typed return models (e.g., rows, counts, status),
     and document their fields clearly for consistent usage across the codebase.
     """
-    type: str
+    __slots__ = ()
+    kind: ClassVar[Optional[_Kind]] = None
+
+    @property
+    def type(self) -> Optional[str]:
+        """The fetch method name ("fetchone", "fetchall", "fetchmany")."""
+        if self.kind is None:
+            # Subclasses without `kind` name their strategy by assigning `type`
+            return getattr(self, "_type", None)
+        return _KIND_NAMES.get(self.kind)
 
+    @type.setter
+    def type(self, value: Optional[str]) -> None:
+        self._type = value
 
+    def to_string(self) -> str: return str(self.type)
+
+
+@dataclass(frozen=True, slots=True)
 class FetchOne(ReturnType):
-    def __init__(self): self.type = "fetchone"
-    def __repr__(self): return "FetchOne()"
-    def to_string(self) -> str: return self.type
-    def __eq__(self, value): return isinstance(value, FetchOne)
-    def __hash__(self): return hash(self.type)
+    kind: ClassVar[_Kind] = _Kind.ONE
 
+@dataclass(frozen=True, slots=True)
 class FetchAll(ReturnType):
-    def __init__(self): self.type = "fetchall"
-    def __repr__(self): return "FetchAll()"
-    def to_string(self) -> str: return self.type
-    def __eq__(self, value): return isinstance(value, FetchAll)
-    def __hash__(self): return hash(self.type)
+    kind: ClassVar[_Kind] = _Kind.ALL
 
+@dataclass(frozen=True, slots=True)
 class FetchMany(ReturnType):
-    def __init__(self, n: Optional[int] = None):
-        if n is None or n < 1:
+    kind: ClassVar[_Kind] = _Kind.MANY
+    n: Optional[int] = None
+
+    def __post_init__(self):
+        if self.n is None or self.n < 1:
             raise ValueError("FetchMany requires a positive integer n >= 1.")
-        self.n = n
-        self.type = "fetchmany"
-    def __repr__(self): return f"FetchMany(n={self.n})"
     def to_string(self) -> str: return f"{self.type} ({self.n})"
-    def __eq__(self, value): return isinstance(value, FetchMany) and self.n == value.n
-    def __hash__(self): return hash((self.type, self.n))
 
 # === Utility Functions ===
 
+# Return types are immutable in practice, so the common ones are shared
+# instead of being rebuilt on every query.
+_FETCH_ALL = FetchAll()
+_FETCH_ONE = FetchOne()
+_STR_CACHE = {
+    "fetchall": _FETCH_ALL,
+    "all": _FETCH_ALL,
+    "fetchone": _FETCH_ONE,
+    "one": _FETCH_ONE,
+}
+_FETCH_MANY_CACHE: Dict[int, FetchMany] = {}
+_FETCH_MANY_CACHE_SIZE = 256
+
 def _fetch_num_arg(arg) -> Union[FetchOne, FetchMany]:
     if arg < 1:
         raise ValueError(f"Invalid integer argument for Fetch: {arg}")
-    return FetchOne() if arg == 1 else FetchMany(arg)
+    if arg == 1:
+        return _FETCH_ONE
+    fm = _FETCH_MANY_CACHE.get(arg)
+    if fm is None:
+        fm = FetchMany(arg)
+        if len(_FETCH_MANY_CACHE) < _FETCH_MANY_CACHE_SIZE:
+            _FETCH_MANY_CACHE[arg] = fm
+    return fm
 
 def Fetch(arg: Optional[Union[str, int, ReturnType]] = None) -> ReturnType:
     """
@@ -64,11 +104,13 @@ def Fetch(arg: Optional[Union[str, int, ReturnType]] = None) -> ReturnType:
         TypeError: If the argument type is not supported.
     """
 
-    if arg is None: return FetchAll()
+    if arg is None: return _FETCH_ALL
     if isinstance(arg, str):
+        cached = _STR_CACHE.get(arg)
+        if cached is not None: return cached
         arg = no_underscore_or_space(arg).lower()
-        if arg in ("one", "fetchone"): return FetchOne()
-        if arg in ("all", "fetchall"): return FetchAll()
+        cached = _STR_CACHE.get(arg)
+        if cached is not None: return cached
         try: return _fetch_num_arg(int(arg))
         except ValueError: pass
         raise ValueError(f"Invalid string argument for Fetch: {arg}")
@@ -86,4 +128,7 @@ def normalize_return_type(rt: Union[str, int, ReturnType]) -> ReturnType:
     Returns:
         ReturnType: A normalized ReturnType instance.
     """
-    return rt if isinstance(rt, ReturnType) else Fetch(rt)
\ No newline at end of file
+    if isinstance(rt, ReturnType):
+        return rt
+    cached = _STR_CACHE.get(rt) if type(rt) is str else None
+    return cached if cached is not None else Fetch(rt)
\ No newline at end of file
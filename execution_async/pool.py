@@ -0,0 +1,163 @@
+"""
+Connection pooling for try_query.
+
+Opening an aiosqlite connection starts a worker thread and a SQLite handle;
+doing that per query dominates small statements. AsyncSqlitePool keeps a
+fixed set of connections to one database file and hands them out in turn.
+"""
+from __future__ import annotations
+import asyncio
+import inspect
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, List, Optional, Tuple
+
+import aiosqlite
+from aiosqlite import Connection, Cursor
+
+from .execution_async import try_query
+from .row_factory import type_converting_row_factory
+
+# Applied to every pooled connection when it is opened
+DEFAULT_POOL_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
+# sqlite3 keeps this many prepared statements per connection (its default is 128)
+DEFAULT_CACHED_STATEMENTS = 256
+
+_TRY_QUERY_SIGNATURE = inspect.signature(try_query)
+
+
+class AsyncSqlitePool:
+    """
+    A fixed-size pool of aiosqlite connections to a single database file.
+
+    Connections are opened by `open()` (or `async with pool:`) and returned
+    to the pool after each `acquire()`/`cursor()` block.
+
+    Note:
+        Every connection to ":memory:" is a separate database, so pools are
+        only meaningful for file-backed databases.
+
+    Examples:
+        >>> async with AsyncSqlitePool("app.db", size=4) as pool:
+        ...     rows = await try_query_pooled(pool, "SELECT * FROM users")
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        size: int = 4,
+        *,
+        row_factory: Optional[Callable] = type_converting_row_factory,
+        pragmas: Tuple[str, ...] = DEFAULT_POOL_PRAGMAS,
+        cached_statements: int = DEFAULT_CACHED_STATEMENTS,
+    ) -> None:
+        if not isinstance(size, int) or size < 1:
+            raise ValueError("Pool size must be a positive integer.")
+        self.db_path = db_path
+        self.size = size
+        self.row_factory = row_factory
+        self.pragmas = pragmas
+        self.cached_statements = cached_statements
+        self._connections: List[Connection] = []
+        self._idle: Optional[asyncio.Queue[Connection]] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._idle is not None
+
+    async def open(self) -> AsyncSqlitePool:
+        """Open `size` connections and apply the configured PRAGMAs."""
+        if self.is_open:
+            return self
+        idle: asyncio.Queue[Connection] = asyncio.Queue()
+        try:
+            for _ in range(self.size):
+                conn = await aiosqlite.connect(self.db_path, cached_statements=self.cached_statements)
+                self._connections.append(conn)
+                conn.row_factory = self.row_factory
+                for pragma in self.pragmas:
+                    await conn.execute(pragma)
+                idle.put_nowait(conn)
+        except BaseException:
+            await self._close_connections()
+            raise
+        self._idle = idle
+        return self
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        self._idle = None
+        await self._close_connections()
+
+    async def _close_connections(self) -> None:
+        connections, self._connections = self._connections, []
+        for conn in connections:
+            await conn.close()
+
+    async def __aenter__(self) -> AsyncSqlitePool:
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Connection]:
+        """Borrow a connection, waiting if all of them are in use."""
+        if self._idle is None:
+            raise RuntimeError("Pool is not open.")
+        idle = self._idle
+        conn = await idle.get()
+        try:
+            yield conn
+        finally:
+            idle.put_nowait(conn)
+
+    @asynccontextmanager
+    async def cursor(self) -> AsyncIterator[Cursor]:
+        """Borrow a connection and open a short-lived cursor on it."""
+        async with self.acquire() as conn:
+            async with conn.cursor() as cursor:
+                yield cursor
+
+
+async def try_query_pooled(
+    pool: AsyncSqlitePool,
+    query: str,
+    commit: bool = False,
+    injection_values: Optional[Any] = None,
+    *args,
+    **kwargs,
+) -> Optional[List[Any]]:
+    """
+    Run `try_query` on a cursor borrowed from `pool`.
+
+    Takes the same arguments as `try_query`, minus the cursor. The commit
+    goes through the pooled aiosqlite connection so it runs on that
+    connection's worker thread, and only if the query succeeded: on failure
+    the connection is rolled back, so a failed executemany leaves no rows.
+    """
+    async with pool.acquire() as conn:
+        if not commit:
+            async with conn.cursor() as cursor:
+                return await try_query(cursor, query, False, injection_values, *args, **kwargs)
+
+        bound = _TRY_QUERY_SIGNATURE.bind(None, query, False, injection_values, *args, **kwargs)
+        raise_on_fail = bound.arguments.get("raise_on_fail", False)
+        if not raise_on_fail and bound.arguments.get("error_message") is None:
+            # Keep try_query logging the failure as it would without raise_on_fail
+            bound.arguments["error_message"] = "Error executing query"
+        bound.arguments["raise_on_fail"] = True
+        try:
+            async with conn.cursor() as cursor:
+                bound.arguments["cursor"] = cursor
+                result = await try_query(*bound.args, **bound.kwargs)
+        except Exception:
+            await conn.rollback()
+            if raise_on_fail:
+                raise
+            return None
+        await conn.commit()
+        return result
@@ -5,12 +5,19 @@ This module provides row factory functions that handle automatic type conversion
 for SQLite query results, particularly useful for converting string representations
 of integers back to int type, which is needed for IntEnum construction.
 """
-from typing import Any, Tuple, Optional, Callable, Type
+from typing import Any, List, Tuple, Optional, Callable, Type
 import sqlite3
+from functools import lru_cache
+from weakref import WeakKeyDictionary
 
 # Constants for boolean string conversion
-FALSY_STRINGS = ('0', 'False', 'false', 'FALSE', '')
-TRUTHY_STRINGS = ('1', 'True', 'true', 'TRUE')
+FALSY_STRINGS = frozenset(('0', 'False', 'false', 'FALSE', ''))
+TRUTHY_STRINGS = frozenset(('1', 'True', 'true', 'TRUE'))
+# Both sets in one lookup table: str -> bool
+_BOOL_MAP = {**dict.fromkeys(FALSY_STRINGS, False), **dict.fromkeys(TRUTHY_STRINGS, True)}
+
+# Characters a convertible integer string can start with
+_INT_FIRST = frozenset('0123456789-')
 
 
 def convert_value(value: Any) -> Any:
@@ -53,23 +60,23 @@ def convert_value(value: Any) -> Any:
     if not isinstance(value, str):
         return value
     
-    # Skip empty strings
-    if not value:
+    # Skip empty strings, and in one set lookup every string that cannot
+    # start an integer (names, UUIDs, JSON, ...), which is most of them
+    if not value or value[0] not in _INT_FIRST:
         return value
     
-    # Try to convert to integer
-    try:
-        # Only convert if it looks like a decimal integer (no decimal point, no prefixes)
-        # This check is faster than trying int() conversion on complex strings
-        if '.' in value or value.startswith(('0x', '0X', '0o', '0O', '0b', '0B')):
-            return value
-            
-        int_value = int(value)
-        # Verify round-trip conversion to ensure we're not losing information
-        if str(int_value) == value:
-            return int_value
-    except (ValueError, OverflowError):
-        pass
+    # Classify with C-level str predicates instead of trying int() and
+    # round-tripping through str(): only the canonical decimal form that
+    # str(int) would produce is converted (ASCII digits, optional leading
+    # '-', no leading zeros, no '-0'). This rejects '.', '0x'/'0o'/'0b'
+    # prefixes, whitespace, '+' and underscores without calling int().
+    digits = value[1:] if value[0] == '-' else value
+    if digits.isdigit() and digits.isascii() and (digits[0] != '0' or value == '0'):
+        try:
+            return int(value)
+        except ValueError:
+            # Longer than sys.get_int_max_str_digits()
+            pass
     
     # If conversion failed or string doesn't match, return original
     return value
@@ -99,7 +106,42 @@ def type_converting_row_factory(cursor: sqlite3.Cursor, row: Tuple) -> Tuple:
         >>> cursor.fetchone()
         (0, 1, 'hello')
     """
-    return tuple(convert_value(value) for value in row)
+    return tuple(map(convert_value, row))
+
+
+def convert_rows(rows: List[Tuple]) -> List[Tuple]:
+    """
+    Batch variant of type_converting_row_factory for a whole fetchall() result.
+    
+    Works column by column: a column whose values contain no strings (INTEGER,
+    REAL, BLOB and NULL columns) is passed through without calling
+    convert_value per cell; only columns holding strings are converted.
+    Intended for connections without a row factory, where rows are plain tuples.
+    
+    Args:
+        rows: Plain row tuples, all of the same length.
+        
+    Returns:
+        A list of tuples with converted values.
+        
+    Examples:
+        >>> convert_rows([(1, '2', 'a'), (3, '4', 'b')])
+        [(1, 2, 'a'), (3, 4, 'b')]
+    """
+    if not rows:
+        return list(rows)
+    columns = list(zip(*rows))
+    for i, column in enumerate(columns):
+        # set(map(type, ...)) runs entirely in C
+        if str in set(map(type, column)):
+            columns[i] = tuple(map(convert_value, column))
+    return list(zip(*columns))
+
+
+# cursor -> (cursor.description, column names). sqlite3 keeps the same
+# description tuple for every row of a statement, so identity tells us when
+# the cursor has moved on to a new query.
+_field_names: "WeakKeyDictionary[sqlite3.Cursor, Tuple[Any, Tuple[str, ...]]]" = WeakKeyDictionary()
 
 
 def dict_row_factory(cursor: sqlite3.Cursor, row: Tuple) -> dict:
@@ -122,8 +164,12 @@ def dict_row_factory(cursor: sqlite3.Cursor, row: Tuple) -> dict:
         >>> cursor.fetchone()
         {'id': 0, 'name': 'hello'}
     """
-    fields = [column[0] for column in cursor.description]
-    return {key: convert_value(value) for key, value in zip(fields, row)}
+    description = cursor.description
+    cached = _field_names.get(cursor)
+    if cached is None or cached[0] is not description:
+        # First row of this cursor's current statement
+        cached = _field_names[cursor] = (description, tuple(column[0] for column in description))
+    return dict(zip(cached[1], map(convert_value, row)))
 
 
 def convert_value_with_type(value: Any, expected_type: Optional[Type]) -> Any:
@@ -165,10 +211,7 @@ def convert_value_with_type(value: Any, expected_type: Optional[Type]) -> Any:
     if expected_type is bool:
         # Convert string representations to bool
         if isinstance(value, str):
-            if value in FALSY_STRINGS:
-                return False
-            elif value in TRUTHY_STRINGS:
-                return True
+            return _BOOL_MAP.get(value, value)
         # Convert numeric types to bool
         elif isinstance(value, (int, float)):
             return bool(value)
@@ -211,16 +254,66 @@ def custom_row_factory(expected_types: Optional[Tuple[Optional[Type], ...]] = No
     if not expected_types:
         return type_converting_row_factory
     
-    def row_factory(cursor: sqlite3.Cursor, row: Tuple) -> Tuple:
-        """Custom row factory that applies expected types."""
-        result = []
-        for i, value in enumerate(row):
-            if i < len(expected_types):
-                # Apply expected type conversion
-                result.append(convert_value_with_type(value, expected_types[i]))
-            else:
-                # Use automatic conversion for remaining columns
-                result.append(convert_value(value))
-        return tuple(result)
-    
-    return row_factory
+    return _compile_row_factory(tuple(expected_types))
+
+
+# Pre-specialized converters used by the generated row factories
+
+
+def _conv_bool(value: Any) -> Any:
+    if type(value) is str:
+        return _BOOL_MAP.get(value, value)
+    return convert_value_with_type(value, bool)
+
+
+def _conv_int(value: Any) -> Any:
+    if value is None or isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return value
+
+
+@lru_cache(maxsize=128)
+def _compile_row_factory(expected_types: Tuple[Optional[Type], ...]) -> Callable:
+    """
+    Generate a straight-line row factory for a fixed tuple of expected types.
+    
+    Rows with exactly len(expected_types) columns go through one tuple display
+    that calls the right converter per index (or passes the value through for
+    None). Other row lengths fall back to the generic mapped version.
+    """
+    n_types = len(expected_types)
+    namespace: dict = {"_conv_bool": _conv_bool, "_conv_int": _conv_int}
+    cells = []
+    for i, expected_type in enumerate(expected_types):
+        if expected_type is None:
+            cells.append(f"row[{i}]")
+        elif expected_type is bool:
+            cells.append(f"_conv_bool(row[{i}])")
+        elif expected_type is int:
+            cells.append(f"_conv_int(row[{i}])")
+        else:
+            namespace[f"_t{i}"] = expected_type
+            cells.append(f"_convert(row[{i}], _t{i})")
+
+    def fallback(cursor: sqlite3.Cursor, row: Tuple) -> Tuple:
+        # Apply expected type conversion (map stops at the shorter of the two)
+        converted = tuple(map(convert_value_with_type, row, expected_types))
+        if len(row) > n_types:
+            # Use automatic conversion for remaining columns
+            converted += tuple(map(convert_value, row[n_types:]))
+        return converted
+
+    namespace["_convert"] = convert_value_with_type
+    namespace["_fallback"] = fallback
+    source = (
+        "def row_factory(cursor, row):\n"
+        "    \"\"\"Custom row factory that applies expected types.\"\"\"\n"
+        f"    if len(row) == {n_types}:\n"
+        f"        return ({', '.join(cells)},)\n"
+        "    return _fallback(cursor, row)\n"
+    )
+    exec(source, namespace)
+    return namespace["row_factory"]
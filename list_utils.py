@@ -1,7 +1,11 @@
 from __future__ import annotations
-from typing import Union
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple, Union
 
 class Full:
+    __slots__ = ("tag",)
+
     def __init__(self, tag: str = ""):
         tag = str(tag)
         self.tag = tag
@@ -12,6 +16,9 @@ class Full:
     def __repr__(self):
         return f"Full({self.tag})"
 class Interval:
+    # _repr caches (start, end, repr text); it is checked against the current
+    # bounds on use, so mutating start/end never yields a stale repr
+    __slots__ = ("start", "end", "_repr")
 
     def __init__(self, start: int, end: int):
         self.start = start
@@ -29,7 +36,16 @@ class Interval:
 
 
     def __repr__(self):
-        return f"Interval({self.start}, {self.end})"
+        start, end = self.start, self.end
+        try:
+            cached = self._repr
+            if cached[0] is start and cached[1] is end:
+                return cached[2]
+        except AttributeError:
+            pass
+        text = f"Interval({start}, {end})"
+        self._repr = (start, end, text)
+        return text
     def __str__(self):
         return f"[{self.start}, {self.end}]"
     def __eq__(self, other):
@@ -49,9 +65,11 @@ class Interval:
 
         Returns:
             bool: True if the integer is within the interval, False otherwise.
+
+        Note:
+            The item is not type-checked; values that do not compare with
+            int raise TypeError from the comparison itself.
         """
-        if not isinstance(item, int):
-            raise TypeError("Item must be an integer")
         return self.start <= item <= self.end
     def __add__(self, other: Interval) -> Interval | IntervalUnion:
         """
@@ -66,19 +84,14 @@ class Interval:
         """
         if not self.valid() or not other.valid():
             raise ValueError("Invalid interval to add")
-        if other.start in self:
-            if other.end in self:
-                return self
-            else:
-                return Interval(self.start, other.end)
-        elif other.end in self:
-            return Interval(other.start, self.end)
-        elif self.start in other:
-            if self.end in other:
-                return other
-            else:
-                return Interval(other.start, self.end)
-        return IntervalUnion(self, other)
+        bounds = _add_bounds(self.start, self.end, other.start, other.end)
+        if bounds is None:
+            return IntervalUnion(self, other)
+        if bounds == (self.start, self.end):
+            return self
+        if bounds == (other.start, other.end):
+            return other
+        return Interval(*bounds)
                 
     @staticmethod
     def flatten(*int_or_intervals: Union[int, Interval]) -> list:
@@ -91,32 +104,140 @@ class Interval:
         Returns:
             A list of integers.
         """
-        result = []
+        key = []
+        span = 0
         for item in int_or_intervals:
             if isinstance(item, int):
-                result.append(item)
+                key.append(item)
             elif isinstance(item, Interval):
-                result.extend(range(item.start, item.end + 1))
+                key.append((item.start, item.end))
+                span += item.end - item.start + 1
             else:
                 raise TypeError(f"Invalid argument type: {type(item)}")
-        return list(dict.fromkeys(result))  # Remove duplicates while preserving order
+        if span > _FLATTEN_CACHE_MAX_SPAN:
+            # Too large to keep in the cache; expand straight into the result
+            return _flatten_bounds(tuple(key))
+        return list(_flatten_cached(tuple(key)))
+
+
+# The caches are keyed on plain bounds rather than Interval objects, which are
+# mutable, and always hand back fresh objects.
+@lru_cache(maxsize=4096)
+def _add_bounds(start: int, end: int, other_start: int, other_end: int) -> Optional[Tuple[int, int]]:
+    """Bounds of the single interval covering both operands, or None if they do not overlap."""
+    if start <= other_start <= end:
+        return (start, max(end, other_end))
+    if start <= other_end <= end:
+        return (other_start, end)
+    if other_start <= start <= other_end:
+        return (other_start, max(end, other_end))
+    return None
+
+
+# Flatten results spanning more integers than this are not cached
+_FLATTEN_CACHE_MAX_SPAN = 4096
+
+
+def _flatten_bounds(key: Tuple[Union[int, Tuple[int, int]], ...]) -> list:
+    """
+    Expand ints and (start, end) bounds in order, skipping values already emitted.
+
+    Emitted values are tracked as sorted, disjoint [start, end] runs, so an
+    interval is expanded only over the parts not covered yet and nothing is
+    hashed per integer.
+    """
+    result: list = []
+    starts: list = []
+    ends: list = []
+    for item in key:
+        lo, hi = item if isinstance(item, tuple) else (item, item)
+        if lo > hi:
+            continue
+        # First run that could overlap or touch [lo, hi]
+        i = bisect_right(ends, lo - 2)
+        j = i
+        pos = lo
+        while j < len(starts) and starts[j] <= hi + 1:
+            if pos < starts[j]:
+                result.extend(range(pos, min(starts[j], hi + 1)))
+            pos = max(pos, ends[j] + 1)
+            j += 1
+        if pos <= hi:
+            result.extend(range(pos, hi + 1))
+        # Replace runs i..j-1 with their union with [lo, hi]
+        if j > i:
+            lo, hi = min(lo, starts[i]), max(hi, ends[j - 1])
+        starts[i:j] = [lo]
+        ends[i:j] = [hi]
+    return result
+
+
+@lru_cache(maxsize=256)
+def _flatten_cached(key: Tuple[Union[int, Tuple[int, int]], ...]) -> Tuple[int, ...]:
+    return tuple(_flatten_bounds(key))
+
+
+@lru_cache(maxsize=1024)
+def _merge_bounds(bounds: Tuple[Tuple[int, int], ...]) -> Tuple[Tuple[int, int], ...]:
+    """
+    Sort and merge (start, end) bounds into disjoint, non-adjacent runs.
+
+    Cached so that unions built repeatedly from the same predicate intervals
+    skip the sort and merge.
+    """
+    merged: list = []
+    for start, end in sorted(bounds):
+        if start > end:
+            continue
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return tuple(merged)
+
+
 class IntervalUnion:
+    """
+    A union of integer intervals.
+
+    The given intervals are sorted and merged on construction, so `intervals`
+    holds disjoint, non-adjacent, valid intervals in ascending order.
+    """
+    __slots__ = ("intervals", "_bounds", "_starts", "_ends", "_repr", "_str")
+
     def __init__(self, *intervals: Interval):
-        self.intervals = intervals
+        merged = _merge_bounds(tuple((interval.start, interval.end) for interval in intervals))
+        self.intervals = tuple(Interval(start, end) for start, end in merged)
+        self._bounds = merged
+        self._starts = [start for start, _ in merged]
+        self._ends = [end for _, end in merged]
+        self._repr = None
+        self._str = None
 
     def __repr__(self):
-        return f"IntervalUnion({self.intervals})"
+        if self._repr is None:
+            self._repr = f"IntervalUnion({self.intervals})"
+        return self._repr
+
+    def __eq__(self, other):
+        # Unions are canonical after merging, so equal coverage means equal bounds
+        if isinstance(other, IntervalUnion):
+            return self._bounds == other._bounds
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._bounds)
 
     def __str__(self):
-        return f"[{', '.join(map(str, self.intervals))}]"
+        if self._str is None:
+            self._str = f"[{', '.join(map(str, self.intervals))}]"
+        return self._str
 
     def __iter__(self):
-        seen = set()
+        # Merged intervals are disjoint, so no de-duplication is needed
         for interval in self.intervals:
-            for num in interval:
-                if num not in seen:
-                    seen.add(num)
-                    yield num
+            yield from range(interval.start, interval.end + 1)
 
     def iter_intervals(self):
         """
@@ -128,6 +249,29 @@ class IntervalUnion:
         for interval in self.intervals:
             yield interval
 
+    def contains_many(self, items: Iterable[int]) -> list[bool]:
+        """
+        Membership of many integers at once.
+
+        Equivalent to `[item in self for item in items]` without the per-item
+        type dispatch of `__contains__`.
+        """
+        starts, ends = self._starts, self._ends
+        result = []
+        append = result.append
+        for item in items:
+            idx = bisect_right(starts, item) - 1
+            append(idx >= 0 and item <= ends[idx])
+        return result
+
+    def _covers(self, start: int, end: int) -> bool:
+        """Whether a single merged interval contains [start, end]."""
+        starts, ends = self._starts, self._ends
+        # Outside the overall span: no search needed
+        if not starts or start < starts[0] or end > ends[-1]:
+            return False
+        return end <= ends[bisect_right(starts, start) - 1]
+
     def __contains__(self, item: int | Interval | IntervalUnion) -> bool:
         """
         Check if:
@@ -143,18 +287,25 @@ class IntervalUnion:
         """
         # Case 1: integer membership
         if isinstance(item, int):
-            return any(item in interval for interval in self.intervals)
+            return self._covers(item, item)
 
         # Case 2: Interval membership (subset check)
         elif isinstance(item, Interval):
             if not item.valid():
                 raise ValueError("Invalid interval to check")
-            # Ensure every point in the interval is in the union
-            return all(x in self for x in item)
+            return self._covers(item.start, item.end)
 
         # Case 3: IntervalUnion membership (subset of this union)
         elif isinstance(item, IntervalUnion):
-            return all(interval in self for interval in item.iter_intervals())
+            # Both sides are sorted and disjoint: one forward walk over self
+            starts, ends = self._starts, self._ends
+            i, n = 0, len(starts)
+            for start, end in zip(item._starts, item._ends):
+                while i < n and ends[i] < start:
+                    i += 1
+                if i == n or starts[i] > start or end > ends[i]:
+                    return False
+            return True
 
         # Unsupported type
         raise TypeError("Item must be int, Interval, or IntervalUnion")
@@ -1,10 +1,20 @@
 from typing import Any
 from datetime import datetime
-from typing import Union, List, Tuple
+from typing import Dict, Union, List, Tuple
 class Unknown:
     __slots__ = ("name",)
+    _interned: Dict[str, "Unknown"] = {}
+
     def __init__(self, name: str):
         self.name = name
+
+    @classmethod
+    def of(cls, name: str) -> "Unknown":
+        """Shared Unknown instance for `name`, so it can be checked with `is`."""
+        instance = cls._interned.get(name)
+        if instance is None:
+            instance = cls._interned[name] = cls(name)
+        return instance
     def __repr__(self):
         return f"<Unknown: {self.name}>"
     def __eq__(self, other):
@@ -17,6 +27,10 @@ class Unknown:
         return f'Unknown({self.name})'
 
 
+# Default ExecutionLog result
+UNKNOWN_RESULT = Unknown.of("Result")
+
+
 def is_unknown(value: Any) -> bool:
     """
     Check if the value is an instance of Unknown.
@@ -27,7 +41,7 @@ def is_unknown(value: Any) -> bool:
     Returns:
         bool: True if the value is an instance of Unknown, False otherwise.
     """
-    return isinstance(value, Unknown)
+    return value is UNKNOWN_RESULT or isinstance(value, Unknown)
 
 def none_or_unknown(value: Any) -> bool:
     """
@@ -39,18 +53,43 @@ def none_or_unknown(value: Any) -> bool:
     Returns:
         bool: True if the value is None or an instance of Unknown, False otherwise.
     """
-    return value is None or is_unknown(value)
+    return value is None or value is UNKNOWN_RESULT or isinstance(value, Unknown)
+
+def _freeze(value: Any) -> Any:
+    """Hashable stand-in for query parameters (lists/dicts of values)."""
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_freeze, value))
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
 
 class ExecutionLog:
-    __slots__ = ("path","query", "params", "return_type", "result")
-    def __init__(self, path:str, query: str, params: Union[tuple, List[tuple]], return_type: str, result: Any = Unknown("Result")):
+    """
+    Record of one executed query.
+
+    Records are treated as immutable once built: the hash covers path, query,
+    params and return_type and is computed once, so instances can key
+    dict/set based dedup or memo tables. `result` takes part in equality
+    but not in the hash.
+    """
+    __slots__ = ("path","query", "params", "return_type", "result", "_hash", "_repr_head")
+    def __init__(self, path:str, query: str, params: Union[tuple, List[tuple]], return_type: str, result: Any = UNKNOWN_RESULT):
         self.path = path
         self.query = query
         self.params = params
         self.return_type = return_type
         self.result = result
+        self._hash = None
+        self._repr_head = None
     def __repr__(self):
-        return f"ExecutionLog({self.path!r}, {self.query!r}, {self.params!r}, {self.return_type!r}, {self.result!r})"
+        # Everything but the result is formatted once; result may still change
+        if self._repr_head is None:
+            self._repr_head = f"ExecutionLog({self.path!r}, {self.query!r}, {self.params!r}, {self.return_type!r}, "
+        return f"{self._repr_head}{self.result!r})"
     def __str__(self):
         return (f"ExecutionLog("
                 f"path={self.path!r}, "
@@ -65,13 +104,14 @@ class ExecutionLog:
             "return_type": self.return_type,
             "result": str(self.result)
         }
+    def _key(self) -> tuple:
+        return (self.path, self.query, self.params, self.return_type, self.result)
+
     def __eq__(self, other):
-        if not isinstance(other, ExecutionLog):
-            return False
-        return (
-            self.path == other.path and
-            self.query == other.query and
-            self.params == other.params and
-            self.return_type == other.return_type and
-            self.result == other.result
-        )
+        # One C-level tuple comparison instead of five chained attribute compares
+        return isinstance(other, ExecutionLog) and self._key() == other._key()
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash((self.path, self.query, _freeze(self.params), _freeze(self.return_type)))
+        return self._hash
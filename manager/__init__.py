@@ -18,34 +18,41 @@ are also exported for advanced/custom integrations, but the recommended
 entry point is `Manager`.
 """
 
-from .manager import Manager            # High-level manager facade
-from .manager_base import ManagerBase    # Core implementation
-
-from .transaction import Transaction     # Transaction context manager
-
-from .history import (
-    HistoryManager,
-    default_history_format_function,
-)
-
-from .dbpathdict import (
-    PathConnection,
-    DbPathDict,
-)
-
-from .exceptions import (
-    AsyncSQLiteError,
-    ConnectionError,
-    TransactionError,
-    HistoryError,
-)
-
-from .types import (
-    QueryParams,
-    QueryResult,
-    HistoryItem,
-)
-AsyncSQLiteManager = Manager
+import importlib
+
+# Exported name -> (submodule, attribute). Submodules are imported on first
+# access (PEP 562) so importing the package stays cheap.
+_LAZY = {
+    "Manager": (".manager", "Manager"),                # High-level manager facade
+    "AsyncSQLiteManager": (".manager", "Manager"),
+    "ManagerBase": (".manager_base", "ManagerBase"),   # Core implementation
+    "Transaction": (".transaction", "Transaction"),    # Transaction context manager
+    "HistoryManager": (".history", "HistoryManager"),
+    "default_history_format_function": (".history", "default_history_format_function"),
+    "PathConnection": (".dbpathdict", "PathConnection"),
+    "DbPathDict": (".dbpathdict", "DbPathDict"),
+    "AsyncSQLiteError": (".exceptions", "AsyncSQLiteError"),
+    "ConnectionError": (".exceptions", "ConnectionError"),
+    "TransactionError": (".exceptions", "TransactionError"),
+    "HistoryError": (".exceptions", "HistoryError"),
+    "QueryParams": (".types", "QueryParams"),
+    "QueryResult": (".types", "QueryResult"),
+    "HistoryItem": (".types", "HistoryItem"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 __all__ = [
     # Main entry points
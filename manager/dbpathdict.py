@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Optional, Literal
+from typing import Iterable, Optional, Literal
 from aiosqlite import Connection as AioConnection
 
 
@@ -9,13 +9,16 @@ class PathConnection:
     allowing for optional aliasing and management of the connection in dictionaries.
     
     Supports separate read and write connections for improved concurrency.
+    Reads can be spread over a pool of read connections (`read_conns`), which
+    `get_conn("read")` hands out round-robin; `read_conn` is the first of them.
     The `conn` property is an alias for `write_conn` for backwards compatibility.
     
     Attributes:
         path (str): The file path to the database.
         alias (Optional[str]): An optional alias for the connection.
         write_conn (AioConnection): The write connection object.
-        read_conn (Optional[AioConnection]): The read connection object.
+        read_conn (Optional[AioConnection]): The first read connection, if any.
+        read_conns (list[AioConnection]): All read connections.
         conn (AioConnection): Alias for write_conn (backwards compatibility).
     Methods:
         get_conn(mode: str) -> Optional[AioConnection]:
@@ -29,19 +32,59 @@ class PathConnection:
         __bool__() -> bool:
             Returns True if the path attribute is non-empty, otherwise False.
     """
-    
+    # _repr caches (fields, repr text); it is reused only while the fields are unchanged.
+    # _conns is (write connection, first read connection or write fallback) for get_conn.
+    # _read_index is the position of the last read connection handed out.
+    __slots__ = ("path", "alias", "_write_conn", "_read_conns", "_read_index", "_conns", "_repr")
 
     def __init__(
         self,
         path: str,
         write_conn: AioConnection,
         read_conn: Optional[AioConnection] = None,
-        alias: Optional[str] = None
+        alias: Optional[str] = None,
+        *,
+        read_conns: Optional[Iterable[AioConnection]] = None,
     ) -> None:
+        if read_conn is not None and read_conns is not None:
+            raise ValueError("Pass either read_conn or read_conns, not both.")
         self.path = path
         self.alias = alias
-        self.write_conn = write_conn
-        self.read_conn = read_conn
+        self._write_conn = write_conn
+        self._read_conns: tuple[AioConnection, ...] = ()
+        self._repr = None
+        if read_conns is not None:
+            self.read_conns = read_conns
+        else:
+            self.read_conn = read_conn
+
+    @property
+    def write_conn(self) -> AioConnection:
+        return self._write_conn
+
+    @write_conn.setter
+    def write_conn(self, value: AioConnection) -> None:
+        self._write_conn = value
+        self._conns = (value, self._read_conns[0] if self._read_conns else value)
+
+    @property
+    def read_conn(self) -> Optional[AioConnection]:
+        return self._read_conns[0] if self._read_conns else None
+
+    @read_conn.setter
+    def read_conn(self, value: Optional[AioConnection]) -> None:
+        self.read_conns = () if value is None else (value,)
+
+    @property
+    def read_conns(self) -> list[AioConnection]:
+        """All read connections, in round-robin order."""
+        return list(self._read_conns)
+
+    @read_conns.setter
+    def read_conns(self, value: Iterable[AioConnection]) -> None:
+        self._read_conns = tuple(value)
+        self._read_index = -1
+        self._conns = (self._write_conn, self._read_conns[0] if self._read_conns else self._write_conn)
 
     @property
     def conn(self) -> AioConnection:
@@ -62,14 +105,22 @@ class PathConnection:
             
         Returns:
             The connection for the specified mode.
-            For "read" mode, falls back to write_conn if read_conn is None.
+            For "read" mode, the read connections are handed out round-robin;
+            falls back to write_conn if there are none.
         """
-        if mode == "read":
-            return self.read_conn if self.read_conn is not None else self.write_conn
-        return self.write_conn
+        if mode != "read" or len(self._read_conns) < 2:
+            return self._conns[mode == "read"]
+        self._read_index = index = (self._read_index + 1) % len(self._read_conns)
+        return self._read_conns[index]
 
     def __repr__(self) -> str:
-        return f"PathConnection(path={self.path}, alias={self.alias}, write_conn={self.write_conn}, read_conn={self.read_conn})"
+        fields = (self.path, self.alias, self._write_conn, self._read_conns)
+        cached = self._repr
+        if cached is not None and all(a is b for a, b in zip(cached[0], fields)):
+            return cached[1]
+        text = f"PathConnection(path={self.path}, alias={self.alias}, write_conn={self.write_conn}, read_conn={self.read_conn})"
+        self._repr = (fields, text)
+        return text
 
     def __eq__(self, value) -> bool:
         return isinstance(value, PathConnection) and self.path == value.path
@@ -87,7 +138,7 @@ class DbPathDict:
     allowing access to SQLite connections via paths or aliases.
 
     Attributes:
-        path_connections (Set[PathConnection]): A set of PathConnection instances.
+        path_connections (Set[PathConnection]): A set of PathConnection instances (built on access).
 
     Methods:
         get_path_connection(path_or_alias: str) -> Optional[PathConnection]:
@@ -113,9 +164,15 @@ class DbPathDict:
     """
 
     def __init__(self) -> None:
-        self.path_connections: set[PathConnection] = set()
+        # path -> PathConnection, in registration order; the primary store
+        self._by_path: dict[str, PathConnection] = {}
         self._key_to_pc: dict[str, PathConnection] = {}
 
+    @property
+    def path_connections(self) -> set[PathConnection]:
+        """All registered PathConnections."""
+        return set(self._by_path.values())
+
     def _update_key_mapping(self, pc: PathConnection) -> None:
         """Update the key-to-PathConnection mapping for a PathConnection."""
         self._key_to_pc[pc.path] = pc
@@ -168,8 +225,20 @@ class DbPathDict:
         if not key:
             raise ValueError("Path/alias cannot be empty.")
 
+    @staticmethod
+    def _check_str_key(key: str) -> None:
+        """
+        Check that a key that cannot be a PathConnection is a non-empty string.
+        Hot paths inline this check and only call it to raise.
+        """
+        if not isinstance(key, str):
+            raise ValueError("Key must be a string.")
+        if not key:
+            raise ValueError("Path/alias cannot be empty.")
+
     def __getitem__(self, key: str) -> PathConnection:
-        self._check_key(key)
+        if type(key) is not str or not key:
+            self._check_str_key(key)
         pc = self._key_to_pc.get(key)
         if pc is None:
             raise KeyError(f"No connection for '{key}'.")
@@ -213,25 +282,39 @@ class DbPathDict:
 
         # Try to update existing PathConnection
         preserved_alias = None
-        for pc in list(self.path_connections):
-            if key == pc.path or key == pc.alias or (isinstance(key, PathConnection) and key.path == pc.path):
-                self._remove_key_mapping(pc)
-                self.path_connections.remove(pc)
-                # Preserve alias if not specified in new_pc
-                if new_pc.alias is None and pc.alias is not None:
-                    preserved_alias = pc.alias
-                break
-
-        # If we need to preserve an alias, create a new PathConnection with it
-        if preserved_alias is not None:
+        if isinstance(key, PathConnection):
+            pc = self._key_to_pc.get(key.path)
+            if pc is not None and pc.path != key.path:
+                pc = None
+        else:
+            pc = self._key_to_pc.get(key)
+        if pc is not None:
+            self._by_path.pop(pc.path, None)
+            # Preserve alias if not specified in new_pc
+            if new_pc.alias is None and pc.alias is not None:
+                preserved_alias = pc.alias
+
+        # If we need to preserve an alias, set it on the PathConnection built
+        # above, or on a copy so a caller-supplied one is left untouched
+        if preserved_alias is not None and new_pc is not value:
+            new_pc.alias = preserved_alias
+        elif preserved_alias is not None:
             new_pc = PathConnection(
                 path=new_pc.path,
                 write_conn=new_pc.write_conn,
-                read_conn=new_pc.read_conn,
-                alias=preserved_alias
+                alias=preserved_alias,
+                read_conns=new_pc.read_conns,
             )
 
-        self.path_connections.add(new_pc)
+        # Drop only the old keys the new entry does not reuse; the rest are
+        # overwritten by _update_key_mapping
+        if pc is not None:
+            reused = (new_pc.path, new_pc.alias)
+            for old_key in (pc.path, pc.alias):
+                if old_key and old_key not in reused:
+                    self._key_to_pc.pop(old_key, None)
+
+        self._by_path[new_pc.path] = new_pc
         self._update_key_mapping(new_pc)
 
     def __delitem__(self, key: str | PathConnection) -> None:
@@ -241,17 +324,12 @@ class DbPathDict:
         self._check_key(key)
         search_key = key.path if isinstance(key, PathConnection) else key
         
-        to_remove = None
-        for pc in self.path_connections:
-            if search_key == pc.path or search_key == pc.alias:
-                to_remove = pc
-                break
-
+        to_remove = self._key_to_pc.get(search_key)
         if to_remove is None:
             raise KeyError(f"Database path or alias '{search_key}' not found.")
 
         self._remove_key_mapping(to_remove)
-        self.path_connections.remove(to_remove)
+        del self._by_path[to_remove.path]
 
     def setalias(self, key: str, new_alias: Optional[str]) -> None:
         """
@@ -265,9 +343,11 @@ class DbPathDict:
             KeyError: If the key is not found or new_alias already exists.
             ValueError: If new_alias is an invalid string.
         """
-        self._check_key(key)
+        if type(key) is not str or not key:
+            self._check_str_key(key)
         if new_alias is not None:
-            self._check_key(new_alias)
+            if type(new_alias) is not str or not new_alias:
+                self._check_str_key(new_alias)
             if new_alias in self._key_to_pc:
                 raise KeyError(f"Alias '{new_alias}' already exists.")
 
@@ -291,8 +371,10 @@ class DbPathDict:
         Change the path for an existing PathConnection.
         The old key can be a path or alias. The new path must be unused.
         """
-        self._check_key(old_key)
-        self._check_key(new_path)
+        if type(old_key) is not str or not old_key:
+            self._check_str_key(old_key)
+        if type(new_path) is not str or not new_path:
+            self._check_str_key(new_path)
 
         if new_path in self._key_to_pc:
             raise KeyError(f"New path '{new_path}' already exists.")
@@ -305,10 +387,10 @@ class DbPathDict:
 
         # Update internal state
         self._remove_key_mapping(target)
-        self.path_connections.remove(target)
+        del self._by_path[target.path]
 
         target.path = new_path
-        self.path_connections.add(target)
+        self._by_path[new_path] = target
         self._update_key_mapping(target)
 
     @property
@@ -316,4 +398,4 @@ class DbPathDict:
         """
         Get a list of all paths in the dictionary.
         """
-        return [pc.path for pc in self.path_connections]
\ No newline at end of file
+        return list(self._by_path)
\ No newline at end of file
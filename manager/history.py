@@ -1,26 +1,20 @@
 from __future__ import annotations
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Iterable
 from .types import HistoryItem
 from ..cloggable_list import CloggableList
 from ..async_history_dump import AsyncHistoryDump, AsyncHistoryDumpGenerator
+from itertools import repeat
 import asyncio
 
 def default_history_format_function(history: HistoryItem) -> str:
     """
     Default function to format history entries for dumping.
     """
+    timestamp = history.get("timestamp", "no timestamp")
     query, path = history["query"], history["path"]
     if query == "COMMIT":
-        return f"[{history['timestamp']}]({path}) : COMMIT\n"
-
-    params, results = history["params"], history["result"]
-    timestamp = history.get("timestamp", "no timestamp")
-    return (
-        f"[{timestamp}]({path})\n"
-        f"{query}\n"
-        f"Input: {params}\n"
-        f"Output: {results}\n"
-    )
+        return f"[{timestamp}]({path}) : COMMIT\n"
+    return f"[{timestamp}]({path})\n{query}\nInput: {history['params']}\nOutput: {history['result']}\n"
 
 class HistoryManager:
     """
@@ -33,8 +27,18 @@ class HistoryManager:
         history_tolerance: Optional[int] = 5,
         history_dump_generator: Optional[AsyncHistoryDumpGenerator] = None,
         history_format_function: Callable[[HistoryItem], Any] = default_history_format_function,
+        *,
+        single_writer: bool = False,
     ) -> None:
+        """
+        Args:
+            single_writer: Append without taking the history lock. Only safe when
+                a single coroutine appends at a time, e.g. when every query goes
+                through one serialized queue.
+        """
         
+        self._history: Optional[CloggableList] = None
+        self._enabled = False
         self.history_format_function = history_format_function
         self.history_dump_generator = history_dump_generator
         
@@ -52,6 +56,8 @@ class HistoryManager:
         self._history_length = history_length
         self._history_tolerance = history_tolerance
         self._history_lock = asyncio.Lock()
+        self.single_writer = single_writer
+        self._update_enabled()
 
     @staticmethod
     def _validate_none_or_non_neg_int(value: Optional[int]) -> Optional[int]:
@@ -60,18 +66,71 @@ class HistoryManager:
             raise ValueError("Value must be a non-negative integer or None")
         return value
 
-    async def append(self, item: HistoryItem) -> None:
-        """Append an item to history."""
-        if not self.history or not self.history_dump_generator:
+    def _update_enabled(self) -> None:
+        self._enabled = self._history is not None and self._history_dump_generator is not None
+
+    @property
+    def history_enabled(self) -> bool:
+        """Whether appended items are recorded (history buffer and dump generator are both set)."""
+        return self._enabled
+
+    async def append(self, item: HistoryItem, *, at: Optional[float] = None) -> None:
+        """
+        Append an item to history.
+
+        `at` is when the item happened (time.time()), for the dump generator's
+        timestamp; defaults to now.
+        """
+        if not self._enabled:
+            return
+        if self.single_writer:
+            await self._append_unlocked(item, at)
             return
 
         async with self._history_lock:
-            dump = self.history_dump_generator.create(item)
-            if isinstance(dump.data, dict):
-                dump.data = self.history_format_function(dump.data)
+            await self._append_unlocked(item, at)
+
+    async def _append_unlocked(self, item: HistoryItem, at: Optional[float] = None) -> None:
+        dump = self.history_dump_generator.create(item, at=at)
+        if isinstance(dump.data, dict):
+            dump.data = self.history_format_function(dump.data)
 
-            full = self.history.append(dump)
-            if full:
+        full = self.history.append(dump)
+        if full:
+            await self.flush_to_file()
+
+    async def append_many(
+        self,
+        items: Iterable[HistoryItem],
+        *,
+        times: Optional[Iterable[Optional[float]]] = None,
+    ) -> None:
+        """
+        Append several items to history under a single lock acquisition.
+
+        History is flushed whenever it fills up, as with `append`. `times`
+        gives each item's `at` time, in the same order.
+        """
+        if not self._enabled:
+            return
+        if self.single_writer:
+            await self._append_many_unlocked(items, times)
+            return
+        async with self._history_lock:
+            await self._append_many_unlocked(items, times)
+
+    async def _append_many_unlocked(
+        self,
+        items: Iterable[HistoryItem],
+        times: Optional[Iterable[Optional[float]]] = None,
+    ) -> None:
+        history, generator = self.history, self.history_dump_generator
+        format_function = self.history_format_function
+        for item, at in zip(items, repeat(None) if times is None else times):
+            dump = generator.create(item, at=at)
+            if isinstance(dump.data, dict):
+                dump.data = format_function(dump.data)
+            if history.append(dump):
                 await self.flush_to_file()
 
     async def flush_to_file(self) -> None:
@@ -92,6 +151,7 @@ class HistoryManager:
             raise ValueError("history must be a CloggableList or None")
         self._history = value
         self._history_length = value.max_length if value is not None else None
+        self._update_enabled()
 
     @property
     def history_length(self) -> Optional[int]:
@@ -129,4 +189,5 @@ class HistoryManager:
     def history_dump_generator(self, value: Optional[AsyncHistoryDumpGenerator]) -> None:
         if value is not None and not isinstance(value, AsyncHistoryDumpGenerator):
             raise ValueError("history_dump must be a AsyncHistoryDumpGenerator instance or None")
-        self._history_dump_generator = value
\ No newline at end of file
+        self._history_dump_generator = value
+        self._update_enabled()
\ No newline at end of file
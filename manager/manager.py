@@ -1,5 +1,6 @@
 from __future__ import annotations
 from contextlib import asynccontextmanager
+from functools import wraps
 from .transaction import Transaction
 from .history import default_history_format_function
 from typing import Optional, Callable, Any
@@ -23,6 +24,10 @@ class Manager(ManagerBase):
         *,
         history_tolerance: Optional[int] = 5,
         history_format_function: Callable[[dict], Any] = default_history_format_function,
+        cached_statements: int = 256,
+        read_pool_size: int = 1,
+        history_single_writer: bool = False,
+        init_pragmas: Optional[str] = None,
     ) -> None:
 
         super().__init__(
@@ -34,16 +39,36 @@ class Manager(ManagerBase):
             history_dump_generator=history_dump_generator,
             history_tolerance=history_tolerance,
             history_format_function=history_format_function,
+            cached_statements=cached_statements,
+            read_pool_size=read_pool_size,
+            history_single_writer=history_single_writer,
+            init_pragmas=init_pragmas,
         )
 
 
     @asynccontextmanager
-    async def queue(self, db_path: str):
+    async def write_queue(self, db_path: str):
         """Serialize all queries and transactions for this database path."""
-        lock = self._get_lock(db_path)
+        # Existing locks are a single dict lookup; _get_lock only creates missing ones
+        lock = self._locks.get(db_path) or self._get_lock(db_path)
         async with lock:
             yield
 
+    queue = write_queue
+
+    @asynccontextmanager
+    async def read_queue(self, db_path: str):
+        """
+        Limit concurrent readers of this database path to `read_pool_size`.
+
+        Does not take the write lock, so reads on the read connections run
+        alongside writes (SQLite's WAL journal mode lets readers proceed while
+        a write is in progress).
+        """
+        semaphore = self._read_semaphores.get(db_path) or self._get_read_semaphore(db_path)
+        async with semaphore:
+            yield
+
     @asynccontextmanager
     async def safe_transaction(self, db_path: str, **kw):
         """Transaction that automatically acquires the per-DB lock."""
@@ -57,21 +82,24 @@ class Manager(ManagerBase):
             await self.close(db_path)
 
     async def shutdown(self) -> None:
-        await self.disconnect_all()
-        await self.flush_history_to_file()
+        await self.aclose()
         if self.logger:
             self.logger.info("Manager instance shut down.")
 
     # Decorator for transactions
     @staticmethod
     def with_transaction(db_path: str, *, autocommit=True, log_all=False):
+        """
+        Run the decorated coroutine inside a Transaction on `db_path`.
+
+        The first argument of the decorated function must be the Manager
+        (i.e. `self` for Manager methods); it is passed through unchanged.
+        """
         def decorator(func):
+            @wraps(func)
             async def wrapper(self: Manager, *args, **kwargs):
-                self_or_manager = args[0]
-                manager = self_or_manager if isinstance(self_or_manager, Manager) else self
-
-                async with manager.Transaction(db_path, autocommit, log_all):
-                    return await func(*args, **kwargs)
+                async with self.Transaction(db_path, autocommit, log_all):
+                    return await func(self, *args, **kwargs)
             return wrapper
         return decorator
 
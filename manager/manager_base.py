@@ -3,6 +3,9 @@ from aiosqlite import connect, Connection as AioConnection, Cursor as AioCursor
 from contextlib import asynccontextmanager
 import asyncio
 import re
+import time
+from collections import deque
+from functools import lru_cache
 from .history import HistoryManager, default_history_format_function
 from .dbpathdict import DbPathDict, PathConnection
 from .types import QueryParams, QueryResult, HistoryItem
@@ -10,8 +13,9 @@ from .exceptions import ConnectionError
 
 from ..execution_async import try_query
 from ..execution_async.row_factory import type_converting_row_factory, custom_row_factory
+from ..execution_async.fetch_types import normalize_return_type
 from ..log import ExecutionLog
-from typing import Optional, Callable, Any, Dict, Union, List, Literal, Tuple, Type
+from typing import Optional, Callable, Any, Dict, FrozenSet, Iterable, Union, List, Literal, Tuple, Type
 from logging import Logger, getLogger as logging_getLogger
 
 from ..async_history_dump import AsyncHistoryDumpGenerator
@@ -19,6 +23,68 @@ from ..async_history_dump import AsyncHistoryDumpGenerator
 # Regex for validating savepoint names to prevent SQL injection
 _VALID_SAVEPOINT_NAME = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
 
+
+def _control_item(path: str, query: str) -> HistoryItem:
+    """History entry for a COMMIT or ROLLBACK on `path`."""
+    return {"path": path, "query": query, "params": None, "timestamp": None, "result": None}
+
+
+def _is_memory_db(path: str) -> bool:
+    """Whether `path` names an in-memory database; every connection to one opens its own copy."""
+    return path == ":memory:" or (
+        path.startswith("file:") and (path.startswith("file::memory:") or "mode=memory" in path)
+    )
+
+
+def _fetches_all(return_type: Any) -> bool:
+    """Whether `return_type` reads every row of the result."""
+    try:
+        return normalize_return_type(return_type).type == "fetchall"
+    except (TypeError, ValueError):
+        return False
+
+
+@lru_cache(maxsize=256)
+def _savepoint_sql(name: str) -> Tuple[str, str, str]:
+    """
+    Validate `name` and build its (SAVEPOINT, ROLLBACK TO, RELEASE SAVEPOINT) statements.
+
+    Cached so repeated savepoint names reuse the same validated strings.
+    """
+    ManagerBase._validate_savepoint_name(name)
+    return (f"SAVEPOINT {name}", f"ROLLBACK TO {name}", f"RELEASE SAVEPOINT {name}")
+
+
+# Applied once to every connection the manager opens
+CONNECTION_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA foreign_keys=ON",
+)
+# Applied in addition on read connections
+READ_CONNECTION_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA query_only=ON",
+)
+# Bits of ManagerBase._flags, the packed configuration switches checked per query
+_FLAG_AUTOCOMMIT = 1
+_FLAG_OMNI_LOG = 2
+_FLAG_LOG_RESULTS = 4
+
+# Most queued writes a writer task runs (and commits) as one batch
+MAX_COALESCE = 256
+
+# First four letters of the statements that mode="auto" sends to a read connection
+# (SELECT, EXPLAIN). WITH is left out because a CTE can lead into INSERT, UPDATE
+# or DELETE; PRAGMA because it may change settings that belong on the write connection.
+_READ_QUERY_PREFIXES: FrozenSet[str] = frozenset({"SELE", "EXPL"})
+
+# CONNECTION_PRAGMAS as one script, so a new connection is set up in a single round trip
+_PRAGMA_BOOTSTRAP = "".join(f"{pragma};\n" for pragma in CONNECTION_PRAGMAS)
+_READ_PRAGMA_BOOTSTRAP = "".join(f"{pragma};\n" for pragma in READ_CONNECTION_PRAGMAS)
+
 class ManagerBase:
 
     def __init__(
@@ -32,13 +98,26 @@ class ManagerBase:
         *,
         history_tolerance: Optional[int] = 5,
         history_format_function: Callable[[dict], Any] = default_history_format_function,
+        cached_statements: int = 256,
+        read_pool_size: int = 1,
+        history_single_writer: bool = False,
+        init_pragmas: Optional[str] = None,
     ) -> None:
+        if not isinstance(read_pool_size, int) or read_pool_size < 1:
+            raise ValueError("read_pool_size must be a positive integer.")
 
         self._db_dict: DbPathDict = DbPathDict()
+        self._flags = 0
         self.autocommit = autocommit
         self.omni_log = omni_log
         self.log_results = log_results
         self.logger = logger or logging_getLogger(__name__)
+        # Size of sqlite3's per-connection prepared statement cache
+        self.cached_statements = cached_statements
+        # Read connections opened per database when a read connection is requested
+        self.read_pool_size = read_pool_size
+        # PRAGMA script run once on every new connection; None uses CONNECTION_PRAGMAS
+        self.init_pragmas = init_pragmas
 
         # Initialize history manager
         self._history_manager = HistoryManager(
@@ -46,12 +125,90 @@ class ManagerBase:
             history_tolerance=history_tolerance,
             history_dump_generator=history_dump_generator,
             history_format_function=history_format_function,
+            single_writer=history_single_writer,
         )
 
         self._locks: dict[str, asyncio.Lock] = {}
+        self._read_semaphores: dict[str, asyncio.Semaphore] = {}
+        # History items waiting for the background flusher (see _append_history)
+        self._pending_history: deque[Union[HistoryItem, Tuple[Any, ...]]] = deque()
+        self._history_event: Optional[asyncio.Event] = None
+        self._history_flusher: Optional[asyncio.Task] = None
+        # The flusher's current _drain_history run, awaited before history is flushed
+        self._history_drain: Optional[asyncio.Task] = None
+        # connection -> (reused cursor, lock held from execute to fetch)
+        self._cursors: dict[AioConnection, Tuple[AioCursor, asyncio.Lock]] = {}
+        # db_path -> (queue of submitted writes, writer task); see submit()
+        self._writers: dict[str, Tuple[asyncio.Queue, asyncio.Task]] = {}
     # Connection Management
     def _get_lock(self, db_path: str) -> asyncio.Lock:
-        return self._locks.setdefault(db_path, asyncio.Lock())
+        lock = self._locks.get(db_path)
+        if lock is None:
+            lock = self._locks[db_path] = asyncio.Lock()
+        return lock
+
+    def _get_read_semaphore(self, db_path: str) -> asyncio.Semaphore:
+        semaphore = self._read_semaphores.get(db_path)
+        if semaphore is None:
+            semaphore = self._read_semaphores[db_path] = asyncio.Semaphore(self.read_pool_size)
+        return semaphore
+
+    async def _configure_connection(self, conn: AioConnection, *, read_only: bool) -> None:
+        """
+        Apply the connection PRAGMAs to a newly opened connection.
+
+        Called once per connection; existing connections returned by `connect`
+        are not reconfigured. Runs `init_pragmas` (or CONNECTION_PRAGMAS) as a
+        single script. Override to change the setup.
+        """
+        script = _PRAGMA_BOOTSTRAP if self.init_pragmas is None else self.init_pragmas
+        if read_only:
+            # The separator also terminates a custom script's last statement
+            script = f"{script};\n{_READ_PRAGMA_BOOTSTRAP}"
+        if script:
+            await conn.executescript(script)
+
+    async def _open_conn(self, db_path: str, *, read_only: bool = False) -> AioConnection:
+        """Open and configure one connection to `db_path`."""
+        conn = await connect(db_path, cached_statements=self.cached_statements)
+        try:
+            conn.row_factory = type_converting_row_factory
+            await self._configure_connection(conn, read_only=read_only)
+        except BaseException:
+            await conn.close()
+            raise
+        return conn
+
+    async def _shared_cursor(self, conn: AioConnection) -> Tuple[AioCursor, asyncio.Lock]:
+        """
+        Get the cursor reused by `execute` on `conn`, creating it on first use.
+
+        Hold the returned lock from execute until the results are fetched, and
+        only use it for statements that are run to completion (fetchall or no
+        rows): a partly read statement stays open on the cursor.
+        """
+        entry = self._cursors.get(conn)
+        if entry is None:
+            cursor = await conn.cursor()
+            entry = self._cursors.setdefault(conn, (cursor, asyncio.Lock()))
+            if entry[0] is not cursor:
+                await cursor.close()
+        cursor = entry[0]
+        if cursor.row_factory is not conn.row_factory:
+            cursor.row_factory = conn.row_factory
+        return entry
+
+    async def _open_read_conns(self, db_path: str) -> list[AioConnection]:
+        """Open `read_pool_size` read connections to `db_path`."""
+        read_conns: list[AioConnection] = []
+        try:
+            for _ in range(self.read_pool_size):
+                read_conns.append(await self._open_conn(db_path, read_only=True))
+        except BaseException:
+            for read_conn in read_conns:
+                await read_conn.close()
+            raise
+        return read_conns
 
     def get_connection(
         self,
@@ -84,17 +241,22 @@ class ManagerBase:
 
     async def close(self, db_path: str) -> None:
         """Close a database connection (both read and write connections)."""
+        await self._stop_writer(db_path)
         if db_path in self.db_dict:
             pc = self.get_path_connection(db_path)
             if pc:
-                # Close write connection
+                # Close write connection (its shared cursor goes with it)
                 if pc.write_conn:
+                    self._cursors.pop(pc.write_conn, None)
                     await pc.write_conn.close()
-                # Close read connection if it exists and is different from write
-                if pc.read_conn and pc.read_conn is not pc.write_conn:
-                    await pc.read_conn.close()
+                # Close read connections that are different from write
+                for read_conn in pc.read_conns:
+                    if read_conn is not pc.write_conn:
+                        self._cursors.pop(read_conn, None)
+                        await read_conn.close()
             self._db_dict.__delitem__(db_path)
             self._locks.pop(db_path, None)
+            self._read_semaphores.pop(db_path, None)
 
     disconnect = close
     # Properties
@@ -106,6 +268,33 @@ class ManagerBase:
     def databases(self) -> list[str]:
         return self.db_dict.paths
 
+    def _set_flag(self, flag: int, value: bool) -> None:
+        self._flags = self._flags | flag if value else self._flags & ~flag
+
+    @property
+    def autocommit(self) -> bool:
+        return bool(self._flags & _FLAG_AUTOCOMMIT)
+
+    @autocommit.setter
+    def autocommit(self, value: bool) -> None:
+        self._set_flag(_FLAG_AUTOCOMMIT, value)
+
+    @property
+    def omni_log(self) -> bool:
+        return bool(self._flags & _FLAG_OMNI_LOG)
+
+    @omni_log.setter
+    def omni_log(self, value: bool) -> None:
+        self._set_flag(_FLAG_OMNI_LOG, value)
+
+    @property
+    def log_results(self) -> bool:
+        return bool(self._flags & _FLAG_LOG_RESULTS)
+
+    @log_results.setter
+    def log_results(self, value: bool) -> None:
+        self._set_flag(_FLAG_LOG_RESULTS, value)
+
     @property
     def history_length(self) -> Optional[int]:
         return self._history_manager.history_length
@@ -135,23 +324,125 @@ class ManagerBase:
 
     # Utility Methods
     def _should_log(self, log: bool, override_omnilog: bool = False) -> bool:
-        return log or (self.omni_log and not override_omnilog)
+        return bool(log or (self._flags & _FLAG_OMNI_LOG and not override_omnilog))
 
     def _should_commit(self, commit: bool, override_autocommit: bool = False, mode: Literal["read", "write"] = "write") -> bool:
-        return (commit or (self.autocommit and not override_autocommit)) and mode == "write"
+        return bool((commit or (self._flags & _FLAG_AUTOCOMMIT and not override_autocommit)) and mode == "write")
 
     def _call_logger(self, method: str, *args, **kwargs) -> None:
+        # Pass %-style messages with their args so the logger only formats them if emitted
         if self.logger:
             f = getattr(self.logger, method, None)
             if callable(f):
                 f(*args, **kwargs)
 
-    async def _append_history(self, item: HistoryItem) -> None:
-        await self._history_manager.append(item)
+    @staticmethod
+    def _is_read_query(query: str) -> bool:
+        """Whether `query` starts with a prefix from _READ_QUERY_PREFIXES (case-insensitive)."""
+        return query.lstrip()[:4].upper() in _READ_QUERY_PREFIXES
+
+    @property
+    def _history_enabled(self) -> bool:
+        return self._history_manager.history_enabled
+
+    def _append_history(self, item: Union[HistoryItem, Tuple[Any, ...]]) -> None:
+        """
+        Queue a history item without waiting for it to be recorded.
+
+        `item` is a history dict or one of two raw tuples, turned into a dict
+        when the item is drained. Each tuple ends with the time.time() it was
+        queued at, which the dump generator uses for the entry's timestamp:
+        - (path, query, params, return_type, result, at): the arguments of an ExecutionLog.
+        - (path, "COMMIT" | "ROLLBACK", at): a transaction control entry.
+        Dicts are timestamped when they are recorded.
+
+        A background task hands queued items to the history manager in
+        batches; flush_history_to_file records anything still queued first.
+        """
+        self._pending_history.append(item)
+        flusher = self._history_flusher
+        if flusher is None or flusher.done() or flusher.get_loop() is not asyncio.get_running_loop():
+            self._history_event = asyncio.Event()
+            self._history_flusher = asyncio.create_task(self._history_flusher_loop())
+        self._history_event.set()
+
+    async def _history_flusher_loop(self) -> None:
+        event = self._history_event
+        while True:
+            await event.wait()
+            event.clear()
+            drain = self._history_drain = asyncio.ensure_future(self._record_history())
+            # Shielded so cancelling the flusher cannot drop items already
+            # taken; _wait_for_history_drain lets the drain finish instead
+            await asyncio.shield(drain)
+
+    async def _record_history(self) -> None:
+        try:
+            await self._drain_history()
+        except Exception as e:
+            self._call_logger("error", "Failed to record query history: %s", e)
+
+    async def _wait_for_history_drain(self) -> None:
+        """Wait for a drain the flusher has in progress, so no item is still being appended."""
+        drain, self._history_drain = self._history_drain, None
+        if drain is not None and drain.get_loop() is asyncio.get_running_loop():
+            await drain
+
+    async def _drain_history(self) -> None:
+        """
+        Record every queued history item with a single append_many.
+
+        Queued raw tuples (see _append_history) become history dicts here,
+        off the query path.
+        """
+        pending = self._pending_history
+        if pending:
+            items: list[HistoryItem] = []
+            times: list[Optional[float]] = []
+            for item in pending:
+                if type(item) is not tuple:
+                    items.append(item)
+                    times.append(None)
+                elif len(item) == 3:
+                    items.append(_control_item(item[0], item[1]))
+                    times.append(item[2])
+                else:
+                    items.append(ExecutionLog(*item[:5]).to_dict())
+                    times.append(item[5])
+            pending.clear()
+            await self._history_manager.append_many(items, times=times)
+
+    async def _stop_history_flusher(self) -> None:
+        """
+        Cancel the background history task and wait for a drain it has in
+        progress; items not taken yet stay queued.
+        """
+        flusher, self._history_flusher = self._history_flusher, None
+        if flusher is not None and not flusher.done() and flusher.get_loop() is asyncio.get_running_loop():
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+        await self._wait_for_history_drain()
 
     async def flush_history_to_file(self) -> None:
+        await self._wait_for_history_drain()
+        await self._drain_history()
         await self._history_manager.flush_to_file()
 
+    async def aclose(self) -> None:
+        """
+        Close every database and stop the background history task.
+
+        History still queued or being recorded is written out first, so
+        nothing is left behind in memory.
+        """
+        for db_path in self.databases:
+            await self.close(db_path)
+        await self._stop_history_flusher()
+        await self.flush_history_to_file()
+
     async def connect(
         self,
         db_path: str,
@@ -166,7 +457,7 @@ class ManagerBase:
         Args:
             db_path: Path to the SQLite database file.
             alias: Optional alias for the database path.
-            create_read_connection: If True, creates a separate read connection.
+            create_read_connection: If True, creates `read_pool_size` separate read connections.
             mode: "read" or "write" - specifies which connection to return.
             
         Returns:
@@ -176,43 +467,48 @@ class ManagerBase:
             All connections use a custom row_factory that automatically converts
             string representations of integers to int type. This is useful for
             working with IntEnum and similar types that require integer values.
+            New connections get CONNECTION_PRAGMAS (WAL journal mode, etc.), or
+            `init_pragmas` if given; read connections are also set to query_only.
         """
         if db_path in self.db_dict:
             pc = self.db_dict[db_path]
             # If read connection is requested but doesn't exist, create it
             if create_read_connection and pc.read_conn is None:
                 try:
-                    pc.read_conn = await connect(db_path)
-                    pc.read_conn.row_factory = type_converting_row_factory
+                    pc.read_conns = await self._open_read_conns(db_path)
                 except Exception as e:
                     raise ConnectionError(f"Failed to create read connection to {db_path}: {e}") from e
             
             if mode == "read":
                 if pc.read_conn is None:
                     raise ConnectionError(f"No read connection available for {db_path}")
-                return pc.read_conn
+                return pc.get_conn("read")
             return pc.write_conn
         
         try:
-            write_conn = await connect(db_path)
-            write_conn.row_factory = type_converting_row_factory
+            write_conn = await self._open_conn(db_path)
             
-            read_conn = None
+            read_conns = []
             if create_read_connection:
-                read_conn = await connect(db_path)
-                read_conn.row_factory = type_converting_row_factory
+                try:
+                    read_conns = await self._open_read_conns(db_path)
+                except BaseException:
+                    await write_conn.close()
+                    raise
             
             pc = PathConnection(
                 path=db_path,
                 write_conn=write_conn,
-                read_conn=read_conn,
-                alias=alias
+                alias=alias,
+                read_conns=read_conns,
             )
             self._db_dict[db_path] = pc
+            # Create the per-DB lock now so queue() always finds it
+            self._get_lock(db_path)
             if mode == "read":
                 if pc.read_conn is None:
                     raise ConnectionError(f"No read connection available for {db_path}")
-                return pc.read_conn
+                return pc.get_conn("read")
             return write_conn
         except Exception as e:
             raise ConnectionError(f"Failed to connect to {db_path}: {e}") from e
@@ -229,7 +525,7 @@ class ManagerBase:
         override_autocommit: bool = False,
         log: bool = False,
         override_omnilog: bool = False,
-        mode : Literal["read", "write"] = "write",
+        mode : Literal["read", "write", "auto"] = "write",
         create_read_connection: bool = True,
         expected_types: Optional[Tuple[Optional[Type], ...]] = None,
     ) -> QueryResult:
@@ -248,10 +544,16 @@ class ManagerBase:
             override_autocommit (bool): Force override of autocommit behavior.
             log (bool): Whether to log this query.
             override_omnilog (bool): Force override of omni_log behavior.
-            mode (Literal["read", "write"], optional): Connection mode to use. Defaults to "write".
+            mode (Literal["read", "write", "auto"], optional): Connection mode to use. Defaults to "write".
                 - "read": Use a read-only connection (if available). Best for SELECT queries
                   to improve concurrency. Falls back to write connection if no read connection exists.
                 - "write": Use the write connection. Required for INSERT, UPDATE, DELETE, and DDL queries.
+                - "auto": "read" for queries starting with SELECT or EXPLAIN, "write" otherwise
+                  ("write" whenever `cursor` is given). WITH statements go to the writer
+                  because a CTE can lead into a write, and so does everything on an
+                  in-memory database (":memory:" or a mode=memory URI), since each
+                  connection to one is a separate database. Read connections do not
+                  see uncommitted changes made on the write connection.
             create_read_connection (bool, optional): If True and mode="read", creates a separate 
                 read connection if it doesn't exist. Defaults to True.
             expected_types (Optional[Tuple[Optional[Type], ...]], optional): A tuple of expected types 
@@ -301,6 +603,13 @@ class ManagerBase:
                                          expected_types=(None, None, int))
             # Skip first two columns, convert third to int
         """
+        if mode == "auto":
+            mode = "read" if cursor is None and self._is_read_query(query) else "write"
+            if mode == "read":
+                # A read connection to an in-memory database would see an empty one
+                pc = self.db_dict.get_path_connection(db_path)
+                if _is_memory_db(pc.path if pc is not None else db_path):
+                    mode = "write"
         conn = await self.connect(db_path, mode=mode, create_read_connection=create_read_connection and mode=="read")
         params = params or ()
         
@@ -322,28 +631,31 @@ class ManagerBase:
                 force_notify_bulk=False,
                 convert_to_dollar=False,
             )
+        elif expected_types is None and _fetches_all(return_type):
+            # Reuse one cursor per connection instead of opening and closing one per query;
+            # fetchall reads every row, so no statement is left open on it afterwards
+            shared_cursor, cursor_lock = await self._shared_cursor(conn)
+            async with cursor_lock:
+                result = await try_query(
+                    cursor=shared_cursor,
+                    query=query,
+                    commit=False,  # IMPORTANT: never auto-commit inside exec
+                    injection_values=params,
+                    return_type=return_type,
+                    log=log,
+                    raise_on_fail=True,
+                    notify_bulk=False,
+                    force_notify_bulk=False,
+                    convert_to_dollar=False,
+                )
         else:
-            # Create a new cursor with custom row_factory if needed
+            # A partial fetch leaves its statement open (holding table locks and a
+            # read snapshot) until the cursor is closed, so use a short-lived one.
+            # Create it with a custom row_factory if needed.
+            original_row_factory = conn.row_factory
             if expected_types is not None:
-                original_row_factory = conn.row_factory
                 conn.row_factory = custom_row_factory(expected_types)
-                try:
-                    async with conn.cursor() as new_cursor:
-                        result = await try_query(
-                            cursor=new_cursor,
-                            query=query,
-                            commit=False,  # IMPORTANT: never auto-commit inside exec
-                            injection_values=params,
-                            return_type=return_type,
-                            log=log,
-                            raise_on_fail=True,
-                            notify_bulk=False,
-                            force_notify_bulk=False,
-                            convert_to_dollar=False,
-                        )
-                finally:
-                    conn.row_factory = original_row_factory
-            else:
+            try:
                 async with conn.cursor() as new_cursor:
                     result = await try_query(
                         cursor=new_cursor,
@@ -357,6 +669,8 @@ class ManagerBase:
                         force_notify_bulk=False,
                         convert_to_dollar=False,
                     )
+            finally:
+                conn.row_factory = original_row_factory
         
         # Apply type conversion post-fetch if needed and cursor was provided
         # Note: This approach is used for existing transaction cursors where the row_factory
@@ -370,31 +684,265 @@ class ManagerBase:
             # for API consistency with the row_factory signature
             result = [factory(None, row) for row in result]
 
-        # commit logic:
+        # commit/logging/history, checked inline against the packed flags
+        flags = self._flags
+        if (commit or (flags & _FLAG_AUTOCOMMIT and not override_autocommit)) and mode == "write":
+            await self._commit_and_record(conn, db_path)
 
-        if self._should_commit(commit, override_autocommit, mode=mode):
+        if log or (flags & _FLAG_OMNI_LOG and not override_omnilog):
+            self._call_logger("info", "%s | %s", query, params)
 
-            await conn.commit()
-            await self._append_history(
-                {
-                    "path": db_path,
-                    "query": "COMMIT",
-                    "params": None,
-                    "timestamp": None,
-                    "result": None,
-                }
+        if flags & _FLAG_LOG_RESULTS and self._history_enabled:
+            # Copy a result list so later changes by the caller do not reach the log
+            self._append_history(
+                (db_path, query, params, return_type, result[:] if type(result) is list else result, time.time())
             )
 
-        # logging/history:
+        return result
+
+    async def execute_many(
+        self,
+        db_path: str,
+        query: str,
+        seq_of_params: Iterable[QueryParams],
+        *,
+        commit: bool = False,
+        override_autocommit: bool = False,
+        log: bool = False,
+        override_omnilog: bool = False,
+    ) -> int:
+        """
+        Execute one statement for every parameter set with a single executemany call.
+
+        Prefer this over calling `execute` in a loop: the cursor, commit and
+        history entry are paid once for the whole batch instead of per row.
+
+        Args:
+            db_path (str): Path or alias of the target SQLite database.
+            query (str): SQL statement to execute for each parameter set.
+            seq_of_params (Iterable): Parameter sets, one per execution.
+            commit, override_autocommit, log, override_omnilog: As for `execute`.
+
+        Returns:
+            int: The number of rows modified, as reported by the cursor.
+
+        Examples:
+            await manager.execute_many("mydb", "INSERT INTO users VALUES (?, ?)",
+                                       [(1, "Alice"), (2, "Bob")], commit=True)
+        """
+        conn = await self.connect(db_path)
+        if not isinstance(seq_of_params, (list, tuple)):
+            seq_of_params = list(seq_of_params)
+        async with conn.cursor() as cursor:
+            await cursor.executemany(query, seq_of_params)
+            rowcount = cursor.rowcount
+
+        if self._should_commit(commit, override_autocommit):
+            await self._commit_and_record(conn, db_path)
+
+        params = f"<bulk {len(seq_of_params)}>"
         if self._should_log(log, override_omnilog):
-            self._call_logger("info", f"{query} | {params}")
+            self._call_logger("info", "%s | %s", query, params)
 
-        if self.log_results:
-            await self._append_history(
-                ExecutionLog(db_path, query, params, return_type, result).to_dict()
-            )
+        if self.log_results and self._history_enabled:
+            self._append_history((db_path, query, params, "executemany", rowcount, time.time()))
 
-        return result
+        return rowcount
+
+    async def execute_script(
+        self,
+        db_path: str,
+        sql: str,
+        *,
+        commit: bool = False,
+        override_autocommit: bool = False,
+        log: bool = False,
+        override_omnilog: bool = False,
+    ) -> None:
+        """
+        Execute several semicolon-separated SQL statements with one executescript call.
+
+        Note:
+            sqlite3's executescript commits any pending transaction before it
+            runs the script, and takes no parameters.
+
+        Args:
+            db_path (str): Path or alias of the target SQLite database.
+            sql (str): The SQL script.
+            commit, override_autocommit, log, override_omnilog: As for `execute`.
+        """
+        conn = await self.connect(db_path)
+        async with conn.cursor() as cursor:
+            await cursor.executescript(sql)
+
+        if self._should_commit(commit, override_autocommit):
+            await self._commit_and_record(conn, db_path)
+
+        if self._should_log(log, override_omnilog):
+            self._call_logger("info", "%s | <script>", sql)
+
+        if self.log_results and self._history_enabled:
+            self._append_history((db_path, sql, None, "executescript", None, time.time()))
+
+    def submit(self, db_path: str, query: str, params: Optional[QueryParams] = None) -> asyncio.Future[QueryResult]:
+        """
+        Queue a write statement and return a future that resolves once it has run.
+
+        Nothing is awaited before the statement is queued, so callers can
+        submit many statements and then await (or gather) their futures;
+        `await manager.submit(...)` runs a single one. Each database has one
+        writer task that runs submitted statements in arrival order on the
+        write connection, connecting first if needed. Adjacent submissions of the same
+        query string that return no rows are coalesced into a single
+        executemany, and each batch (up to MAX_COALESCE statements) is
+        committed once if autocommit is on.
+
+        Note:
+            Only DML statements can be coalesced. If a coalesced group fails,
+            every submission in it raises the error.
+
+            The writer takes the per-database lock (see Manager.write_queue)
+            for each batch, so submitted writes wait for an open
+            safe_transaction to finish. Awaiting the future while holding
+            that lock deadlocks.
+
+        Args:
+            db_path (str): Path or alias of the target SQLite database.
+            query (str): The write statement.
+            params (optional): Parameters for the statement.
+
+        Returns:
+            asyncio.Future[QueryResult]: Resolves once the statement has run (and
+            been committed, under autocommit), or raises its error. It resolves
+            to the statement's rows, like execute with "fetchall": an empty
+            list if it returns none, e.g. an INSERT without RETURNING.
+
+        Examples:
+            futures = [manager.submit("mydb", "INSERT INTO t VALUES (?)", (i,)) for i in range(1000)]
+            await asyncio.gather(*futures)
+        """
+        writer = self._writers.get(db_path)
+        if writer is None or writer[1].done() or writer[1].get_loop() is not asyncio.get_running_loop():
+            queue: asyncio.Queue = asyncio.Queue()
+            writer = self._writers[db_path] = (queue, asyncio.create_task(self._writer_loop(db_path, queue)))
+        future = asyncio.get_running_loop().create_future()
+        writer[0].put_nowait((query, params or (), future))
+        return future
+
+    async def _writer_loop(self, db_path: str, queue: asyncio.Queue) -> None:
+        batch: list = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                while len(batch) < MAX_COALESCE and not queue.empty():
+                    batch.append(queue.get_nowait())
+                # Hold the per-DB lock so a batch never runs (or commits) inside
+                # a transaction another caller has open on the write connection
+                async with self._locks.get(db_path) or self._get_lock(db_path):
+                    await self._run_write_batch(db_path, batch)
+                batch = []
+        except asyncio.CancelledError:
+            self._fail_writes(batch, ConnectionError(f"Connection to {db_path} was closed."))
+            raise
+        except Exception as e:
+            # The writer stops here; submit() starts a new one for later writes
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            self._fail_writes(batch, e)
+            self._call_logger("error", "Writer for %s failed: %s", db_path, e)
+
+    async def _run_write_batch(self, db_path: str, batch: list) -> None:
+        """
+        Run queued writes, then commit once.
+
+        Each run of the same query starts with one execute; if that statement
+        returns no rows, the rest of the run is coalesced into an executemany.
+        """
+        conn = self.get_connection(db_path)
+        if conn is None:
+            try:
+                conn = await self.connect(db_path)
+            except Exception as e:
+                self._fail_writes(batch, e)
+                return
+        done: list = []  # (result, future) per statement that ran
+        cursor, cursor_lock = await self._shared_cursor(conn)
+        async with cursor_lock:
+            start, size = 0, len(batch)
+            while start < size:
+                query, params, future = batch[start]
+                start += 1
+                try:
+                    await cursor.execute(query, params)
+                    done.append((await cursor.fetchall(), future))
+                except Exception as e:
+                    self._fail_writes([batch[start - 1]], e)
+                    continue
+                self._record_submit(db_path, query, params)
+                if cursor.description is not None:
+                    # Returns rows (e.g. RETURNING), which executemany would discard
+                    continue
+                end = start
+                while end < size and batch[end][0] == query:
+                    end += 1
+                if end == start:
+                    continue
+                group = batch[start:end]
+                start = end
+                try:
+                    await cursor.executemany(query, [params for _, params, _ in group])
+                except Exception as e:
+                    self._fail_writes(group, e)
+                    continue
+                done.extend(([], future) for *_, future in group)
+                self._record_submit(db_path, query, f"<bulk {len(group)}>" if len(group) > 1 else group[0][1])
+        if done and self._should_commit(False):
+            try:
+                await self._commit_and_record(conn, db_path)
+            except Exception as e:
+                self._fail_writes(done, e)
+                return
+        for result, future in done:
+            if not future.done():
+                future.set_result(result)
+
+    def _record_submit(self, db_path: str, query: str, params: Any) -> None:
+        if self.log_results and self._history_enabled:
+            self._append_history((db_path, query, params, "submit", None, time.time()))
+
+    @staticmethod
+    def _fail_writes(items: list, error: BaseException) -> None:
+        for *_, future in items:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _stop_writer(self, db_path: str) -> None:
+        """Cancel the writer task for `db_path`, failing writes still queued."""
+        writer = self._writers.pop(db_path, None)
+        if writer is None:
+            return
+        queue, task = writer
+        if not task.done() and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        pending = []
+        while not queue.empty():
+            pending.append(queue.get_nowait())
+        self._fail_writes(pending, ConnectionError(f"Connection to {db_path} was closed."))
+
+    async def _commit_and_record(self, conn: AioConnection, db_path: str) -> None:
+        """
+        Commit `conn` and record the COMMIT in history.
+
+        Only the commit is awaited: the history item is queued synchronously
+        for the background flusher, and only once the commit has succeeded.
+        """
+        await conn.commit()
+        if self._history_enabled:
+            self._append_history((db_path, "COMMIT", time.time()))
 
    # Transaction Management
     async def commit(self, db_path: str, log: bool = False, override_omnilog: bool = False) -> None:
@@ -402,18 +950,10 @@ class ManagerBase:
         conn = self.get_connection(db_path)
         if conn is None:
             return
-        await conn.commit()
-
-        await self._append_history({
-            "path": db_path,
-            "query": "COMMIT",
-            "params": None,
-            "timestamp": None,
-            "result": None,
-        })
+        await self._commit_and_record(conn, db_path)
 
         if self._should_log(log, override_omnilog):
-            self._call_logger("info", f"Commit on {db_path}")
+            self._call_logger("info", "Commit on %s", db_path)
 
     async def rollback(self, db_path: str, log: bool = False, override_omnilog: bool = False) -> None:
         """Rollback the current transaction."""
@@ -423,16 +963,11 @@ class ManagerBase:
             return
         await conn.rollback()
 
-        await self._append_history({
-            "path": db_path,
-            "query": "ROLLBACK",
-            "params": None,
-            "timestamp": None,
-            "result": None,
-        })
+        if self._history_enabled:
+            self._append_history((db_path, "ROLLBACK", time.time()))
 
         if self._should_log(log, override_omnilog):
-            self._call_logger("info", f"Rollback on {db_path}")
+            self._call_logger("info", "Rollback on %s", db_path)
 
     # Savepoint Management
     @staticmethod
@@ -461,12 +996,12 @@ class ManagerBase:
         Raises:
             ValueError: If the savepoint name is invalid.
         """
-        self._validate_savepoint_name(name)
+        sql = _savepoint_sql(name)[0]
         conn = self.get_connection(db_path)
         if conn is None:
             return
-        await conn.execute(f"SAVEPOINT {name}")
-        self._call_logger("info", f"SAVEPOINT {name} created in {db_path}")
+        await conn.execute(sql)
+        self._call_logger("info", "SAVEPOINT %s created in %s", name, db_path)
 
     async def rollback_to(self, db_path: str, name: str) -> None:
         """Roll back to a savepoint.
@@ -478,12 +1013,12 @@ class ManagerBase:
         Raises:
             ValueError: If the savepoint name is invalid.
         """
-        self._validate_savepoint_name(name)
+        sql = _savepoint_sql(name)[1]
         conn = self.get_connection(db_path)
         if conn is None:
             return
-        await conn.execute(f"ROLLBACK TO {name}")
-        self._call_logger("info", f"ROLLBACK TO SAVEPOINT {name} in {db_path}")
+        await conn.execute(sql)
+        self._call_logger("info", "ROLLBACK TO SAVEPOINT %s in %s", name, db_path)
 
     async def release_savepoint(self, db_path: str, name: str) -> None:
         """Release a savepoint.
@@ -495,9 +1030,9 @@ class ManagerBase:
         Raises:
             ValueError: If the savepoint name is invalid.
         """
-        self._validate_savepoint_name(name)
+        sql = _savepoint_sql(name)[2]
         conn = self.get_connection(db_path)
         if conn is None:
             return
-        await conn.execute(f"RELEASE SAVEPOINT {name}")
-        self._call_logger("info", f"SAVEPOINT {name} released in {db_path}")
+        await conn.execute(sql)
+        self._call_logger("info", "SAVEPOINT %s released in %s", name, db_path)
@@ -39,14 +39,16 @@ class Transaction:
         self._cursor = await self._connection.cursor()
         
         try:
-            await self._cursor.execute("BEGIN")
-            self.logger.info(f"BEGIN transaction on database: {self.database_path}")
+            # Transactions run on the write connection; take the write lock up
+            # front so a later write cannot fail with SQLITE_BUSY on lock upgrade
+            await self._cursor.execute("BEGIN IMMEDIATE")
+            self.logger.info("BEGIN IMMEDIATE transaction on database: %s", self.database_path)
         except Exception as e:
             # Close cursor on failure
             if self._cursor:
                 await self._cursor.close()
                 self._cursor = None
-            self.logger.error(f"Failed to BEGIN transaction: {e}")
+            self.logger.error("Failed to BEGIN transaction: %s", e)
             raise TransactionError(f"Failed to begin transaction: {e}") from e
             
         return self
@@ -55,24 +57,24 @@ class Transaction:
                        exc_val: Optional[BaseException], exc_tb) -> None:
         """Exit the transaction context."""
         if not self._connection:
-            self.logger.warning(f"No connection to close for database: {self.database_path}")
+            self.logger.warning("No connection to close for database: %s", self.database_path)
             return
             
         try:
             if exc_type is not None:
                 await self._connection.rollback()
-                self.logger.error(f"ROLLBACK transaction on database: {self.database_path}")
+                self.logger.error("ROLLBACK transaction on database: %s", self.database_path)
                 self._succeeded = False
             elif self.autocommit:
                 await self.manager.commit(self.database_path)
-                self.logger.info(f"COMMIT transaction on database: {self.database_path}")
+                self.logger.info("COMMIT transaction on database: %s", self.database_path)
                 self._succeeded = True
             else:
                 await self._connection.rollback()
-                self.logger.info(f"ROLLBACK transaction on database: {self.database_path}")
+                self.logger.info("ROLLBACK transaction on database: %s", self.database_path)
                 self._succeeded = False
         except Exception as e:
-            self.logger.error(f"Failed to commit/rollback transaction: {e}")
+            self.logger.error("Failed to commit/rollback transaction: %s", e)
             self._succeeded = False
             raise
         finally:
@@ -1,7 +1,9 @@
 # tests/test_async_history_dump.py
+import asyncio
 import pytest
 import json
 from ...async_history_dump import AsyncHistoryDump
+from ...async_history_dump import async_history_dump as dump_module
 
 
 @pytest.mark.asyncio
@@ -32,3 +34,86 @@ async def test_write_many_grouping(tmp_path):
     out = json.loads(p.read_text())
     assert isinstance(out, list)
     assert out == [{"x": 1}, {"y": 2}]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_coalesce(tmp_path):
+    p = tmp_path / "c.json"
+    dumps = [
+        AsyncHistoryDump(str(p), filetype="json", mode="append", data={"i": i})
+        for i in range(5)
+    ]
+
+    await asyncio.gather(*(d.write() for d in dumps))
+
+    out = json.loads(p.read_text())
+    assert sorted(item["i"] for item in out) == [0, 1, 2, 3, 4]
+    assert AsyncHistoryDump._path_locks == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_write_is_not_picked_up_later(tmp_path):
+    p = tmp_path / "cancel.txt"
+    lock = AsyncHistoryDump._acquire_path_lock(str(p))
+    try:
+        async with lock:
+            b = asyncio.ensure_future(AsyncHistoryDump(str(p), filetype="txt", mode="append", data="B").write())
+            for _ in range(3):
+                await asyncio.sleep(0)  # B queues its batch and waits for the lock
+            b.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await b
+    finally:
+        AsyncHistoryDump._release_path_lock(str(p))
+
+    await AsyncHistoryDump(str(p), filetype="txt", mode="append", data="C").write()
+    assert p.read_text().split() == ["C"]
+    assert not AsyncHistoryDump._pending.get(asyncio.get_running_loop())
+
+
+def test_parent_directory_created_once(tmp_path):
+    target = tmp_path / "nested" / "dir"
+    AsyncHistoryDump(str(target / "a.json"))
+    AsyncHistoryDump(str(target / "b.json"))
+
+    assert target.is_dir()
+    assert str(target) in dump_module._ensured_dirs
+
+
+@pytest.mark.asyncio
+async def test_write_many_parallel_across_files_serial_within_file(tmp_path):
+    active = {"now": 0, "peak": 0}
+    both_running = asyncio.Event()
+
+    class SlowWriter:
+        async def write_batch(self, path, data_list, mode, key, strict_keys=False):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            if active["now"] == 2:
+                both_running.set()
+            try:
+                await asyncio.wait_for(both_running.wait(), 0.2)
+            except asyncio.TimeoutError:
+                pass
+            active["now"] -= 1
+
+    def dump(name, data, mode="overwrite"):
+        d = AsyncHistoryDump(str(tmp_path / name), filetype="txt", mode=mode, data=data)
+        d._writer = SlowWriter()
+        return d
+
+    await AsyncHistoryDump.write_many([dump("a.txt", "1"), dump("b.txt", "2")])
+    assert active["peak"] == 2
+
+    active["peak"] = 0
+    both_running.clear()
+    await AsyncHistoryDump.write_many([dump("c.txt", "1"), dump("c.txt", "2", mode="append")])
+    assert active["peak"] == 1
+
+
+def test_filetype_autodetect(tmp_path):
+    assert AsyncHistoryDump(str(tmp_path / "a.json")).filetype == "json"
+    assert AsyncHistoryDump(str(tmp_path / "a.CSV")).filetype == "csv"
+    assert AsyncHistoryDump(str(tmp_path / "a.txt")).filetype == "txt"
+    with pytest.raises(ValueError):
+        AsyncHistoryDump(str(tmp_path / "a.log"))
@@ -80,3 +80,43 @@ async def test_csv_pure_list_rows_no_header(tmp_path):
 
     # No header detection because we didn't create alphabetic-only header via dict writer
     assert rows == [["a", "b"], ["1", "2"]]
+
+
+@pytest.mark.asyncio
+async def test_csv_dict_rows_mixed_with_list_and_scalar(tmp_path):
+    writer = CSVWriter()
+    path = tmp_path / "soa.csv"
+
+    rows = [{"a": 1, "b": 2}, ["3"], "x", {"b": 5}]
+    await writer.write_single(str(path), rows, "overwrite", None)
+
+    out = list(csv.reader(path.read_text().splitlines()))
+    assert out == [["a", "b"], ["1", "2"], ["3", ""], ["x", ""], ["", "5"]]
+
+
+@pytest.mark.asyncio
+async def test_csv_list_rows_fit_existing_header(tmp_path):
+    writer = CSVWriter()
+    path = tmp_path / "fit.csv"
+
+    await writer.write_single(str(path), [{"a": 1, "b": 2}], "overwrite", None)
+    await writer.write_single(str(path), [["3"], ["4", "5", "6"], 7], "append", None)
+
+    out = list(csv.reader(path.read_text().splitlines()))
+    assert out == [["a", "b"], ["1", "2"], ["3", ""], ["4", "5"], ["7", ""]]
+
+
+@pytest.mark.asyncio
+async def test_csv_append_leaves_existing_bytes_untouched(tmp_path):
+    writer = CSVWriter()
+    path = tmp_path / "raw.csv"
+    path.write_bytes(b'a,b\r\n"1","2"\r\n')
+
+    await writer.write_single(str(path), [{"b": 3}, ["4", "5"]], "append", None)
+
+    assert path.read_bytes() == b'a,b\r\n"1","2"\r\n,3\r\n4,5\r\n'
+
+    # A new column still forces a full rewrite with the widened header
+    await writer.write_single(str(path), [{"c": 6}], "append", None)
+    rows = list(csv.reader(path.read_text().splitlines()))
+    assert rows == [["a", "b", "c"], ["1", "2", ""], ["", "3", ""], ["4", "5", ""], ["", "", "6"]]
@@ -0,0 +1,55 @@
+# tests/test_generator.py
+import re
+import time
+from datetime import datetime
+from ...async_history_dump import AsyncHistoryDumpGenerator
+
+
+def _fixed(_):
+    return "T"
+
+
+def test_timestamp_keyed_shapes(tmp_path):
+    gen = AsyncHistoryDumpGenerator(
+        str(tmp_path / "h.json"), log_time=True, time_format_function=_fixed
+    )
+
+    assert gen({"a": 1}).data == {"a": 1, "timestamp": "T"}
+    assert gen([1]).data == [1, {"timestamp": "T"}]
+    assert gen((1,)).data == (1, {"timestamp": "T"})
+    assert gen("x").data == {"data": "x", "timestamp": "T"}
+
+
+def test_timestamp_append_shapes_follow_log_as_changes(tmp_path):
+    gen = AsyncHistoryDumpGenerator(
+        str(tmp_path / "h.txt"), log_time=True, log_as="append", time_format_function=_fixed
+    )
+
+    src = [1]
+    assert gen(src).data == [1, "T"]
+    assert src == [1]
+    assert gen("x").data == ("x", "T")
+
+    gen.log_as = "key"
+    assert gen("x").data == {"data": "x", "timestamp": "T"}
+
+
+def test_default_time_format_fast_path(tmp_path):
+    gen = AsyncHistoryDumpGenerator(str(tmp_path / "h.json"), log_time=True)
+
+    stamp = gen({}).data["timestamp"]
+    assert re.fullmatch(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d", stamp)
+    assert "time_format_function=Default" in repr(gen)
+
+    gen.time_format_function = _fixed
+    assert gen({}).data["timestamp"] == "T"
+    assert "time_format_function=Custom" in repr(gen)
+
+
+def test_create_uses_given_event_time(tmp_path):
+    gen = AsyncHistoryDumpGenerator(str(tmp_path / "h.json"), log_time=True)
+
+    assert gen.create({}, at=0).data["timestamp"] == time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(0))
+
+    gen.time_format_function = lambda when: when
+    assert gen.create({}, at=0).data["timestamp"] == datetime.fromtimestamp(0)
@@ -41,3 +41,70 @@ async def test_json_strict_keys(tmp_path):
     # Writing strict to a missing key → KeyError
     with pytest.raises(KeyError):
         await writer.write_single(str(path), {"c": 2}, "append", key=("a", "missing"), strict_keys=True)
+
+
+@pytest.mark.asyncio
+async def test_json_write_batch_single_pass(tmp_path):
+    writer = JSONWriter()
+    path = tmp_path / "batch.json"
+
+    await writer.write_batch(str(path), [{"a": 1}, {"b": 2}], "overwrite", key=None)
+    assert json.loads(path.read_text()) == {"a": 1, "b": 2}
+
+    await writer.write_batch(str(path), [{"x": 1}, {"y": 2}], "append", key=("log",))
+    data = json.loads(path.read_text())
+    assert data["log"] == [{"x": 1}, {"y": 2}]
+
+
+@pytest.mark.asyncio
+async def test_json_large_int_and_corrupt_file(tmp_path):
+    writer = JSONWriter()
+    path = tmp_path / "big.json"
+    path.write_text("{not json")
+
+    await writer.write_single(str(path), {"n": 2**70 + 1}, "append", key=None)
+    assert json.loads(path.read_text()) == [{"n": 2**70 + 1}]
+
+
+@pytest.mark.asyncio
+async def test_json_cache_tracks_external_changes(tmp_path):
+    writer = JSONWriter()
+    path = tmp_path / "cached.json"
+
+    await writer.write_single(str(path), {"a": 1}, "append", key=None)
+    assert JSONWriter._cache[str(path)][1] == [{"a": 1}]
+
+    path.write_text('["external"]')
+    await writer.write_single(str(path), ("t", 1), "append", key=None)
+    assert json.loads(path.read_text()) == ["external", ["t", 1]]
+
+    JSONWriter.flush_cache(str(path))
+    assert str(path) not in JSONWriter._cache
+
+
+@pytest.mark.asyncio
+async def test_json_batch_is_copied_once(tmp_path):
+    writer = JSONWriter()
+    path = tmp_path / "batch.json"
+    shared = {"params": (1, 2)}
+
+    await writer.write_batch(str(path), [shared, shared, {"n": 2**70}], "append", key=None)
+    cached = JSONWriter._cache[str(path)][1]
+    assert cached == json.loads(path.read_text()) == [{"params": [1, 2]}] * 2 + [{"n": 2**70}]
+    assert cached[0] is not cached[1] and cached[0] is not shared
+
+
+@pytest.mark.asyncio
+async def test_json_non_finite_floats_round_trip(tmp_path):
+    writer = JSONWriter()
+    path = tmp_path / "nan.json"
+
+    await writer.write_batch(str(path), [{"x": float("inf")}, [float("-inf")]], "append", key=None)
+    assert "Infinity" in path.read_text()
+    JSONWriter.flush_cache(str(path))
+    await writer.write_single(str(path), {"y": float("nan")}, "append", key=None)
+
+    data = json.loads(path.read_text())
+    assert data[:2] == [{"x": float("inf")}, [float("-inf")]]
+    assert data[2]["y"] != data[2]["y"]
+    assert JSONWriter._cache[str(path)][1][0] == {"x": float("inf")}
@@ -48,3 +48,10 @@ def test_apply_nested_json_list_extend():
     obj = {"a": {"b": [1]}}
     apply_nested_json(obj["a"], "b", [2, 3], "extend")
     assert obj["a"]["b"] == [1, 2, 3]
+
+
+def test_merge_flat_extends_existing_list_in_place():
+    existing = ["x"]
+    out = merge_flat(existing, ("a", "b"), "append")
+    assert out is existing
+    assert existing == ["x", "a", "b"]
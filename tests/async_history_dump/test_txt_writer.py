@@ -21,3 +21,34 @@ async def test_txt_append(tmp_path):
     await writer.write_single(str(path), "b", "append", key=None)
 
     assert path.read_text().splitlines() == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_txt_write_leaves_no_temp_files(tmp_path):
+    writer = TXTWriter()
+    path = tmp_path / "file.txt"
+
+    await writer.write_single(str(path), "a", "overwrite", key=None)
+    await writer.write_batch(str(path), ["b", "c"], "append", key=None)
+
+    assert path.read_text().splitlines() == ["a", "b", "c"]
+    assert [p.name for p in tmp_path.iterdir()] == ["file.txt"]
+
+
+@pytest.mark.asyncio
+async def test_txt_append_writes_in_place(tmp_path, monkeypatch):
+    from ...async_history_dump import writers
+    writer = TXTWriter()
+    path = tmp_path / "file.txt"
+    path.write_text("a\nunterminated")
+
+    def fail(*args):
+        raise AssertionError("append should not read or rewrite the file")
+
+    monkeypatch.setattr(writers, "_read_text", fail)
+    monkeypatch.setattr(writers, "_write_text", fail)
+    await writer.write_batch(str(path), ["b", ["c", "d"]], "extend", key=None)
+
+    assert path.read_text().splitlines() == ["a", "unterminated", "b", "c", "d"]
+    with pytest.raises(ValueError):
+        await writer.write_single(str(path), "e", "sideways", key=None)
@@ -0,0 +1,52 @@
+# tests/execution_async/test_columnar.py
+"""Tests for column-oriented fetch helpers."""
+import aiosqlite
+import pytest
+from ...execution_async import columnar
+from ...execution_async.columnar import fetchall_columnar, rows_to_columns
+from ...execution_async.row_factory import dict_row_factory
+
+
+class TestRowsToColumns:
+    """Tests for rows_to_columns."""
+
+    def test_transposes_and_converts(self):
+        rows = [('1', 'a', 1.5, None), ('2', 'b', 2.5, b'x')]
+        assert rows_to_columns(("id", "name", "price", "blob"), rows) == {
+            "id": [1, 2],
+            "name": ['a', 'b'],
+            "price": [1.5, 2.5],
+            "blob": [None, b'x'],
+        }
+
+    def test_dict_rows(self):
+        rows = [{"id": '1', "name": 'a'}, {"id": '2', "name": 'b'}]
+        assert rows_to_columns(("id", "name"), rows) == {"id": [1, 2], "name": ['a', 'b']}
+
+    def test_empty_rows_keep_column_names(self):
+        assert rows_to_columns(("id", "name"), []) == {"id": [], "name": []}
+
+    @pytest.mark.skipif(columnar.np is not None, reason="numpy is installed")
+    def test_as_numpy_requires_numpy(self):
+        with pytest.raises(ImportError):
+            rows_to_columns(("id",), [(1,)], as_numpy=True)
+
+    @pytest.mark.skipif(columnar.np is None, reason="numpy is not installed")
+    def test_as_numpy_int_columns(self):
+        cols = rows_to_columns(("id", "name", "big"), [('1', 'a', 2**70), (2, 'b', 1)], as_numpy=True)
+        assert cols["id"].dtype == columnar.np.int64
+        assert cols["id"].tolist() == [1, 2]
+        assert cols["name"] == ['a', 'b']
+        assert cols["big"] == [2**70, 1]
+
+
+@pytest.mark.asyncio
+async def test_fetchall_columnar():
+    async with aiosqlite.connect(":memory:") as conn:
+        async with conn.execute("SELECT '7' AS a, 'x' AS b UNION ALL SELECT '8', 'y'") as cur:
+            assert await fetchall_columnar(cur) == {"a": [7, 8], "b": ['x', 'y']}
+        conn.row_factory = dict_row_factory
+        async with conn.execute("SELECT 1 AS a WHERE 0") as cur:
+            assert await fetchall_columnar(cur) == {"a": []}
+        async with conn.execute("CREATE TABLE t (a)") as cur:
+            assert await fetchall_columnar(cur) == {}
@@ -166,3 +166,16 @@ class TestCustomRowFactory:
         assert result[1] == 42
         assert result[2] == 19.99
         assert result[3] == 'Product'
+    
+    def test_custom_factory_is_cached_per_type_tuple(self):
+        """Test that the generated factory is reused for equal type tuples."""
+        assert custom_row_factory((bool, int)) is custom_row_factory((bool, int))
+        assert custom_row_factory([bool, int]) is custom_row_factory((bool, int))
+    
+    def test_custom_factory_row_length_mismatch(self):
+        """Test rows shorter or longer than the expected types."""
+        factory = custom_row_factory((None, bool, int))
+        
+        assert factory(None, ('7', 'false', '3')) == ('7', False, 3)
+        assert factory(None, ('7', 'false')) == ('7', False)
+        assert factory(None, ('7', 'false', '3', '4', 'x')) == ('7', False, 3, 4, 'x')
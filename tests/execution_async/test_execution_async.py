@@ -0,0 +1,173 @@
+# tests/execution_async/test_execution_async.py
+"""Tests for query execution helpers."""
+import aiosqlite
+import pytest
+from ...execution_async.execution_async import question_to_dollar, try_query, _looks_bulk, _fetch_results
+from ...execution_async.fetch_types import Fetch, FetchMany, ReturnType, normalize_return_type
+
+
+class TestQuestionToDollar:
+    """Tests for question_to_dollar placeholder conversion."""
+
+    def test_numbers_placeholders_in_order(self):
+        assert question_to_dollar("SELECT * FROM t WHERE a = ? AND b = ?") == \
+            "SELECT * FROM t WHERE a = $1 AND b = $2"
+
+    def test_trailing_and_adjacent_placeholders(self):
+        assert question_to_dollar("VALUES (?,?)") == "VALUES ($1,$2)"
+        assert question_to_dollar("?") == "$1"
+
+    def test_no_placeholders_returns_query(self):
+        assert question_to_dollar("SELECT 1") == "SELECT 1"
+
+
+class TestReturnTypeNormalization:
+    """Tests for shared Fetch/normalize_return_type instances."""
+
+    def test_common_specifiers_are_shared(self):
+        assert normalize_return_type("fetchall") is Fetch() is Fetch("All")
+        assert normalize_return_type(1) is Fetch("fetch_one")
+        assert Fetch(5) is Fetch("5")
+        assert Fetch(5) == FetchMany(5)
+
+    def test_invalid_specifiers_still_raise(self):
+        with pytest.raises(ValueError):
+            Fetch("sometimes")
+        with pytest.raises(ValueError):
+            Fetch(0)
+
+    def test_return_types_are_frozen_value_objects(self):
+        one, many = Fetch(1), FetchMany(3)
+        assert (one.type, many.type) == ("fetchone", "fetchmany")
+        assert Fetch().to_string() == "fetchall"
+        assert many.to_string() == "fetchmany (3)"
+        assert repr(many) == "FetchMany(n=3)"
+        assert hash(FetchMany(3)) == hash(many)
+        assert not hasattr(one, "__dict__")
+        with pytest.raises(AttributeError):
+            many.n = 4
+        with pytest.raises(ValueError):
+            FetchMany()
+
+
+class TestLegacyReturnTypeSubclasses:
+    """Tests for ReturnType subclasses that name their strategy in `type` instead of `kind`."""
+
+    class AssignedAll(ReturnType):
+        def __init__(self):
+            self.type = "fetchall"
+
+    class ClassLevelMany(ReturnType):
+        type = "fetchmany"
+
+        def __init__(self, n):
+            self.n = n
+
+    @pytest.mark.asyncio
+    async def test_dispatch_falls_back_to_type(self):
+        assigned = self.AssignedAll()
+        assert assigned.type == "fetchall" and assigned.to_string() == "fetchall"
+        query = "SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3"
+        async with aiosqlite.connect(":memory:") as conn:
+            async with conn.cursor() as cur:
+                assert await try_query(cur, query, return_type=assigned) == [(1,), (2,), (3,)]
+                assert await try_query(cur, query, return_type=self.ClassLevelMany(2)) == [(1,), (2,)]
+
+
+class TestExecuteManyDispatch:
+    """Tests for bulk detection and the explicit executemany flag."""
+
+    def test_looks_bulk(self):
+        assert _looks_bulk([(1,), (2,)])
+        assert _looks_bulk(({"a": 1},))
+        assert not _looks_bulk((1, "a"))
+        assert not _looks_bulk(())
+        assert not _looks_bulk({"a": 1})
+
+    @pytest.mark.asyncio
+    async def test_explicit_executemany(self):
+        async with aiosqlite.connect(":memory:") as conn:
+            async with conn.cursor() as cur:
+                await try_query(cur, "CREATE TABLE t (a)", raise_on_fail=True)
+                rows = iter([(1,), (2,), (3,)])
+                await try_query(cur, "INSERT INTO t VALUES (?)", injection_values=rows,
+                                executemany=True, raise_on_fail=True)
+                result = await try_query(cur, "SELECT a FROM t ORDER BY a", raise_on_fail=True)
+        assert result == [(1,), (2,), (3,)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("make_rows", [list, iter])
+    async def test_bulk_chunk_size(self, make_rows):
+        async with aiosqlite.connect(":memory:") as conn:
+            async with conn.cursor() as cur:
+                await try_query(cur, "CREATE TABLE t (a)", raise_on_fail=True)
+                rows = make_rows([(i,) for i in range(10)])
+                await try_query(cur, "INSERT INTO t VALUES (?)", injection_values=rows,
+                                executemany=True, bulk_chunk_size=3, raise_on_fail=True)
+                result = await try_query(cur, "SELECT a FROM t ORDER BY a", raise_on_fail=True)
+        assert result == [(i,) for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_bulk_chunk_size_must_be_positive(self):
+        async with aiosqlite.connect(":memory:") as conn:
+            async with conn.cursor() as cur:
+                await try_query(cur, "CREATE TABLE t (a)", raise_on_fail=True)
+                with pytest.raises(ValueError):
+                    await try_query(cur, "INSERT INTO t VALUES (?)", injection_values=[(1,)],
+                                    bulk_chunk_size=-1, raise_on_fail=True)
+
+
+@pytest.mark.asyncio
+async def test_try_query_batch_convert():
+    async with aiosqlite.connect(":memory:") as conn:
+        async with conn.cursor() as cur:
+            result = await try_query(cur, "SELECT '7', 'x', 3", batch_convert=True, raise_on_fail=True)
+    assert result == [(7, 'x', 3)]
+
+
+@pytest.mark.asyncio
+async def test_try_query_return_type_dispatch():
+    async with aiosqlite.connect(":memory:") as conn:
+        async with conn.cursor() as cur:
+            query = "SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3"
+            assert await try_query(cur, query, return_type="fetchone") == [(1,)]
+            assert await try_query(cur, query, return_type=2) == [(1,), (2,)]
+            assert await try_query(cur, query, return_type="all") == [(1,), (2,), (3,)]
+            assert await try_query(cur, "SELECT 1 WHERE 0", return_type="one") == []
+            assert await _fetch_results(cur, ReturnType()) is None
+
+
+@pytest.mark.asyncio
+async def test_try_query_return_type_instance_and_invalid_specifier():
+    async with aiosqlite.connect(":memory:") as conn:
+        async with conn.cursor() as cur:
+            assert await try_query(cur, "SELECT 1", return_type=FetchMany(5)) == [(1,)]
+            assert await try_query(cur, "SELECT 1", return_type="sometimes") is None
+            with pytest.raises(ValueError):
+                await try_query(cur, "SELECT 1", return_type="sometimes", raise_on_fail=True)
+
+
+@pytest.mark.asyncio
+async def test_raise_on_fail_without_logging_propagates_unlogged(caplog):
+    async with aiosqlite.connect(":memory:") as conn:
+        async with conn.cursor() as cur:
+            with pytest.raises(aiosqlite.OperationalError):
+                await try_query(cur, "SELECT * FROM missing", raise_on_fail=True)
+            assert not caplog.records
+            with pytest.raises(aiosqlite.OperationalError):
+                await try_query(cur, "SELECT * FROM missing", raise_on_fail=True, error_message="boom")
+            assert "SQLite error during query" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_query_logging_is_lazy(caplog):
+    async with aiosqlite.connect(":memory:") as conn:
+        async with conn.cursor() as cur:
+            await try_query(cur, "SELECT ?", injection_values=(1,), log=True)
+            assert not caplog.records  # INFO disabled: nothing formatted or emitted
+            caplog.set_level("INFO")
+            await try_query(cur, "CREATE TABLE t (a)", log=True)
+            await try_query(cur, "INSERT INTO t VALUES (?)", injection_values=iter([(1,)]),
+                            executemany=True, log=True, notify_bulk=True, raise_on_fail=True)
+    assert "Executing query: CREATE TABLE t (a) | Params: None" in caplog.text
+    assert "Executing bulk operation with an unknown number of records." in caplog.text
@@ -0,0 +1,79 @@
+# tests/execution_async/test_pool.py
+"""Tests for the pooled try_query helpers."""
+import asyncio
+import pytest
+from ...execution_async.pool import AsyncSqlitePool, try_query_pooled
+
+
+@pytest.mark.asyncio
+async def test_pool_opens_connections_with_pragmas(tmp_path):
+    """Test that every pooled connection gets the WAL PRAGMAs."""
+    async with AsyncSqlitePool(str(tmp_path / "pool.db"), size=2) as pool:
+        assert pool.is_open
+        modes = await asyncio.gather(
+            try_query_pooled(pool, "PRAGMA journal_mode"),
+            try_query_pooled(pool, "PRAGMA journal_mode"),
+        )
+        assert modes == [[("wal",)], [("wal",)]]
+    assert not pool.is_open
+
+
+@pytest.mark.asyncio
+async def test_try_query_pooled_round_trip(tmp_path):
+    """Test writes and reads through the pool share one database file."""
+    async with AsyncSqlitePool(str(tmp_path / "pool.db"), size=3) as pool:
+        await try_query_pooled(pool, "CREATE TABLE t (id INTEGER, name TEXT)", commit=True)
+        await try_query_pooled(
+            pool, "INSERT INTO t VALUES (?, ?)", True, [(1, "a"), (2, "b")]
+        )
+        rows = await asyncio.gather(*(
+            try_query_pooled(pool, "SELECT * FROM t ORDER BY id") for _ in range(6)
+        ))
+        assert all(r == [(1, "a"), (2, "b")] for r in rows)
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_free_connection(tmp_path):
+    """Test that a size-1 pool hands the same connection out in turn."""
+    async with AsyncSqlitePool(str(tmp_path / "pool.db"), size=1) as pool:
+        async with pool.acquire() as first:
+            waiter = asyncio.ensure_future(pool.acquire().__aenter__())
+            await asyncio.sleep(0.01)
+            assert not waiter.done()
+        second = await waiter
+        assert second is first
+
+
+@pytest.mark.asyncio
+async def test_pool_requires_open_and_positive_size(tmp_path):
+    """Test pool misuse errors."""
+    with pytest.raises(ValueError):
+        AsyncSqlitePool(str(tmp_path / "pool.db"), size=0)
+    pool = AsyncSqlitePool(str(tmp_path / "pool.db"))
+    with pytest.raises(RuntimeError):
+        async with pool.acquire():
+            pass
+
+
+@pytest.mark.asyncio
+async def test_pool_cached_statements(tmp_path):
+    """Test that the statement cache size is configurable."""
+    async with AsyncSqlitePool(str(tmp_path / "pool.db"), size=1, cached_statements=8) as pool:
+        assert pool.cached_statements == 8
+        assert await try_query_pooled(pool, "SELECT 1") == [(1,)]
+
+
+@pytest.mark.asyncio
+async def test_try_query_pooled_commits_only_on_success(tmp_path, caplog):
+    """Test a failed write is rolled back instead of committing its partial rows."""
+    async with AsyncSqlitePool(str(tmp_path / "pool.db"), size=1) as pool:
+        await try_query_pooled(pool, "CREATE TABLE t (id INTEGER PRIMARY KEY)", commit=True)
+        rows = [(1,), (2,), (2,)]
+        assert await try_query_pooled(pool, "INSERT INTO t VALUES (?)", True, rows, executemany=True) is None
+        assert "SQLite error during query" in caplog.text
+        with pytest.raises(Exception):
+            await try_query_pooled(pool, "INSERT INTO t VALUES (?)", True, rows,
+                                   executemany=True, raise_on_fail=True)
+        assert await try_query_pooled(pool, "SELECT COUNT(*) FROM t") == [(0,)]
+        await try_query_pooled(pool, "INSERT INTO t VALUES (?)", True, [(3,)], executemany=True)
+        assert await try_query_pooled(pool, "SELECT id FROM t") == [(3,)]
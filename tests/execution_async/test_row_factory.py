@@ -1,11 +1,14 @@
 # tests/execution_async/test_row_factory.py
 """Tests for row factory type conversion functionality."""
 import pytest
+import sqlite3
 from enum import IntEnum
 from ...execution_async.row_factory import (
     convert_value,
     type_converting_row_factory,
-    dict_row_factory
+    dict_row_factory,
+    convert_rows,
+    _field_names
 )
 
 
@@ -72,6 +75,14 @@ class TestConvertValue:
         """Test that empty strings are handled."""
         assert convert_value('') == ''
 
+    def test_preserve_non_canonical_integer_strings(self):
+        """Test that strings str(int) would not produce are preserved."""
+        for value in ('007', '-0', '-007', '+1', ' 1', '1 ', '1_000', '-', '１２', '12a'):
+            assert convert_value(value) == value
+        assert convert_value('0') == 0
+        assert convert_value('-10') == -10
+        assert convert_value('9' * 30) == int('9' * 30)
+
 
 class TestTypeConvertingRowFactory:
     """Tests for type_converting_row_factory."""
@@ -185,3 +196,40 @@ class TestDictRowFactory:
         # Should work with IntEnum
         list_type = ListType(result['list_type'])
         assert list_type == ListType.TYPE_A
+
+
+class TestDictRowFactoryColumnCache:
+    """Tests for per-cursor column-name caching in dict_row_factory."""
+
+    def test_reexecuted_cursor_picks_up_new_columns(self):
+        conn = sqlite3.connect(":memory:")
+        conn.row_factory = dict_row_factory
+        cur = conn.cursor()
+
+        assert cur.execute("SELECT '1' AS a").fetchall() == [{"a": 1}]
+        assert cur.execute("SELECT '2' AS b, 'x' AS c").fetchall() == [{"b": 2, "c": "x"}]
+        conn.close()
+
+    def test_cache_entry_is_dropped_with_cursor(self):
+        conn = sqlite3.connect(":memory:")
+        conn.row_factory = dict_row_factory
+        cur = conn.cursor()
+        rows = cur.execute("SELECT '1' AS a UNION ALL SELECT '2'").fetchall()
+
+        assert rows == [{"a": 1}, {"a": 2}]
+        assert _field_names[cur][1] == ("a",)
+        n_cached = len(_field_names)
+        del cur
+        assert len(_field_names) == n_cached - 1
+        conn.close()
+
+
+class TestConvertRows:
+    """Tests for the column-wise batch conversion."""
+
+    def test_matches_row_factory(self):
+        rows = [(1, '2', 'a', None, 1.5), (3, '-4', 'b', b'x', 2.5)]
+        assert convert_rows(rows) == [type_converting_row_factory(None, r) for r in rows]
+
+    def test_empty(self):
+        assert convert_rows([]) == []
@@ -120,6 +120,49 @@ class TestPathConnection:
         pc = PathConnection("", mock_conn)
         assert bool(pc) is False
 
+    def test_get_conn_follows_connection_assignment(self, mock_conn):
+        """Test get_conn reflects read/write connections assigned later."""
+        other = object()
+        pc = PathConnection("test.db", mock_conn)
+        assert pc.get_conn("read") is mock_conn
+        pc.read_conn = other
+        assert pc.get_conn("read") is other
+        assert pc.get_conn("write") is mock_conn
+        pc.conn = other
+        assert pc.get_conn("write") is other
+        pc.read_conn = None
+        assert pc.get_conn("read") is other
+
+    def test_repr_tracks_field_changes(self, mock_conn):
+        """Test repr reflects fields assigned after construction."""
+        pc = PathConnection("test.db", mock_conn)
+        assert "read_conn=None" in repr(pc)
+        pc.read_conn = mock_conn
+        pc.alias = "t"
+        assert "alias=t" in repr(pc)
+        assert "read_conn=None" not in repr(pc)
+
+    def test_read_conns_round_robin(self, mock_conn):
+        """Test get_conn hands out pooled read connections in turn."""
+        readers = [object(), object(), object()]
+        pc = PathConnection("test.db", mock_conn, read_conns=readers)
+        assert pc.read_conns == readers
+        assert pc.read_conn is readers[0]
+        assert [pc.get_conn("read") for _ in range(4)] == readers + readers[:1]
+        assert pc.get_conn("write") is mock_conn
+        pc.read_conns = []
+        assert pc.read_conn is None
+        assert pc.get_conn("read") is mock_conn
+        with pytest.raises(ValueError):
+            PathConnection("test.db", mock_conn, read_conn=readers[0], read_conns=readers)
+
+    def test_slots(self, mock_conn):
+        """Test PathConnection keeps its fields in slots."""
+        pc = PathConnection("test.db", mock_conn, alias="t")
+        assert not hasattr(pc, "__dict__")
+        with pytest.raises(AttributeError):
+            pc.other = 1
+
 
 class TestDbPathDict:
     """Tests for DbPathDict class."""
@@ -248,6 +291,47 @@ class TestDbPathDict:
         assert pc.write_conn is conn2
         assert len(db_dict.path_connections) == 1
 
+    def test_setitem_by_alias_preserves_alias(self, aio_conn):
+        """Test __setitem__ through an alias replaces the entry and keeps the alias."""
+        db_dict = DbPathDict()
+        from aiosqlite import Connection as AioConnection
+        conn2 = MagicMock(spec=AioConnection)
+        for i in range(50):
+            db_dict[f"db{i}.db"] = aio_conn
+        db_dict.setalias("db7.db", "seven")
+        db_dict["seven"] = PathConnection("db7.db", conn2)
+        assert db_dict["seven"].write_conn is conn2
+        assert db_dict["db7.db"].alias == "seven"
+        assert len(db_dict.path_connections) == 50
+        del db_dict["seven"]
+        assert "db7.db" not in db_dict and "seven" not in db_dict
+        assert len(db_dict.path_connections) == 49
+
+    def test_setitem_preserves_alias_without_mutating_value(self, aio_conn):
+        """Test a replaced entry keeps its alias; a passed-in PathConnection is not modified."""
+        db_dict = DbPathDict()
+        db_dict["test.db"] = PathConnection("test.db", aio_conn, alias="t")
+        db_dict["test.db"] = aio_conn
+        assert db_dict["t"].path == "test.db"
+
+        replacement = PathConnection("test.db", aio_conn)
+        db_dict["t"] = replacement
+        assert db_dict["t"].alias == "t"
+        assert db_dict["t"] is not replacement
+        assert replacement.alias is None
+
+    def test_setitem_replacement_drops_stale_keys(self, aio_conn):
+        """Test replacing an entry removes its old path/alias keys that are not reused."""
+        db_dict = DbPathDict()
+        db_dict["test.db"] = PathConnection("test.db", aio_conn, alias="t")
+        db_dict["t"] = PathConnection("other.db", aio_conn)
+        assert db_dict["t"].path == "other.db"
+        assert "test.db" not in db_dict
+        db_dict["other.db"] = PathConnection("other.db", aio_conn, alias="o")
+        assert "t" not in db_dict
+        assert db_dict["o"] is db_dict["other.db"]
+        assert db_dict.paths == ["other.db"]
+
     def test_setitem_empty_key_raises(self, aio_conn):
         """Test __setitem__ with empty key raises ValueError."""
         db_dict = DbPathDict()
@@ -358,6 +442,16 @@ class TestDbPathDict:
         assert "test1.db" in paths
         assert "test2.db" in paths
 
+    def test_paths_follow_registration_order(self, aio_conn):
+        """Test paths keep registration order across setpath/delete."""
+        db_dict = DbPathDict()
+        for name in ("c.db", "a.db", "b.db"):
+            db_dict[name] = aio_conn
+        db_dict.setpath("a.db", "z.db")
+        del db_dict["c.db"]
+        assert db_dict.paths == ["b.db", "z.db"]
+        assert {pc.path for pc in db_dict.path_connections} == {"b.db", "z.db"}
+
     def test_check_key_empty_string_raises(self):
         """Test _check_key raises ValueError for empty string."""
         with pytest.raises(ValueError):
@@ -373,3 +467,17 @@ class TestDbPathDict:
         pc = PathConnection("", aio_conn)
         with pytest.raises(ValueError):
             DbPathDict._check_key(pc)
+
+    def test_string_only_methods_reject_invalid_keys(self, aio_conn):
+        """Test __getitem__, setalias and setpath accept only non-empty strings."""
+        db_dict = DbPathDict()
+        db_dict["test.db"] = aio_conn
+        for bad in ("", 123, PathConnection("test.db", aio_conn)):
+            with pytest.raises(ValueError):
+                db_dict[bad]
+            with pytest.raises(ValueError):
+                db_dict.setalias(bad, "t")
+            with pytest.raises(ValueError):
+                db_dict.setpath("test.db", bad)
+        with pytest.raises(ValueError):
+            db_dict.setalias("test.db", "")
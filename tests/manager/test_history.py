@@ -47,6 +47,16 @@ class TestDefaultHistoryFormatFunction:
         result = default_history_format_function(history)
         assert "[no timestamp]" in result
 
+    def test_format_commit_missing_timestamp(self):
+        """Test COMMIT entries fall back to the same placeholder timestamp."""
+        history = {"query": "COMMIT", "path": "test.db", "params": None, "result": None}
+        assert default_history_format_function(history) == "[no timestamp](test.db) : COMMIT\n"
+
+    def test_format_exact_layout(self):
+        """Test the full multi-line layout of a regular entry."""
+        history = {"query": "SELECT 1", "path": "t.db", "timestamp": "T", "params": (), "result": [(1,)]}
+        assert default_history_format_function(history) == "[T](t.db)\nSELECT 1\nInput: ()\nOutput: [(1,)]\n"
+
 
 class TestHistoryManager:
     """Tests for HistoryManager class."""
@@ -200,7 +210,84 @@ class TestHistoryManager:
         with patch.object(hm, 'flush_to_file', new_callable=AsyncMock):
             await hm.append(item)
         
-        gen.create.assert_called_once_with(item)
+        gen.create.assert_called_once_with(item, at=None)
+
+    def test_history_enabled_tracks_buffer_and_generator(self):
+        """Test history_enabled follows the history buffer and dump generator."""
+        from ...async_history_dump import AsyncHistoryDumpGenerator
+        gen = MagicMock(spec=AsyncHistoryDumpGenerator)
+        hm = HistoryManager()
+        assert not hm.history_enabled
+        hm.history_dump_generator = gen
+        assert hm.history_enabled
+        hm.history_length = None
+        assert not hm.history_enabled
+        hm.history_length = 3
+        assert hm.history_enabled
+        assert not HistoryManager(history_length=None, history_dump_generator=gen).history_enabled
+
+    @pytest.mark.asyncio
+    async def test_append_records_into_empty_history(self):
+        """Test append records items even while the history buffer is empty."""
+        from ...async_history_dump import AsyncHistoryDump, AsyncHistoryDumpGenerator
+        gen = MagicMock(spec=AsyncHistoryDumpGenerator)
+        gen.create.return_value = MagicMock(spec=AsyncHistoryDump, data="formatted")
+        hm = HistoryManager(history_dump_generator=gen, history_length=10)
+        await hm.append({"query": "test"})
+        assert len(hm.history) == 1
+
+    @pytest.mark.asyncio
+    async def test_append_flushes_every_history_length_items(self):
+        """Test append flushes once per history_length items, not after every item."""
+        from ...async_history_dump import AsyncHistoryDump, AsyncHistoryDumpGenerator
+        gen = MagicMock(spec=AsyncHistoryDumpGenerator)
+        gen.create.return_value = MagicMock(spec=AsyncHistoryDump, data="formatted")
+        hm = HistoryManager(history_dump_generator=gen, history_length=3)
+
+        with patch.object(AsyncHistoryDump, 'write_many', new_callable=AsyncMock) as mock_write:
+            for i in range(7):
+                await hm.append({"query": f"q{i}"})
+
+        assert [len(call.args[0]) for call in mock_write.await_args_list] == [3, 3]
+        assert len(hm.history) == 1
+
+    @pytest.mark.asyncio
+    async def test_single_writer_appends_without_lock(self):
+        """Test single_writer mode records items without taking the history lock."""
+        from ...async_history_dump import AsyncHistoryDump, AsyncHistoryDumpGenerator
+        gen = MagicMock(spec=AsyncHistoryDumpGenerator)
+        gen.create.return_value = MagicMock(spec=AsyncHistoryDump, data="formatted")
+        hm = HistoryManager(history_dump_generator=gen, history_length=10, single_writer=True)
+        async with hm._history_lock:
+            await hm.append({"query": "a"})
+            await hm.append_many([{"query": "b"}, {"query": "c"}])
+        assert len(hm.history) == 3
+
+    @pytest.mark.asyncio
+    async def test_append_many_formats_and_flushes_when_full(self):
+        """Test append_many formats dict data and flushes each time history fills."""
+        from ...async_history_dump import AsyncHistoryDump, AsyncHistoryDumpGenerator
+
+        gen = MagicMock(spec=AsyncHistoryDumpGenerator)
+        gen.create.side_effect = lambda item, at=None: MagicMock(spec=AsyncHistoryDump, data=dict(item))
+        hm = HistoryManager(history_dump_generator=gen, history_length=2, history_tolerance=0)
+        items = [{"query": f"q{i}", "path": "t.db", "params": (), "result": []} for i in range(5)]
+
+        with patch.object(AsyncHistoryDump, 'write_many', new_callable=AsyncMock) as mock_write:
+            await hm.append_many(items)
+
+        assert gen.create.call_count == 5
+        assert mock_write.await_count == 2
+        flushed = [dump.data for call in mock_write.await_args_list for dump in call.args[0]]
+        assert flushed == [default_history_format_function(item) for item in items[:4]]
+        assert len(hm.history) == 1
+
+    @pytest.mark.asyncio
+    async def test_append_many_without_generator_is_noop(self):
+        """Test append_many does nothing without a dump generator."""
+        hm = HistoryManager()
+        await hm.append_many([{"query": "test"}])
+        assert len(hm.history) == 0
 
     @pytest.mark.asyncio
     async def test_flush_to_file_with_none_history(self):
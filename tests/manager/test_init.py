@@ -0,0 +1,20 @@
+# tests/manager/test_init.py
+import pytest
+from ... import manager as manager_pkg
+from ...manager.manager import Manager
+from ...manager.exceptions import ConnectionError
+
+
+def test_lazy_exports_resolve():
+    """Every name in __all__ resolves to the object in its submodule."""
+    for name in manager_pkg.__all__:
+        assert getattr(manager_pkg, name) is not None
+    assert manager_pkg.Manager is Manager
+    assert manager_pkg.AsyncSQLiteManager is Manager
+    assert manager_pkg.ConnectionError is ConnectionError
+    assert set(manager_pkg.__all__) <= set(dir(manager_pkg))
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        manager_pkg.NotAName
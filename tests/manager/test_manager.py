@@ -47,6 +47,18 @@ class TestManager:
         # Lock should be released after context
         assert not lock.locked()
 
+    @pytest.mark.asyncio
+    async def test_read_queue_bypasses_write_lock(self, tmp_path):
+        """Test read_queue admits read_pool_size readers while a write is queued."""
+        db_path = str(tmp_path / "test.db")
+        manager = Manager(read_pool_size=2)
+        
+        assert Manager.queue is Manager.write_queue
+        async with manager.write_queue(db_path):
+            async with manager.read_queue(db_path), manager.read_queue(db_path):
+                assert manager._get_read_semaphore(db_path).locked()
+        assert not manager._get_read_semaphore(db_path).locked()
+
     @pytest.mark.asyncio
     async def test_safe_transaction(self, tmp_path):
         """Test safe_transaction context manager."""
@@ -94,6 +106,26 @@ class TestManager:
         
         assert len(manager.databases) == 0
 
+    @pytest.mark.asyncio
+    async def test_shutdown_writes_history_being_recorded(self, tmp_path):
+        """Test shutdown waits for a drain in progress, so every queued entry reaches the file."""
+        from ...async_history_dump import AsyncHistoryDumpGenerator
+        path = tmp_path / "history.txt"
+        manager = Manager(
+            history_length=3,
+            history_dump_generator=AsyncHistoryDumpGenerator(str(path), filetype="txt"),
+        )
+        for i in range(20):
+            manager._append_history(("test.db", f"SELECT {i}", (), "fetchall", [], 0.0))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        await manager.shutdown()
+        
+        content = path.read_text()
+        assert all(f"SELECT {i}" in content for i in range(20))
+        assert len(manager._history_manager.history) == 0
+        assert manager._history_flusher is None
+
     def test_transaction_returns_transaction_instance(self):
         """Test Transaction method returns Transaction instance."""
         manager = Manager()
@@ -158,6 +190,24 @@ class TestManager:
             pass
         
         assert callable(my_func)
+        assert my_func.__name__ == "my_func"
+
+    @pytest.mark.asyncio
+    async def test_with_transaction_decorator_passes_manager(self, tmp_path):
+        """Test the decorated function receives the manager and runs in a transaction."""
+        db_path = str(tmp_path / "test.db")
+
+        class MyManager(Manager):
+            @Manager.with_transaction(db_path)
+            async def seed(self, value):
+                await self.execute(db_path, "CREATE TABLE test (id INTEGER)")
+                await self.execute(db_path, "INSERT INTO test VALUES (?)", params=(value,))
+                return self
+
+        manager = MyManager()
+        assert await manager.seed(7) is manager
+        assert await manager.execute(db_path, "SELECT * FROM test") == [(7,)]
+        await manager.disconnect_all()
 
     @pytest.mark.asyncio
     async def test_queue_prevents_concurrent_access(self, tmp_path):
@@ -278,3 +328,24 @@ class TestManager:
             await cursor.close()
         
         await manager.disconnect_all()
+
+    @pytest.mark.asyncio
+    async def test_submit_waits_for_safe_transaction(self, tmp_path):
+        """Test submitted writes do not run or commit inside another caller's transaction."""
+        db_path = str(tmp_path / "test.db")
+        manager = Manager(autocommit=True)
+        try:
+            await manager.execute(db_path, "CREATE TABLE t (a)")
+            future = None
+            with pytest.raises(RuntimeError):
+                async with manager.safe_transaction(db_path) as txn:
+                    await txn.execute("INSERT INTO t VALUES (1)", override_autocommit=True)
+                    future = manager.submit(db_path, "INSERT INTO t VALUES (?)", (2,))
+                    for _ in range(5):
+                        await asyncio.sleep(0)
+                    assert not future.done()
+                    raise RuntimeError("abort")
+            await asyncio.wait_for(future, 5)
+            assert await manager.execute(db_path, "SELECT a FROM t") == [(2,)]
+        finally:
+            await manager.close(db_path)
@@ -2,7 +2,7 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 import asyncio
-from ...manager.manager_base import ManagerBase
+from ...manager.manager_base import ManagerBase, _is_memory_db
 from ...manager.exceptions import ConnectionError
 from ...manager.dbpathdict import DbPathDict
 
@@ -44,6 +44,19 @@ class TestManagerBase:
         assert isinstance(lock2, asyncio.Lock)
         assert lock1 is not lock2
 
+    @pytest.mark.asyncio
+    async def test_connect_creates_lock(self, tmp_path):
+        """Test connect registers the per-DB lock up front."""
+        db_path = str(tmp_path / "test.db")
+        manager = ManagerBase()
+        await manager.connect(db_path)
+        try:
+            assert db_path in manager._locks
+            assert manager._get_lock(db_path) is manager._locks[db_path]
+        finally:
+            await manager.close(db_path)
+        assert db_path not in manager._locks
+
     def test_get_lock_returns_same_lock(self):
         """Test _get_lock returns same lock for same path."""
         manager = ManagerBase()
@@ -105,6 +118,28 @@ class TestManagerBase:
         manager = ManagerBase(autocommit=True)
         assert manager._should_commit(False, override_autocommit=True) is False
 
+    def test_is_read_query_classifies_by_prefix(self):
+        """Test _is_read_query accepts SELECT/EXPLAIN in any case and rejects the rest."""
+        for query in ("SELECT 1", "\n  select 1", "Explain SELECT 1"):
+            assert ManagerBase._is_read_query(query)
+        for query in (
+            "INSERT INTO t VALUES (1)", "PRAGMA journal_mode", "SEL", "",
+            "WITH v(a) AS (SELECT 9) INSERT INTO t SELECT a FROM v",
+        ):
+            assert not ManagerBase._is_read_query(query)
+
+    def test_config_switches_update_packed_flags(self):
+        """Test autocommit/omni_log/log_results setters keep the flag bitmask in sync."""
+        manager = ManagerBase(autocommit=True, omni_log=False, log_results=True)
+        assert (manager.autocommit, manager.omni_log, manager.log_results) == (True, False, True)
+        manager.autocommit = False
+        manager.omni_log = True
+        manager.log_results = False
+        assert (manager.autocommit, manager.omni_log, manager.log_results) == (False, True, False)
+        assert manager._should_commit(False) is False
+        assert manager._should_log(False) is True
+        assert manager._should_log(False, override_omnilog=True) is False
+
     def test_call_logger_calls_method(self):
         """Test _call_logger calls the correct logger method."""
         mock_logger = MagicMock()
@@ -112,6 +147,19 @@ class TestManagerBase:
         manager._call_logger("info", "test message")
         mock_logger.info.assert_called_once_with("test message")
 
+    @pytest.mark.asyncio
+    async def test_execute_logs_with_deferred_formatting(self, tmp_path):
+        """Test execute passes the query and params to the logger unformatted."""
+        db_path = str(tmp_path / "test.db")
+        mock_logger = MagicMock()
+        manager = ManagerBase(logger=mock_logger, history_length=None)
+        try:
+            await manager.execute(db_path, "SELECT ?", params=(1,), log=True)
+        finally:
+            await manager.close(db_path)
+        mock_logger.info.assert_called_once_with("%s | %s", "SELECT ?", (1,))
+        assert manager._history_flusher is None
+
     def test_call_logger_handles_missing_method(self):
         """Test _call_logger handles non-existent method gracefully."""
         mock_logger = MagicMock(spec=[])
@@ -382,6 +430,305 @@ class TestManagerBase:
         
         await manager.close(db_path)
 
+    @pytest.mark.asyncio
+    async def test_connect_with_read_pool(self, tmp_path):
+        """Test read_pool_size opens that many read connections, used in turn."""
+        db_path = str(tmp_path / "test.db")
+        manager = ManagerBase(read_pool_size=3)
+        
+        write_conn = await manager.connect(db_path, create_read_connection=True)
+        pc = manager.get_path_connection(db_path)
+        
+        assert len(pc.read_conns) == 3
+        assert write_conn not in pc.read_conns
+        picked = [await manager.connect(db_path, mode="read") for _ in range(3)]
+        assert set(map(id, picked)) == set(map(id, pc.read_conns))
+        assert await manager.execute(db_path, "SELECT 1", mode="read") == [(1,)]
+        
+        await manager.close(db_path)
+        with pytest.raises(ValueError):
+            ManagerBase(read_pool_size=0)
+
+    @pytest.mark.asyncio
+    async def test_connections_are_configured(self, tmp_path):
+        """Test new connections get WAL and the PRAGMAs; read connections are query_only."""
+        db_path = str(tmp_path / "test.db")
+        manager = ManagerBase()
+        
+        await manager.connect(db_path, create_read_connection=True)
+        assert await manager.execute(db_path, "PRAGMA journal_mode") == [("wal",)]
+        assert await manager.execute(db_path, "PRAGMA foreign_keys") == [(1,)]
+        assert await manager.execute(db_path, "PRAGMA query_only") == [(0,)]
+        assert await manager.execute(db_path, "PRAGMA query_only", mode="read") == [(1,)]
+        with pytest.raises(Exception):
+            await manager.execute(db_path, "CREATE TABLE t (a)", mode="read")
+        
+        await manager.close(db_path)
+
+    @pytest.mark.asyncio
+    async def test_init_pragmas_override(self, tmp_path):
+        """Test init_pragmas replaces the default PRAGMA script."""
+        db_path = str(tmp_path / "test.db")
+        manager = ManagerBase(init_pragmas="PRAGMA foreign_keys=OFF")
+        
+        await manager.connect(db_path, create_read_connection=True)
+        assert await manager.execute(db_path, "PRAGMA journal_mode") == [("delete",)]
+        assert await manager.execute(db_path, "PRAGMA foreign_keys") == [(0,)]
+        assert await manager.execute(db_path, "PRAGMA query_only", mode="read") == [(1,)]
+        
+        await manager.close(db_path)
+
+    @pytest.mark.asyncio
+    async def test_execute_auto_mode_routes_by_statement(self, tmp_path):
+        """Test mode="auto" sends SELECT/EXPLAIN to a read connection and the rest to the writer."""
+        db_path = str(tmp_path / "test.db")
+        manager = ManagerBase(autocommit=True)
+        
+        await manager.execute(db_path, "CREATE TABLE t (a)", mode="auto")
+        await manager.execute(db_path, "INSERT INTO t VALUES (1)", mode="auto")
+        assert manager.get_path_connection(db_path).read_conn is None
+        query = "SELECT query_only FROM pragma_query_only()"
+        assert await manager.execute(db_path, "  " + query.lower(), mode="auto") == [(1,)]
+        assert await manager.execute(db_path, "WITH x AS (" + query + ") SELECT * FROM x", mode="auto") == [(0,)]
+        await manager.execute(db_path, "WITH v(a) AS (SELECT 9) INSERT INTO t SELECT a FROM v", mode="auto")
+        assert await manager.execute(db_path, "SELECT a FROM t WHERE a = 9") == [(9,)]
+        assert await manager.execute(db_path, "EXPLAIN " + query, mode="auto")
+        assert await manager.execute(db_path, query) == [(0,)]
+        assert await manager.execute(db_path, "SELECT a FROM t ORDER BY a", mode="auto") == [(1,), (9,)]
+        
+        await manager.close(db_path)
+
+    @pytest.mark.asyncio
+    async def test_execute_many_and_script(self, tmp_path):
+        """Test execute_many/execute_script run a batch with one commit and history entry."""
+        db_path = str(tmp_path / "test.db")
+        manager = ManagerBase()
+        
+        await manager.execute_script(db_path, "CREATE TABLE t (a); CREATE TABLE u (b);")
+        with patch.object(manager, "_append_history") as mock_append, \
+                patch.object(ManagerBase, "_history_enabled", new=True):
+            rowcount = await manager.execute_many(
+                db_path, "INSERT INTO t VALUES (?)", ((i,) for i in range(5)), commit=True
+            )
+        assert rowcount == 5
+        items = [call.args[0] for call in mock_append.call_args_list]
+        assert items[0][:2] == (db_path, "COMMIT")
+        assert items[1][:5] == (db_path, "INSERT INTO t VALUES (?)", "<bulk 5>", "executemany", 5)
+        assert items[0][2] <= items[1][5]  # queued with the time they happened
+        assert await manager.execute(db_path, "SELECT COUNT(*) FROM t") == [(5,)]
+        
+        await manager.close(db_path)
+
+    @pytest.mark.asyncio
+    async def test_execute_auto_mode_keeps_in_memory_databases_on_the_writer(self):
+        """Test mode="auto" reads of an in-memory database see the tables created on the writer."""
+        manager = ManagerBase()
+        try:
+            await manager.execute(":memory:", "CREATE TABLE t (a)")
+            await manager.execute(":memory:", "INSERT INTO t VALUES (1)")
+            assert await manager.execute(":memory:", "SELECT a FROM t", mode="auto") == [(1,)]
+            assert manager.get_path_connection(":memory:").read_conn is None
+        finally:
+            await manager.close(":memory:")
+        for path in (":memory:", "file::memory:?cache=shared", "file:db?mode=memory&cache=shared"):
+            assert _is_memory_db(path)
+        assert not _is_memory_db("memory.db")
+
+    @pytest.mark.asyncio
+    async def test_execute_reuses_one_cursor_per_connection(self, tmp_path):
+        """Test execute reuses a cursor per connection without mixing concurrent results."""
+        db_path = str(tmp_path / "test.db")
+        manager = ManagerBase()
+        
+        conn = await manager.connect(db_path)
+        await manager.execute(db_path, "SELECT 1")
+        cursor = manager._cursors[conn][0]
+        results = await asyncio.gather(
+            *(manager.execute(db_path, f"SELECT {i} UNION ALL SELECT {i}") for i in range(20))
+        )
+        assert results == [[(i,), (i,)] for i in range(20)]
+        assert manager._cursors[conn][0] is cursor
+        
+        await manager.close(db_path)
+        assert conn not in manager._cursors
+
+    @pytest.mark.asyncio
+    async def test_partial_fetch_leaves_no_open_statement(self, tmp_path):
+        """Test fetchone/fetchmany results do not keep their statement open on a reused cursor."""
+        from ...manager.transaction import Transaction
+        db_path = str(tmp_path / "test.db")
+        manager = ManagerBase()
+        try:
+            await manager.execute(db_path, "CREATE TABLE t (x)")
+            await manager.execute_many(db_path, "INSERT INTO t VALUES (?)", [(1,), (2,), (3,)], commit=True)
+            assert await manager.execute(db_path, "SELECT x FROM t ORDER BY x", return_type="fetchone") == [(1,)]
+            assert await manager.execute(db_path, "SELECT x FROM t ORDER BY x", return_type=2) == [(1,), (2,)]
+            async with Transaction(db_path, manager=manager) as txn:
+                await txn.execute("DROP TABLE t")
+            assert await manager.execute(db_path, "SELECT name FROM sqlite_master") == []
+        finally:
+            await manager.close(db_path)
+
+    @pytest.mark.asyncio
+    async def test_history_is_recorded_by_background_flusher(self, tmp_path):
+        """Test execute only queues history; the flusher and flush_history_to_file record it."""
+        from ...async_history_dump import AsyncHistoryDumpGenerator
+        db_path = str(tmp_path / "test.db")
+        out = tmp_path / "history.txt"
+        manager = ManagerBase(
+            history_length=100,
+            history_dump_generator=AsyncHistoryDumpGenerator(str(out), filetype="txt"),
+        )
+        
+        try:
+            manager._append_history({"path": db_path, "query": "SELECT 0", "params": None, "result": None})
+            assert len(manager._pending_history) == 1
+            await manager.execute(db_path, "SELECT 1")
+            for _ in range(3):
+                await asyncio.sleep(0)
+            assert not manager._pending_history
+            assert len(manager._history_manager.history) == 2
+            
+            await manager.execute(db_path, "SELECT 2")
+            manager._append_history((db_path, "ROLLBACK", 0.0))
+            await manager.flush_history_to_file()
+            assert [q in out.read_text() for q in ("SELECT 0", "SELECT 1", "SELECT 2", "ROLLBACK")] == [True] * 4
+        finally:
+            await manager._stop_history_flusher()
+            await manager.close(db_path)
+
+    @pytest.mark.asyncio
+    async def test_submit_coalesces_queued_writes(self, tmp_path):
+        """Test submit runs queued writes in order, coalesced and committed per batch."""
+        db_path = str(tmp_path / "test.db")
+        manager = ManagerBase(autocommit=True)
+        try:
+            await manager.execute(db_path, "CREATE TABLE t (a INTEGER PRIMARY KEY)")
+            with patch.object(manager, "_commit_and_record", wraps=manager._commit_and_record) as commit:
+                await asyncio.gather(
+                    *(manager.submit(db_path, "INSERT INTO t VALUES (?)", (i,)) for i in range(100))
+                )
+            assert commit.await_count < 100
+            assert await manager.execute(db_path, "SELECT COUNT(*) FROM t") == [(100,)]
+
+            results = await asyncio.gather(
+                manager.submit(db_path, "UPDATE t SET a = a + 1000 WHERE a = ?", (1,)),
+                manager.submit(db_path, "INSERT INTO t VALUES (?)", (2,)),  # duplicate key
+                manager.submit(db_path, "DELETE FROM t WHERE a = ?", (3,)),
+                return_exceptions=True,
+            )
+            assert results[0] == [] and results[2] == []
+            assert isinstance(results[1], Exception)
+            assert await manager.execute(db_path, "SELECT COUNT(*) FROM t WHERE a IN (1, 1001, 3)") == [(1,)]
+        finally:
+            await manager.close(db_path)
+        assert db_path not in manager._writers
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_future_without_awaiting(self, tmp_path):
+        """Test submit queues immediately; every future resolves to its statement's rows."""
+        db_path = str(tmp_path / "test.db")
+        manager = ManagerBase(autocommit=True)
+        try:
+            futures = [manager.submit(db_path, "CREATE TABLE t (a)")]
+            futures += [manager.submit(db_path, "INSERT INTO t VALUES (?)", (i,)) for i in range(10)]
+            assert all(isinstance(f, asyncio.Future) and not f.done() for f in futures)
+            assert db_path not in manager.db_dict
+            with patch.object(manager, "_commit_and_record", wraps=manager._commit_and_record) as commit:
+                assert await asyncio.gather(*futures) == [[]] * 11
+            assert commit.await_count == 1
+            assert await manager.execute(db_path, "SELECT COUNT(*) FROM t") == [(10,)]
+
+            returning = "INSERT INTO t VALUES (?) RETURNING a * 2"
+            assert await manager.submit(db_path, returning, (21,)) == [(42,)]
+            futures = [manager.submit(db_path, returning, (i,)) for i in range(3)]
+            assert await asyncio.gather(*futures) == [[(0,)], [(2,)], [(4,)]]
+        finally:
+            await manager.close(db_path)
+
+    @pytest.mark.asyncio
+    async def test_submit_fails_pending_writes_when_writer_crashes(self, tmp_path):
+        """Test an unexpected writer error fails the batch and queued writes; later submits get a new writer."""
+        db_path = str(tmp_path / "test.db")
+        manager = ManagerBase(autocommit=True)
+        try:
+            await manager.execute(db_path, "CREATE TABLE t (a)")
+            with patch.object(manager, "_shared_cursor", side_effect=RuntimeError("boom")):
+                futures = [manager.submit(db_path, "INSERT INTO t VALUES (?)", (i,)) for i in range(3)]
+                await asyncio.sleep(0)
+                futures.append(manager.submit(db_path, "INSERT INTO t VALUES (?)", (3,)))
+                results = await asyncio.wait_for(asyncio.gather(*futures, return_exceptions=True), 5)
+            assert all(isinstance(r, RuntimeError) for r in results)
+            assert manager._writers[db_path][1].done()
+            
+            await manager.submit(db_path, "INSERT INTO t VALUES (?)", (4,))
+            assert await manager.execute(db_path, "SELECT a FROM t") == [(4,)]
+        finally:
+            await manager.close(db_path)
+
+    @pytest.mark.asyncio
+    async def test_history_timestamps_are_taken_when_queued(self, tmp_path):
+        """Test history entries are timestamped when the query ran, not when they are drained."""
+        from ...async_history_dump import AsyncHistoryDumpGenerator
+        db_path = str(tmp_path / "test.db")
+        manager = ManagerBase(
+            history_length=100,
+            history_dump_generator=AsyncHistoryDumpGenerator(
+                str(tmp_path / "history.txt"), filetype="txt", log_time=True,
+                time_format_function=lambda when: when.timestamp(),
+            ),
+        )
+        try:
+            with patch("time.time", return_value=1000.0):
+                await manager.execute(db_path, "SELECT 1", commit=True)
+            await manager._drain_history()
+            entries = [dump.data for dump in manager._history_manager.history]
+            assert len(entries) == 2 and all(entry.startswith("[1000.0]") for entry in entries)
+        finally:
+            await manager._stop_history_flusher()
+            await manager.close(db_path)
+
+    @pytest.mark.asyncio
+    async def test_execution_log_is_built_when_drained(self, tmp_path):
+        """Test execute queues raw log fields; the dict is built on drain from a copied result."""
+        db_path = str(tmp_path / "test.db")
+        manager = ManagerBase()
+        try:
+            with patch.object(ManagerBase, "_history_enabled", new=True), \
+                    patch.object(manager._history_manager, "append_many", new_callable=AsyncMock) as append_many, \
+                    patch.object(manager, "_history_flusher", new=MagicMock(done=lambda: False, get_loop=asyncio.get_running_loop)), \
+                    patch.object(manager, "_history_event", new=MagicMock()):
+                result = await manager.execute(db_path, "SELECT 1")
+                queued = manager._pending_history[0]
+                assert queued[:5] == (db_path, "SELECT 1", (), "fetchall", [(1,)])
+                result.append("changed")
+                await manager._drain_history()
+            item = append_many.await_args.args[0][0]
+            assert item["query"] == "SELECT 1" and item["result"] == "[(1,)]"
+            assert append_many.await_args.kwargs["times"] == [queued[5]]
+        finally:
+            await manager.close(db_path)
+
+    @pytest.mark.asyncio
+    async def test_aclose_stops_history_flusher(self, tmp_path):
+        """Test aclose closes databases, records queued history and stops the flusher."""
+        db_path = str(tmp_path / "test.db")
+        manager = ManagerBase()
+        try:
+            with patch.object(ManagerBase, "_history_enabled", new=True), \
+                    patch.object(manager._history_manager, "append_many", new_callable=AsyncMock) as append_many, \
+                    patch.object(manager._history_manager, "flush_to_file", new_callable=AsyncMock) as flush_to_file:
+                await manager.execute(db_path, "SELECT 1")
+                flusher = manager._history_flusher
+                await manager.aclose()
+            assert flusher.done() and manager._history_flusher is None
+            assert not manager._pending_history
+            assert append_many.await_args.args[0][0]["query"] == "SELECT 1"
+            flush_to_file.assert_awaited_once()
+            assert len(manager.databases) == 0
+        finally:
+            await manager.close(db_path)
+
     @pytest.mark.asyncio
     async def test_get_connection_with_mode(self, tmp_path):
         """Test get_connection with mode parameter."""
@@ -530,6 +877,14 @@ class TestManagerBase:
             with pytest.raises(ValueError, match="Invalid savepoint name"):
                 manager._validate_savepoint_name(name)
 
+    def test_savepoint_sql_is_cached_and_validated(self):
+        """Test savepoint statements are built once per name, after validation."""
+        from ...manager.manager_base import _savepoint_sql
+        assert _savepoint_sql("sp1") == ("SAVEPOINT sp1", "ROLLBACK TO sp1", "RELEASE SAVEPOINT sp1")
+        assert _savepoint_sql("sp1") is _savepoint_sql("sp1")
+        with pytest.raises(ValueError, match="Invalid savepoint name"):
+            _savepoint_sql("sp1; DROP TABLE t")
+
     @pytest.mark.asyncio
     async def test_savepoint_validates_name(self, tmp_path):
         """Test savepoint method validates name before executing."""
@@ -51,7 +51,7 @@ class TestTransaction:
 
         mock_manager.connect.assert_awaited_once_with("test.db")
         mock_conn.cursor.assert_awaited_once()
-        mock_cursor.execute.assert_awaited_once_with("BEGIN")
+        mock_cursor.execute.assert_awaited_once_with("BEGIN IMMEDIATE")
         assert result is txn
         assert txn._cursor is mock_cursor
 
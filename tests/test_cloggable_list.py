@@ -0,0 +1,56 @@
+# tests/test_cloggable_list.py
+import pytest
+from ..cloggable_list import CloggableList
+from ..list_utils import Interval
+
+
+def test_extract_indices_and_intervals():
+    cl = CloggableList(max_length=10, tolerance=None)
+    cl.extend("abcdefg")
+
+    out = cl.extract(5, Interval(1, 2), 1)
+
+    assert out == ("b", "c", "f")
+    assert cl == ["a", "d", "e", "g"]
+
+
+def test_extract_out_of_range_leaves_list_untouched():
+    cl = CloggableList(max_length=10, tolerance=None)
+    cl.extend([1, 2, 3])
+
+    with pytest.raises(IndexError):
+        cl.extract(0, 3)
+
+    assert cl == [1, 2, 3]
+    assert cl.extract() == ()
+
+
+def test_full_every_max_length_items_after_flush():
+    cl = CloggableList(max_length=3, tolerance=0)
+
+    full_at = []
+    for i in range(7):
+        if cl.append(i):
+            full_at.append(i)
+            cl.flush()
+    assert full_at == [2, 5]
+    assert cl == [6]
+
+
+def test_append_reports_full_and_overflows_past_tolerance():
+    cl = CloggableList(max_length=2, tolerance=1)
+
+    assert cl.max_length == 2 and cl.tolerance == 1
+    assert cl.append(1) is None
+    assert cl.append(2)  # Full
+    assert cl.extend([3, 4])  # still within tolerance before extending
+    with pytest.raises(OverflowError):
+        cl.append(5)
+
+
+def test_full_is_a_method_with_property_alias():
+    cl = CloggableList(max_length=1, tolerance=0)
+
+    assert cl.full() is False and cl.is_full is False
+    cl.append("x")
+    assert cl.full() is True and cl.is_full is True
@@ -0,0 +1,144 @@
+# tests/test_list_utils.py
+import pytest
+from ..list_utils import Full, Interval, IntervalUnion
+
+
+def test_small_classes_use_slots():
+    for obj in (Full("x"), Interval(0, 1), IntervalUnion(Interval(0, 1))):
+        assert not hasattr(obj, "__dict__")
+    assert str(Full("x")) == "Full(x)"
+
+
+class TestInterval:
+    """Tests for Interval addition and flattening."""
+
+    def test_contains(self):
+        interval = Interval(2, 4)
+        assert [x for x in range(7) if x in interval] == [2, 3, 4]
+        with pytest.raises(TypeError):
+            "3" in interval
+
+    def test_repr_tracks_mutation(self):
+        interval = Interval(1, 2)
+        assert repr(interval) == "Interval(1, 2)"
+        assert repr(interval) == "Interval(1, 2)"
+        interval.end = 10**20
+        assert repr(interval) == f"Interval(1, {10**20})"
+        assert str(interval) == f"[1, {10**20}]"
+
+    def test_add_overlapping(self):
+        a, b = Interval(1, 5), Interval(3, 9)
+        assert a + b == Interval(1, 9)
+        assert b + a == Interval(1, 9)
+        assert a + Interval(2, 3) is a
+        assert Interval(2, 3) + a is a
+
+    def test_add_result_is_not_shared(self):
+        first = Interval(1, 5) + Interval(3, 9)
+        first.end = 100
+        assert Interval(1, 5) + Interval(3, 9) == Interval(1, 9)
+
+    def test_add_invalid_raises(self):
+        with pytest.raises(ValueError):
+            Interval(5, 1) + Interval(1, 2)
+
+    def test_flatten(self):
+        assert Interval.flatten(5, Interval(1, 3), 2, Interval(3, 4)) == [5, 1, 2, 3, 4]
+        out = Interval.flatten(Interval(0, 2))
+        out.append(99)
+        assert Interval.flatten(Interval(0, 2)) == [0, 1, 2]
+        with pytest.raises(TypeError):
+            Interval.flatten("1")
+
+    def test_flatten_large_span_is_not_cached(self):
+        from ..list_utils import _flatten_cached
+        _flatten_cached.cache_clear()
+        out = Interval.flatten(Interval(0, 9999), Interval(5000, 10004), 3)
+        assert out == list(range(10005))
+        assert _flatten_cached.cache_info().currsize == 0
+
+    def test_flatten_overlapping_intervals_keep_first_seen_order(self):
+        out = Interval.flatten(Interval(5, 8), 1, Interval(0, 10), 7, Interval(9, 12))
+        assert out == [5, 6, 7, 8, 1, 0, 2, 3, 4, 9, 10, 11, 12]
+        assert Interval.flatten(Interval(3, 1), 2) == [2]
+
+
+class TestIntervalUnion:
+    """Tests for IntervalUnion."""
+
+    def test_intervals_are_sorted_and_merged(self):
+        union = IntervalUnion(Interval(10, 12), Interval(1, 3), Interval(2, 5), Interval(6, 6), Interval(9, 8))
+        assert union.intervals == (Interval(1, 6), Interval(10, 12))
+        assert str(union) == "[[1, 6], [10, 12]]"
+
+    def test_iter_yields_each_integer_once_in_order(self):
+        union = IntervalUnion(Interval(5, 7), Interval(0, 2), Interval(1, 6))
+        assert list(union) == list(range(0, 8))
+
+    def test_int_membership(self):
+        union = IntervalUnion(Interval(0, 2), Interval(10, 20))
+        assert [x for x in range(-1, 22) if x in union] == [0, 1, 2] + list(range(10, 21))
+        assert 5 not in IntervalUnion()
+
+    def test_add_disjoint_intervals(self):
+        union = Interval(0, 1) + Interval(5, 6)
+        assert isinstance(union, IntervalUnion)
+        assert list(union) == [0, 1, 5, 6]
+        assert Interval(5, 6) in union
+        assert Interval(1, 5) not in union
+
+    def test_union_membership(self):
+        union = IntervalUnion(Interval(0, 10), Interval(20, 30))
+        assert IntervalUnion(Interval(1, 2), Interval(25, 30)) in union
+        assert IntervalUnion(Interval(1, 2), Interval(25, 31)) not in union
+
+    def test_invalid_items(self):
+        union = IntervalUnion(Interval(0, 10))
+        with pytest.raises(ValueError):
+            Interval(5, 1) in union
+        with pytest.raises(TypeError):
+            "a" in union
+
+    def test_large_interval_membership_is_not_enumerated(self):
+        union = IntervalUnion(Interval(0, 10**12), Interval(10**12 + 2, 10**13))
+        assert Interval(5, 10**12) in union
+        assert Interval(5, 10**12 + 1) not in union
+        assert IntervalUnion(Interval(1, 2), Interval(10**12 + 5, 10**13)) in union
+
+    def test_containment_matches_pointwise_check(self):
+        import random
+        rng = random.Random(0)
+        for _ in range(200):
+            union = IntervalUnion(*(Interval(s, s + rng.randint(0, 5))
+                                    for s in rng.sample(range(40), 4)))
+            other = IntervalUnion(*(Interval(s, s + rng.randint(0, 3))
+                                    for s in rng.sample(range(40), 2)))
+            points = set(union)
+            assert (other in union) == set(other).issubset(points)
+            first = other.intervals[0]
+            assert (first in union) == set(first).issubset(points)
+
+    def test_contains_many(self):
+        union = IntervalUnion(Interval(0, 2), Interval(10, 20))
+        items = list(range(-3, 25))
+        assert union.contains_many(items) == [x in union for x in items]
+        assert IntervalUnion().contains_many([1, 2]) == [False, False]
+
+    def test_iter_is_lazy(self):
+        it = iter(IntervalUnion(Interval(10**12, 10**13), Interval(0, 10**12 - 2)))
+        assert [next(it) for _ in range(3)] == [0, 1, 2]
+
+    def test_unions_do_not_share_intervals(self):
+        a = IntervalUnion(Interval(0, 2), Interval(5, 6))
+        b = IntervalUnion(Interval(0, 2), Interval(5, 6))
+        assert a.intervals == b.intervals
+        assert a.intervals[0] is not b.intervals[0]
+
+    def test_equality_and_hash_follow_coverage(self):
+        a = IntervalUnion(Interval(0, 2), Interval(3, 5), Interval(9, 9))
+        b = IntervalUnion(Interval(9, 9), Interval(0, 5))
+        assert a == b
+        assert hash(a) == hash(b)
+        assert len({a, b, IntervalUnion(Interval(0, 5))}) == 2
+        assert a != Interval(0, 5)
+        assert repr(a) == repr(b) == "IntervalUnion((Interval(0, 5), Interval(9, 9)))"
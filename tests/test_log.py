@@ -0,0 +1,41 @@
+# tests/test_log.py
+from ..log import ExecutionLog, Unknown
+
+
+def test_execution_log_equality():
+    log = ExecutionLog("a.db", "SELECT ?", (1,), "fetchall", [(1,)])
+    assert log == ExecutionLog("a.db", "SELECT ?", (1,), "fetchall", [(1,)])
+    assert log != ExecutionLog("a.db", "SELECT ?", (2,), "fetchall", [(1,)])
+    assert log != ExecutionLog("b.db", "SELECT ?", (1,), "fetchall", [(1,)])
+    assert log != ("a.db", "SELECT ?", (1,), "fetchall", [(1,)])
+    assert ExecutionLog("a.db", "q", (), "fetchone") == ExecutionLog("a.db", "q", (), "fetchone")
+    assert ExecutionLog("a.db", "q", (), "fetchone").result == Unknown("Result")
+
+
+def test_execution_log_is_hashable():
+    a = ExecutionLog("a.db", "INSERT ?", [(1,), (2,)], "fetchall", [])
+    b = ExecutionLog("a.db", "INSERT ?", [(1,), (2,)], "fetchall", [])
+    c = ExecutionLog("a.db", "SELECT :x", {"x": [1]}, "fetchone")
+    assert hash(a) == hash(b)
+    assert len({a, b, c}) == 2
+    memo = {a: "done"}
+    assert memo[b] == "done"
+    assert hash(c) == hash(ExecutionLog("a.db", "SELECT :x", {"x": [1]}, "fetchone"))
+
+
+def test_execution_log_repr_reflects_result():
+    log = ExecutionLog("a.db", "SELECT 1", (), "fetchall")
+    assert repr(log) == "ExecutionLog('a.db', 'SELECT 1', (), 'fetchall', <Unknown: Result>)"
+    log.result = [(1,)]
+    assert repr(log) == "ExecutionLog('a.db', 'SELECT 1', (), 'fetchall', [(1,)])"
+
+
+def test_unknown_sentinels():
+    from ..log import UNKNOWN_RESULT, is_unknown, none_or_unknown
+    assert ExecutionLog("a.db", "q", (), "fetchall").result is UNKNOWN_RESULT
+    assert Unknown.of("Result") is UNKNOWN_RESULT
+    assert Unknown.of("X") is Unknown.of("X")
+    assert Unknown("X") == Unknown.of("X")
+    assert is_unknown(UNKNOWN_RESULT) and is_unknown(Unknown("Y"))
+    assert none_or_unknown(None) and none_or_unknown(Unknown("Z"))
+    assert not is_unknown("Result") and not none_or_unknown(0)